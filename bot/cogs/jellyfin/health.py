@@ -44,6 +44,9 @@ See Also:
 """
 
 import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING, Optional
 
@@ -65,6 +68,122 @@ if TYPE_CHECKING:
 logger = logging.getLogger("monolithbot.jellyfin.health")
 
 
+def _utcnow(
+    _tz: timezone = timezone.utc, _time: Callable[[], float] = time.time
+) -> datetime:
+    """
+    Return the current UTC time as an aware datetime.
+
+    Equivalent to datetime.now(timezone.utc) but built from time.time()
+    plus fromtimestamp(), which takes a cheaper C path than now() with a
+    tzinfo argument. The defaults bind the tzinfo and clock as locals so
+    each call skips the module-global lookups.
+    """
+    return datetime.fromtimestamp(_time(), tz=_tz)
+
+
+# =============================================================================
+# Health State
+# =============================================================================
+
+
+@dataclass(slots=True)
+class _HealthState:
+    """
+    Mutable server-status tracking for the health check loop.
+
+    Packs the per-cog status flags into one slotted object so the hot
+    check/notify path does fixed-offset attribute loads instead of four
+    separate instance __dict__ lookups.
+
+    Attributes:
+        online: Current status (None = unknown, True = online, False = offline).
+        last_online: When the server was last confirmed online.
+        went_offline: When the current outage started (for downtime reporting).
+        last_server_info: Most recent ServerInfo from a successful check.
+    """
+
+    online: Optional[bool] = None
+    last_online: Optional[datetime] = None
+    went_offline: Optional[datetime] = None
+    last_server_info: Optional[ServerInfo] = None
+
+
+# =============================================================================
+# Notification Embed Templates
+# =============================================================================
+
+# Static portions of the status notification embeds, built once at import
+# time. Embed.copy() gives each notification its own field list while
+# reusing the constant title/description/color setup.
+_ONLINE_EMBED_TEMPLATE = discord.Embed(
+    title="🟢 Jellyfin Server Online",
+    description="The Jellyfin server is back online and responding!",
+    color=discord.Color.green(),
+)
+
+_OFFLINE_EMBED_TEMPLATE = discord.Embed(
+    title="🔴 Jellyfin Server Offline",
+    description="The Jellyfin server is not responding!",
+    color=discord.Color.red(),
+)
+
+
+# =============================================================================
+# Duration Formatting
+# =============================================================================
+
+# Precomputed unit table for _format_duration, ordered smallest unit first.
+# Each row is (upper_bound, unit_seconds, sub_unit_seconds, unit_word, abbr, sub_abbr).
+# The first row whose upper bound exceeds the duration selects the format,
+# replacing the old chain of threshold branches with a single table scan.
+_DURATION_UNITS = (
+    (60, 1, None, "second", None, None),
+    (3600, 60, None, "minute", None, None),
+    (86400, 3600, 60, "hour", "h", "m"),
+    (float("inf"), 86400, 3600, "day", "d", "h"),
+)
+
+
+def _format_duration(seconds: float) -> str:
+    """
+    Format a duration in seconds to a human-readable string.
+
+    Driven by the _DURATION_UNITS table, so adding or adjusting units
+    means editing the table rather than the branch logic.
+
+    Args:
+        seconds: Duration in seconds.
+
+    Returns:
+        Human-readable duration string.
+
+    Examples:
+        >>> _format_duration(45)
+        '45 seconds'
+        >>> _format_duration(90)
+        '1 minute'
+        >>> _format_duration(3665)
+        '1h 1m'
+        >>> _format_duration(90000)
+        '1d 1h'
+    """
+    total = int(seconds)
+
+    for upper_bound, unit, sub_unit, word, abbr, sub_abbr in _DURATION_UNITS:
+        if total >= upper_bound:
+            continue
+        count = total // unit
+        if sub_unit:
+            remainder = (total % unit) // sub_unit
+            if remainder:
+                return f"{count}{abbr} {remainder}{sub_abbr}"
+        return f"{count} {word}{'s' if count != 1 else ''}"
+
+    # Unreachable: the last table row has an infinite upper bound
+    return str(total)
+
+
 class JellyfinHealthCog(commands.Cog, name="JellyfinHealth"):
     """
     Discord cog for monitoring Jellyfin server health.
@@ -105,16 +224,21 @@ class JellyfinHealthCog(commands.Cog, name="JellyfinHealth"):
         self.bot = bot
         self.scheduler = create_scheduler(bot.config)
 
-        # State tracking for server status
-        # None = unknown (initial state before first check)
-        # True = server is online
-        # False = server is offline
-        self._server_online: Optional[bool] = None
-
-        # Timestamp tracking for status reporting
-        self._last_online: Optional[datetime] = None
-        self._went_offline: Optional[datetime] = None
-        self._last_server_info: Optional[ServerInfo] = None
+        # Server status tracking (None online state = unknown, before first check)
+        self._state = _HealthState()
+
+        # State-transition dispatch table, keyed by (previous online state,
+        # check result). Built once with bound methods so each health check
+        # resolves its handler with a single dict lookup. Notifications fire
+        # only on the offline->online and online/unknown->offline edges.
+        self._transitions: dict[tuple[Optional[bool], str], Callable] = {
+            (True, "online"): self._on_still_online,
+            (None, "online"): self._on_still_online,
+            (False, "online"): self._on_recovery,
+            (True, "offline"): self._on_new_outage,
+            (None, "offline"): self._on_new_outage,
+            (False, "offline"): self._on_still_offline,
+        }
 
     # -------------------------------------------------------------------------
     # Cog Lifecycle
@@ -175,18 +299,20 @@ class JellyfinHealthCog(commands.Cog, name="JellyfinHealth"):
         notifications every time the bot restarts.
         """
         try:
-            self._last_server_info = await self.bot.jellyfin_service.check_health()
-            self._server_online = True
-            self._last_online = datetime.now(timezone.utc)
+            self._state.last_server_info = (
+                await self.bot.jellyfin_service.check_health()
+            )
+            self._state.online = True
+            self._state.last_online = _utcnow()
             logger.info(
                 f"Initial health check passed - "
-                f"Server: {self._last_server_info.server_name} "
-                f"v{self._last_server_info.version} "
+                f"Server: {self._state.last_server_info.server_name} "
+                f"v{self._state.last_server_info.version} "
                 f"(via {self.bot.jellyfin_service.active_url})"
             )
         except JellyfinError as e:
-            self._server_online = False
-            self._went_offline = datetime.now(timezone.utc)
+            self._state.online = False
+            self._state.went_offline = _utcnow()
             logger.warning(f"Initial health check failed: {e}")
 
     async def _run_health_check(self) -> None:
@@ -212,7 +338,7 @@ class JellyfinHealthCog(commands.Cog, name="JellyfinHealth"):
 
         try:
             server_info = await self.bot.jellyfin_service.check_health()
-            self._last_server_info = server_info
+            self._state.last_server_info = server_info
             await self._handle_server_online(server_info)
 
         except JellyfinConnectionError as e:
@@ -229,55 +355,71 @@ class JellyfinHealthCog(commands.Cog, name="JellyfinHealth"):
         """
         Handle a successful health check (server is online).
 
-        Updates internal state and sends a notification if the server
-        was previously offline (recovery notification).
+        Dispatches through the precomputed transition table keyed on the
+        previous online state, so the hot path is a single dict lookup
+        instead of a branch chain.
 
         Args:
             server_info: Server information from the health check.
         """
-        was_offline = self._server_online is False
-
-        # Update state
-        self._server_online = True
-        self._last_online = datetime.now(timezone.utc)
-
-        # Only notify if this is a recovery (was offline, now online)
-        if was_offline:
-            # Calculate downtime if we know when it went offline
-            downtime: Optional[timedelta] = None
-            if self._went_offline:
-                downtime = datetime.now(timezone.utc) - self._went_offline
-                self._went_offline = None
-
-            logger.info(
-                f"Server came back online - {server_info.server_name} "
-                f"v{server_info.version}"
-            )
-            await self._send_online_notification(server_info, downtime)
+        await self._transitions[self._state.online, "online"](server_info)
 
     async def _handle_server_offline(self, error_message: str) -> None:
         """
         Handle a failed health check (server is offline).
 
-        Updates internal state and sends a notification if this is
-        a new outage (was online or unknown, now offline).
+        Dispatches through the precomputed transition table keyed on the
+        previous online state, so the hot path is a single dict lookup
+        instead of a branch chain.
 
         Args:
             error_message: Description of why the health check failed.
         """
-        # Check if this is a new outage
-        # Notify if: was online (True) or was unknown (None, first check failed)
-        was_online = self._server_online is True or self._server_online is None
-
-        if was_online:
-            # Record when the outage started
-            self._went_offline = datetime.now(timezone.utc)
-            self._server_online = False
-            logger.warning(f"Server went offline: {error_message}")
-            await self._send_offline_notification(error_message)
-        else:
-            # Server was already offline, no need to notify again
-            logger.debug("Server still offline")
+        await self._transitions[self._state.online, "offline"](error_message)
+
+    async def _on_still_online(
+        self, server_info: ServerInfo, *, _now: Callable[[], datetime] = _utcnow
+    ) -> None:
+        """Transition handler: server was online (or unknown) and still is.
+
+        The keyword-only _now default binds the clock as a local, saving
+        the module-global lookup on every scheduler tick.
+        """
+        self._state.online = True
+        self._state.last_online = _now()
+
+    async def _on_recovery(
+        self, server_info: ServerInfo, *, _now: Callable[[], datetime] = _utcnow
+    ) -> None:
+        """Transition handler: server was offline and came back online."""
+        self._state.online = True
+        self._state.last_online = _now()
+
+        # Calculate downtime if we know when it went offline
+        downtime: Optional[timedelta] = None
+        if self._state.went_offline:
+            downtime = _now() - self._state.went_offline
+            self._state.went_offline = None
+
+        logger.info(
+            f"Server came back online - {server_info.server_name} "
+            f"v{server_info.version}"
+        )
+        await self._send_online_notification(server_info, downtime)
+
+    async def _on_new_outage(
+        self, error_message: str, *, _now: Callable[[], datetime] = _utcnow
+    ) -> None:
+        """Transition handler: server was online (or unknown) and went down."""
+        # Record when the outage started
+        self._state.went_offline = _now()
+        self._state.online = False
+        logger.warning(f"Server went offline: {error_message}")
+        await self._send_offline_notification(error_message)
+
+    async def _on_still_offline(self, error_message: str) -> None:
+        """Transition handler: server was already offline, no new notification."""
+        logger.debug("Server still offline")
 
     # -------------------------------------------------------------------------
     # Discord Notifications
@@ -303,12 +445,8 @@ class JellyfinHealthCog(commands.Cog, name="JellyfinHealth"):
             logger.error("Alert channel not found")
             return
 
-        embed = discord.Embed(
-            title="🟢 Jellyfin Server Online",
-            description="The Jellyfin server is back online and responding!",
-            color=discord.Color.green(),
-            timestamp=datetime.now(timezone.utc),
-        )
+        embed = _ONLINE_EMBED_TEMPLATE.copy()
+        embed.timestamp = _utcnow()
 
         embed.add_field(name="Server", value=server_info.server_name, inline=True)
         embed.add_field(name="Version", value=server_info.version, inline=True)
@@ -336,12 +474,8 @@ class JellyfinHealthCog(commands.Cog, name="JellyfinHealth"):
             logger.error("Alert channel not found")
             return
 
-        embed = discord.Embed(
-            title="🔴 Jellyfin Server Offline",
-            description="The Jellyfin server is not responding!",
-            color=discord.Color.red(),
-            timestamp=datetime.now(timezone.utc),
-        )
+        embed = _OFFLINE_EMBED_TEMPLATE.copy()
+        embed.timestamp = _utcnow()
 
         # Show error in a code block (truncate if too long)
         embed.add_field(
@@ -367,10 +501,10 @@ class JellyfinHealthCog(commands.Cog, name="JellyfinHealth"):
             )
 
         # Show relative time since last successful check
-        if self._last_online:
+        if self._state.last_online:
             embed.add_field(
                 name="Last Online",
-                value=f"<t:{int(self._last_online.timestamp())}:R>",
+                value=f"<t:{int(self._state.last_online.timestamp())}:R>",
                 inline=True,
             )
 
@@ -387,50 +521,10 @@ class JellyfinHealthCog(commands.Cog, name="JellyfinHealth"):
         """
         Format a duration in seconds to a human-readable string.
 
-        Automatically selects the most appropriate unit(s) based on
-        the duration length.
-
-        Args:
-            seconds: Duration in seconds.
-
-        Returns:
-            Human-readable duration string.
-
-        Examples:
-            >>> self._format_duration(45)
-            '45 seconds'
-            >>> self._format_duration(90)
-            '1 minute'
-            >>> self._format_duration(3665)
-            '1h 1m'
-            >>> self._format_duration(90000)
-            '1d 1h'
+        Delegates to the module-level table-driven formatter.
+        See _format_duration at module level for details.
         """
-        seconds = int(seconds)
-
-        # Less than a minute: show seconds
-        if seconds < 60:
-            return f"{seconds} second{'s' if seconds != 1 else ''}"
-
-        # Less than an hour: show minutes
-        minutes = seconds // 60
-        if minutes < 60:
-            return f"{minutes} minute{'s' if minutes != 1 else ''}"
-
-        # Less than a day: show hours (and minutes if non-zero)
-        hours = minutes // 60
-        remaining_minutes = minutes % 60
-        if hours < 24:
-            if remaining_minutes:
-                return f"{hours}h {remaining_minutes}m"
-            return f"{hours} hour{'s' if hours != 1 else ''}"
-
-        # Days: show days (and hours if non-zero)
-        days = hours // 24
-        remaining_hours = hours % 24
-        if remaining_hours:
-            return f"{days}d {remaining_hours}h"
-        return f"{days} day{'s' if days != 1 else ''}"
+        return _format_duration(seconds)
 
 
 # =============================================================================
@@ -48,6 +48,7 @@ See Also:
 
 import logging
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import TYPE_CHECKING, Optional
 
 import discord
@@ -332,7 +333,7 @@ class MinecraftHealthCog(commands.Cog, name="MinecraftHealth"):
         )
 
         if downtime:
-            downtime_str = self._format_duration(downtime.total_seconds())
+            downtime_str = self._format_duration(int(downtime.total_seconds()))
             embed.add_field(name="Downtime", value=downtime_str, inline=True)
 
         if status.motd:
@@ -413,12 +414,18 @@ class MinecraftHealthCog(commands.Cog, name="MinecraftHealth"):
     # Utility Methods
     # -------------------------------------------------------------------------
 
-    def _format_duration(self, seconds: float) -> str:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _format_duration(seconds: int) -> str:
         """
         Format a duration in seconds to a human-readable string.
 
+        Pure function of its argument; downtimes round to a small set of
+        whole-second values, so results are memoized. Callers truncate to
+        int before the call to keep the cache keys dense.
+
         Args:
-            seconds: Duration in seconds.
+            seconds: Duration in whole seconds.
 
         Returns:
             Human-readable duration string.
@@ -431,8 +438,6 @@ class MinecraftHealthCog(commands.Cog, name="MinecraftHealth"):
             >>> self._format_duration(3665)
             '1h 1m'
         """
-        seconds = int(seconds)
-
         if seconds < 60:
             return f"{seconds} second{'s' if seconds != 1 else ''}"
 
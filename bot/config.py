@@ -57,11 +57,97 @@ See Also:
     - ARCHITECTURE.md: Configuration system documentation
 """
 
-import json
+import mmap
 import os
+import re
+import sys
 from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Final, Optional
+
+import orjson
+
+
+# =============================================================================
+# Environment Variable Names
+# =============================================================================
+
+# Declared once at module level so builder functions reference a single
+# interned constant instead of rebuilding string literals at each call site.
+
+_ENV_DISCORD_TOKEN: Final = "DISCORD_TOKEN"
+_ENV_DISCORD_ANNOUNCEMENT_CHANNEL_ID: Final = "DISCORD_ANNOUNCEMENT_CHANNEL_ID"
+_ENV_DISCORD_ALERT_CHANNEL_ID: Final = "DISCORD_ALERT_CHANNEL_ID"
+
+_ENV_JELLYFIN_ENABLED: Final = "JELLYFIN_ENABLED"
+_ENV_JELLYFIN_URL: Final = "JELLYFIN_URL"
+_ENV_JELLYFIN_API_KEY: Final = "JELLYFIN_API_KEY"
+_ENV_JELLYFIN_CONTENT_TYPES: Final = "JELLYFIN_CONTENT_TYPES"
+_ENV_JELLYFIN_SCHEDULE_ANNOUNCEMENT_TIMES: Final = (
+    "JELLYFIN_SCHEDULE_ANNOUNCEMENT_TIMES"
+)
+_ENV_JELLYFIN_SCHEDULE_SUGGESTION_TIMES: Final = "JELLYFIN_SCHEDULE_SUGGESTION_TIMES"
+_ENV_JELLYFIN_SCHEDULE_TIMEZONE: Final = "JELLYFIN_SCHEDULE_TIMEZONE"
+_ENV_JELLYFIN_SCHEDULE_HEALTH_CHECK_INTERVAL: Final = (
+    "JELLYFIN_SCHEDULE_HEALTH_CHECK_INTERVAL"
+)
+_ENV_JELLYFIN_SCHEDULE_LOOKBACK_HOURS: Final = "JELLYFIN_SCHEDULE_LOOKBACK_HOURS"
+_ENV_JELLYFIN_SCHEDULE_MAX_ITEMS_PER_TYPE: Final = (
+    "JELLYFIN_SCHEDULE_MAX_ITEMS_PER_TYPE"
+)
+
+_ENV_MINECRAFT_ENABLED: Final = "MINECRAFT_ENABLED"
+_ENV_MINECRAFT_ANNOUNCEMENT_CHANNEL_ID: Final = "MINECRAFT_ANNOUNCEMENT_CHANNEL_ID"
+_ENV_MINECRAFT_ALERT_CHANNEL_ID: Final = "MINECRAFT_ALERT_CHANNEL_ID"
+_ENV_MINECRAFT_SCHEDULE_TIMEZONE: Final = "MINECRAFT_SCHEDULE_TIMEZONE"
+_ENV_MINECRAFT_SCHEDULE_HEALTH_CHECK_INTERVAL: Final = (
+    "MINECRAFT_SCHEDULE_HEALTH_CHECK_INTERVAL"
+)
+_ENV_MINECRAFT_SCHEDULE_PLAYER_CHECK_INTERVAL: Final = (
+    "MINECRAFT_SCHEDULE_PLAYER_CHECK_INTERVAL"
+)
+
+# =============================================================================
+# Error Messages
+# =============================================================================
+
+# Static ConfigurationError messages built once at import time instead of
+# being reassembled on every failed load (e.g. hot config reload loops).
+
+_ERR_DISCORD_TOKEN_REQUIRED: Final = (
+    "Discord token is required. Set DISCORD_TOKEN environment variable "
+    "or 'discord.token' in config.json"
+)
+_ERR_DISCORD_CHANNEL_REQUIRED: Final = (
+    "Discord announcement channel ID is required. Set "
+    "DISCORD_ANNOUNCEMENT_CHANNEL_ID environment variable or "
+    "'discord.announcement_channel_id' in config.json"
+)
+_ERR_JELLYFIN_URL_REQUIRED: Final = (
+    "Jellyfin URL is required. Set JELLYFIN_URL environment variable "
+    "or 'jellyfin.url' (string) or 'jellyfin.urls' (list) in config.json"
+)
+_ERR_JELLYFIN_API_KEY_REQUIRED: Final = (
+    "Jellyfin API key is required. Set JELLYFIN_API_KEY environment "
+    "variable or 'jellyfin.api_key' in config.json"
+)
+_ERR_MINECRAFT_CHANNEL_REQUIRED: Final = (
+    "Minecraft announcement channel ID is required when enabled. "
+    "Set MINECRAFT_ANNOUNCEMENT_CHANNEL_ID environment variable or "
+    "'minecraft.announcement_channel_id' in config.json"
+)
+_ERR_MINECRAFT_SERVERS_REQUIRED: Final = (
+    "At least one Minecraft server must be configured when enabled. "
+    "Add servers to 'minecraft.servers' in config.json"
+)
+_ERR_MINECRAFT_SERVER_NAME_REQUIRED: Final = (
+    "Each Minecraft server must have a 'name' field"
+)
+
+# Compiled once at import time; validates "host" or "host:port" Minecraft
+# server addresses without re-compiling the pattern per config entry.
+_MC_SERVER_URL_RE: Final = re.compile(r"^[A-Za-z0-9.\-]+(?::\d{1,5})?$")
 
 
 # =============================================================================
@@ -69,7 +155,7 @@ from typing import Any, Optional
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class DiscordConfig:
     """
     Discord-related configuration settings.
@@ -93,7 +179,7 @@ class DiscordConfig:
             self.alert_channel_id = self.announcement_channel_id
 
 
-@dataclass
+@dataclass(slots=True)
 class JellyfinScheduleConfig:
     """
     Scheduling configuration for Jellyfin-specific tasks.
@@ -151,17 +237,18 @@ class JellyfinConfig:
         """Normalize all URLs by removing trailing slashes."""
         self.urls = [url.rstrip("/") for url in self.urls]
 
-    @property
+    @cached_property
     def url(self) -> str:
         """Get the primary (first) URL for backward compatibility.
 
         Note: For actual API calls, use JellyfinService which handles
         URL failover. This property is mainly for logging/display.
+        Cached on first access since the URL list is fixed after load.
         """
         return self.urls[0] if self.urls else ""
 
 
-@dataclass
+@dataclass(slots=True)
 class MinecraftScheduleConfig:
     """
     Scheduling configuration for Minecraft-specific tasks.
@@ -181,7 +268,7 @@ class MinecraftScheduleConfig:
     player_check_interval_seconds: int = 30
 
 
-@dataclass
+@dataclass(slots=True)
 class MinecraftServerConfig:
     """
     Configuration for a single Minecraft server instance.
@@ -207,7 +294,7 @@ class MinecraftServerConfig:
             )
 
 
-@dataclass
+@dataclass(slots=True)
 class MinecraftConfig:
     """
     Minecraft server monitoring configuration settings.
@@ -234,7 +321,7 @@ class MinecraftConfig:
             self.alert_channel_id = self.announcement_channel_id
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """
     Main configuration container aggregating all settings.
@@ -370,7 +457,9 @@ def _get_env_list(key: str, default: Optional[list[str]] = None) -> Optional[lis
     value = os.environ.get(key)
     if value is None:
         return default
-    return [item.strip() for item in value.split(",") if item.strip()]
+    # filter(None, ...) drops empty items; map/filter run the strip once per
+    # item at C speed instead of twice as in the comprehension equivalent
+    return list(filter(None, map(str.strip, value.split(","))))
 
 
 # =============================================================================
@@ -397,9 +486,17 @@ def _load_json_config(config_path: Path) -> dict[str, Any]:
         return {}
 
     try:
-        with open(config_path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except json.JSONDecodeError as e:
+        with open(config_path, "rb") as f:
+            try:
+                # Map the file and hand orjson a zero-copy view of the
+                # pages, skipping the intermediate read() buffer
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return orjson.loads(memoryview(mm))
+            except ValueError:
+                # Empty files cannot be mapped; parse the (empty) buffer
+                # normally for the usual invalid-JSON error
+                return orjson.loads(f.read())
+    except orjson.JSONDecodeError as e:
         raise ConfigurationError(f"Invalid JSON in config file: {e}")
 
 
@@ -427,26 +524,19 @@ def _build_discord_config(json_config: dict[str, Any]) -> DiscordConfig:
     discord_json = json_config.get("discord", {})
 
     # Token is required
-    token = _get_env("DISCORD_TOKEN") or discord_json.get("token")
+    token = _get_env(_ENV_DISCORD_TOKEN) or discord_json.get("token")
     if not token:
-        raise ConfigurationError(
-            "Discord token is required. Set DISCORD_TOKEN environment variable "
-            "or 'discord.token' in config.json"
-        )
+        raise ConfigurationError(_ERR_DISCORD_TOKEN_REQUIRED)
 
     # Announcement channel ID is required
     announcement_channel_id = _get_env_int(
-        "DISCORD_ANNOUNCEMENT_CHANNEL_ID"
+        _ENV_DISCORD_ANNOUNCEMENT_CHANNEL_ID
     ) or discord_json.get("announcement_channel_id")
     if not announcement_channel_id:
-        raise ConfigurationError(
-            "Discord announcement channel ID is required. Set "
-            "DISCORD_ANNOUNCEMENT_CHANNEL_ID environment variable or "
-            "'discord.announcement_channel_id' in config.json"
-        )
+        raise ConfigurationError(_ERR_DISCORD_CHANNEL_REQUIRED)
 
     # Alert channel ID is optional (defaults to announcement channel)
-    alert_channel_id = _get_env_int("DISCORD_ALERT_CHANNEL_ID") or discord_json.get(
+    alert_channel_id = _get_env_int(_ENV_DISCORD_ALERT_CHANNEL_ID) or discord_json.get(
         "alert_channel_id"
     )
 
@@ -481,27 +571,27 @@ def _build_jellyfin_schedule_config(
         - JELLYFIN_SCHEDULE_MAX_ITEMS_PER_TYPE: Max items per content type
     """
     announcement_times = _get_env_list(
-        "JELLYFIN_SCHEDULE_ANNOUNCEMENT_TIMES"
+        _ENV_JELLYFIN_SCHEDULE_ANNOUNCEMENT_TIMES
     ) or schedule_json.get("announcement_times", ["17:00"])
 
     suggestion_times = _get_env_list(
-        "JELLYFIN_SCHEDULE_SUGGESTION_TIMES"
+        _ENV_JELLYFIN_SCHEDULE_SUGGESTION_TIMES
     ) or schedule_json.get("suggestion_times", [])
 
-    timezone = _get_env("JELLYFIN_SCHEDULE_TIMEZONE") or schedule_json.get(
+    timezone = _get_env(_ENV_JELLYFIN_SCHEDULE_TIMEZONE) or schedule_json.get(
         "timezone", "America/Los_Angeles"
     )
 
     health_check_interval = _get_env_int(
-        "JELLYFIN_SCHEDULE_HEALTH_CHECK_INTERVAL"
+        _ENV_JELLYFIN_SCHEDULE_HEALTH_CHECK_INTERVAL
     ) or schedule_json.get("health_check_interval_minutes", 5)
 
     lookback_hours = _get_env_int(
-        "JELLYFIN_SCHEDULE_LOOKBACK_HOURS"
+        _ENV_JELLYFIN_SCHEDULE_LOOKBACK_HOURS
     ) or schedule_json.get("lookback_hours", 24)
 
     max_items_per_type = _get_env_int(
-        "JELLYFIN_SCHEDULE_MAX_ITEMS_PER_TYPE"
+        _ENV_JELLYFIN_SCHEDULE_MAX_ITEMS_PER_TYPE
     ) or schedule_json.get("max_items_per_type", 10)
 
     return JellyfinScheduleConfig(
@@ -543,14 +633,14 @@ def _build_jellyfin_config(json_config: dict[str, Any]) -> JellyfinConfig:
     jellyfin_json = json_config.get("jellyfin", {})
 
     # Check if enabled (defaults to True for backward compatibility)
-    enabled_env = _get_env_bool("JELLYFIN_ENABLED")
+    enabled_env = _get_env_bool(_ENV_JELLYFIN_ENABLED)
     enabled = (
         enabled_env if enabled_env is not None else jellyfin_json.get("enabled", True)
     )
 
     # URLs: env var takes precedence, supports comma-separated list
     # JSON supports both "url" (string) and "urls" (list) for backward compatibility
-    urls_from_env = _get_env_list("JELLYFIN_URL")
+    urls_from_env = _get_env_list(_ENV_JELLYFIN_URL)
     if urls_from_env:
         urls = urls_from_env
     else:
@@ -574,21 +664,15 @@ def _build_jellyfin_config(json_config: dict[str, Any]) -> JellyfinConfig:
                 urls = []
 
     if enabled and not urls:
-        raise ConfigurationError(
-            "Jellyfin URL is required. Set JELLYFIN_URL environment variable "
-            "or 'jellyfin.url' (string) or 'jellyfin.urls' (list) in config.json"
-        )
+        raise ConfigurationError(_ERR_JELLYFIN_URL_REQUIRED)
 
     # API key is required if enabled
-    api_key = _get_env("JELLYFIN_API_KEY") or jellyfin_json.get("api_key")
+    api_key = _get_env(_ENV_JELLYFIN_API_KEY) or jellyfin_json.get("api_key")
     if enabled and not api_key:
-        raise ConfigurationError(
-            "Jellyfin API key is required. Set JELLYFIN_API_KEY environment "
-            "variable or 'jellyfin.api_key' in config.json"
-        )
+        raise ConfigurationError(_ERR_JELLYFIN_API_KEY_REQUIRED)
 
     # Content types with env var override
-    content_types = _get_env_list("JELLYFIN_CONTENT_TYPES") or jellyfin_json.get(
+    content_types = _get_env_list(_ENV_JELLYFIN_CONTENT_TYPES) or jellyfin_json.get(
         "content_types", ["Movie", "Series", "Audio"]
     )
 
@@ -625,16 +709,16 @@ def _build_minecraft_schedule_config(
         - MINECRAFT_SCHEDULE_HEALTH_CHECK_INTERVAL: Minutes between health checks
         - MINECRAFT_SCHEDULE_PLAYER_CHECK_INTERVAL: Seconds between player checks
     """
-    timezone = _get_env("MINECRAFT_SCHEDULE_TIMEZONE") or schedule_json.get(
+    timezone = _get_env(_ENV_MINECRAFT_SCHEDULE_TIMEZONE) or schedule_json.get(
         "timezone", "America/Los_Angeles"
     )
 
     health_check_interval = _get_env_int(
-        "MINECRAFT_SCHEDULE_HEALTH_CHECK_INTERVAL"
+        _ENV_MINECRAFT_SCHEDULE_HEALTH_CHECK_INTERVAL
     ) or schedule_json.get("health_check_interval_minutes", 1)
 
     player_check_interval = _get_env_int(
-        "MINECRAFT_SCHEDULE_PLAYER_CHECK_INTERVAL"
+        _ENV_MINECRAFT_SCHEDULE_PLAYER_CHECK_INTERVAL
     ) or schedule_json.get("player_check_interval_seconds", 30)
 
     return MinecraftScheduleConfig(
@@ -661,7 +745,7 @@ def _build_minecraft_server_config(
     """
     name = server_json.get("name")
     if not name:
-        raise ConfigurationError("Each Minecraft server must have a 'name' field")
+        raise ConfigurationError(_ERR_MINECRAFT_SERVER_NAME_REQUIRED)
 
     urls = server_json.get("urls", [])
     if not urls:
@@ -674,7 +758,50 @@ def _build_minecraft_server_config(
                 f"Minecraft server '{name}' must have 'urls' (list) or 'url' (string)"
             )
 
-    return MinecraftServerConfig(name=name, urls=urls)
+    for url in urls:
+        if not _MC_SERVER_URL_RE.match(url):
+            raise ConfigurationError(
+                f"Minecraft server '{name}' has an invalid address: {url!r} "
+                "(expected 'host' or 'host:port')"
+            )
+
+    # Intern the name and URLs: they are compared repeatedly in the
+    # monitoring loops, and interned strings short-circuit equality and
+    # dict lookups on identity
+    return MinecraftServerConfig(
+        name=sys.intern(name),
+        urls=[sys.intern(u) for u in urls],
+    )
+
+
+@dataclass(slots=True)
+class _MinecraftEnvOverrides:
+    """Snapshot of the Minecraft environment variable overrides."""
+
+    enabled: Optional[bool]
+    announcement_channel_id: Optional[int]
+    alert_channel_id: Optional[int]
+
+
+@lru_cache(maxsize=1)
+def _minecraft_env_overrides() -> _MinecraftEnvOverrides:
+    """
+    Read and parse the Minecraft env var overrides in a single pass.
+
+    The process environment is fixed for the lifetime of the bot, so the
+    parsed snapshot is cached - repeated config builds (e.g. reloads) skip
+    the environ lookups and int conversions. Tests that patch os.environ
+    must call _minecraft_env_overrides.cache_clear() between cases (the
+    shared conftest does this automatically).
+
+    Raises:
+        ConfigurationError: If a channel ID env var is set but not an integer.
+    """
+    return _MinecraftEnvOverrides(
+        enabled=_get_env_bool(_ENV_MINECRAFT_ENABLED),
+        announcement_channel_id=_get_env_int(_ENV_MINECRAFT_ANNOUNCEMENT_CHANNEL_ID),
+        alert_channel_id=_get_env_int(_ENV_MINECRAFT_ALERT_CHANNEL_ID),
+    )
 
 
 def _build_minecraft_config(json_config: dict[str, Any]) -> MinecraftConfig:
@@ -704,41 +831,34 @@ def _build_minecraft_config(json_config: dict[str, Any]) -> MinecraftConfig:
     """
     minecraft_json = json_config.get("minecraft", {})
 
+    # Env var overrides, parsed once and cached across config builds
+    env = _minecraft_env_overrides()
+
     # Check if enabled (defaults to False since it's a new feature)
-    enabled_env = _get_env_bool("MINECRAFT_ENABLED")
     enabled = (
-        enabled_env if enabled_env is not None else minecraft_json.get("enabled", False)
+        env.enabled if env.enabled is not None else minecraft_json.get("enabled", False)
     )
 
     # Channel IDs
-    announcement_channel_id = _get_env_int(
-        "MINECRAFT_ANNOUNCEMENT_CHANNEL_ID"
-    ) or minecraft_json.get("announcement_channel_id")
-
-    alert_channel_id = _get_env_int("MINECRAFT_ALERT_CHANNEL_ID") or minecraft_json.get(
-        "alert_channel_id"
+    announcement_channel_id = env.announcement_channel_id or minecraft_json.get(
+        "announcement_channel_id"
     )
 
+    alert_channel_id = env.alert_channel_id or minecraft_json.get("alert_channel_id")
+
     # Validate channels if enabled
     if enabled and not announcement_channel_id:
-        raise ConfigurationError(
-            "Minecraft announcement channel ID is required when enabled. "
-            "Set MINECRAFT_ANNOUNCEMENT_CHANNEL_ID environment variable or "
-            "'minecraft.announcement_channel_id' in config.json"
-        )
+        raise ConfigurationError(_ERR_MINECRAFT_CHANNEL_REQUIRED)
 
-    # Build server configs from JSON (no env var support for server list)
-    servers_json = minecraft_json.get("servers", [])
-    servers: list[MinecraftServerConfig] = []
-
-    for server_json in servers_json:
-        servers.append(_build_minecraft_server_config(server_json))
+    # Build server configs from JSON (no env var support for server list).
+    # Local rebinding keeps the builder lookup out of the comprehension loop.
+    _build_server = _build_minecraft_server_config
+    servers: list[MinecraftServerConfig] = [
+        _build_server(server_json) for server_json in minecraft_json.get("servers", [])
+    ]
 
     if enabled and not servers:
-        raise ConfigurationError(
-            "At least one Minecraft server must be configured when enabled. "
-            "Add servers to 'minecraft.servers' in config.json"
-        )
+        raise ConfigurationError(_ERR_MINECRAFT_SERVERS_REQUIRED)
 
     # Build nested schedule config
     schedule_json = minecraft_json.get("schedule", {})
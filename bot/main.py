@@ -180,6 +180,10 @@ class MonolithBot(commands.Bot):
             logger.info(
                 f"Jellyfin service initialized with {len(self.config.jellyfin.urls)} URL(s)"
             )
+            # Pre-warm the connection pool in the background so the first
+            # command or scheduler tick doesn't pay DNS/TCP setup; the
+            # task handle is kept so it isn't garbage collected mid-flight
+            self._jellyfin_warmup = asyncio.create_task(self.jellyfin_service.warmup())
 
         if self.config.minecraft.enabled:
             self.minecraft_service = MinecraftService(
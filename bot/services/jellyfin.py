@@ -44,23 +44,51 @@ See Also:
     - bot.cogs.jellyfin.health: Uses this service for health monitoring
 """
 
+import asyncio
 import logging
-from dataclasses import dataclass
+import random
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, replace
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Any, Optional
 
 import aiohttp
+import orjson
+from yarl import URL
+
+try:
+    # Optional C ISO-8601 parser - noticeably faster than fromisoformat
+    # on Python 3.10 when parsing hundreds of DateCreated strings per
+    # refresh. Falls back to the stdlib parser when not installed.
+    from ciso8601 import parse_datetime as _parse_iso_datetime
+except ImportError:
+    _parse_iso_datetime = datetime.fromisoformat
 
 # Module logger
 logger = logging.getLogger("monolithbot.jellyfin")
 
 
+# Maps user-friendly content type names to Jellyfin API item types. Built
+# once at module scope so _map_content_type is a single dict lookup; unknown
+# types pass through unchanged.
+_CONTENT_TYPE_MAP: dict[str, str] = {
+    "Movie": "Movie",
+    "Series": "Series",
+    "Audio": "Audio",
+    "Music": "Audio",  # Alias for user convenience
+    "MusicAlbum": "MusicAlbum",  # For random album suggestions
+    "Episode": "Episode",
+}
+
+
 # =============================================================================
 # Data Classes
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class JellyfinItem:
     """
     Represents a media item from the Jellyfin library.
@@ -123,7 +151,7 @@ class JellyfinItem:
         return self.name
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ServerInfo:
     """
     Jellyfin server information from the /System/Info endpoint.
@@ -135,11 +163,14 @@ class ServerInfo:
         version: Jellyfin server version string (e.g., "10.8.13").
         operating_system: Server OS (e.g., "Linux", "Windows"). May be None
             depending on server configuration.
+        stale: True when this info was served from the service's last-good
+            cache because the live probe failed moments ago.
     """
 
     server_name: str
     version: str
     operating_system: Optional[str] = None
+    stale: bool = False
 
 
 # =============================================================================
@@ -154,6 +185,13 @@ class JellyfinError(Exception):
     Catch this to handle any Jellyfin-related failure. For more specific
     handling, catch the subclasses instead.
 
+    Attributes:
+        status: HTTP status code that triggered the error, when the
+            server responded at all (None for transport-level failures).
+        retry_after: Server-requested retry delay in seconds, parsed
+            from a Retry-After header on transient errors (None when
+            the server didn't send one).
+
     Example:
         >>> try:
         ...     await client.check_health()
@@ -161,7 +199,15 @@ class JellyfinError(Exception):
         ...     print(f"Jellyfin error: {e}")
     """
 
-    pass
+    def __init__(
+        self,
+        message: str,
+        status: Optional[int] = None,
+        retry_after: Optional[float] = None,
+    ) -> None:
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
 
 
 class JellyfinConnectionError(JellyfinError):
@@ -203,6 +249,128 @@ class JellyfinAuthError(JellyfinError):
     pass
 
 
+@lru_cache(maxsize=4096)
+def _build_image_url(
+    base_url: str, item_id: str, image_type: str, max_width: int
+) -> str:
+    """
+    Build (and memoize) an item image URL.
+
+    Embed rendering regenerates the same image URLs for every row of a
+    recently-added list; the lru_cache turns repeats into a dict lookup.
+    """
+    return str(
+        URL(base_url)
+        / "Items"
+        / item_id
+        / "Images"
+        / image_type
+        % {"maxWidth": max_width}
+    )
+
+
+@lru_cache(maxsize=64)
+def _build_recent_url(base_url: str, jellyfin_type: str) -> str:
+    """Build (and memoize) a recently-added list URL for a content type."""
+    return (
+        f"{base_url}/web/index.html#!/list.html"
+        f"?type={jellyfin_type}&sortBy=DateCreated&sortOrder=Descending"
+    )
+
+
+# Upstream statuses considered transient: a gateway/proxy hiccup that an
+# immediate retry of an idempotent GET may well clear. Auth and client
+# errors (401/403/404) are never retried.
+_TRANSIENT_STATUSES = frozenset({502, 503, 504})
+
+
+# Optional /Items fields read by _parse_item, in JellyfinItem field order.
+# Extracted with a single map(dict.get, ...) per item; "Id" is required and
+# fetched separately so a malformed item still raises KeyError.
+_OPTIONAL_ITEM_KEYS = (
+    "Name",
+    "Type",
+    "Overview",
+    "ProductionYear",
+    "SeriesName",
+    "Album",
+    "Artists",
+    "DateCreated",
+)
+
+
+# Hard wall on every request so a hung handshake or stalled body read can
+# never block a health check or Discord command indefinitely. Values sit
+# comfortably above a healthy server's worst-case response time.
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10, connect=3)
+
+
+# =============================================================================
+# Circuit Breaker
+# =============================================================================
+
+
+class CircuitBreaker:
+    """
+    Simple failure-counting circuit breaker for the Jellyfin HTTP path.
+
+    Tracks consecutive failures and, once a threshold is reached, opens
+    for a cooldown window during which calls fail immediately instead of
+    waiting out a TCP connect to a dead backend. After the window, one
+    probe request is allowed through (half-open); success closes the
+    breaker, failure reopens it for another window.
+
+    Attributes:
+        threshold: Consecutive failures required to open the breaker.
+        recovery_seconds: How long to fail fast before allowing a probe.
+
+    Example:
+        >>> breaker = CircuitBreaker(threshold=5, recovery_seconds=30.0)
+        >>> breaker.before()  # raises JellyfinConnectionError when open
+        >>> breaker.on_failure()  # record a failed request
+        >>> breaker.on_success()  # reset after a successful request
+    """
+
+    def __init__(self, threshold: int = 5, recovery_seconds: float = 30.0) -> None:
+        """
+        Initialize the circuit breaker.
+
+        Args:
+            threshold: Number of consecutive failures before opening.
+            recovery_seconds: Cooldown before allowing a probe request.
+        """
+        self.threshold = threshold
+        self.recovery_seconds = recovery_seconds
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+
+    def before(self) -> None:
+        """
+        Gate a request about to be made.
+
+        Raises:
+            JellyfinConnectionError: If the breaker is open and the
+                recovery window has not yet elapsed.
+        """
+        if self._opened_at is None:
+            return
+        if time.monotonic() - self._opened_at >= self.recovery_seconds:
+            # Half-open: let this request through as a probe
+            return
+        raise JellyfinConnectionError("Jellyfin circuit breaker is open - failing fast")
+
+    def on_success(self) -> None:
+        """Record a successful request, closing the breaker."""
+        self._failures = 0
+        self._opened_at = None
+
+    def on_failure(self) -> None:
+        """Record a failed request, opening the breaker at the threshold."""
+        self._failures += 1
+        if self._failures >= self.threshold:
+            self._opened_at = time.monotonic()
+
+
 # =============================================================================
 # Jellyfin API Client
 # =============================================================================
@@ -237,7 +405,13 @@ class JellyfinClient:
         ...     await client.close()
     """
 
-    def __init__(self, base_url: str, api_key: str) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        session: Optional[aiohttp.ClientSession] = None,
+        breaker: Optional[CircuitBreaker] = None,
+    ) -> None:
         """
         Initialize the Jellyfin client.
 
@@ -246,10 +420,29 @@ class JellyfinClient:
                 Trailing slashes are automatically stripped.
             api_key: Jellyfin API key for authentication. Generate this in
                 Jellyfin Dashboard → API Keys.
+            session: Optional externally-owned aiohttp session to use for
+                requests. When provided, the client borrows it - close()
+                leaves it open, and the owner (e.g. JellyfinService, which
+                shares one session across its failover clients) is
+                responsible for closing it.
+            breaker: Optional externally-owned circuit breaker. Lets
+                JellyfinService keep one breaker per URL whose failure
+                history survives the short-lived clients created during
+                failover probing.
         """
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
-        self._session: Optional[aiohttp.ClientSession] = None
+        self._session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None
+        self._breaker = breaker if breaker is not None else CircuitBreaker()
+        # Bulkhead limiting in-flight requests to this server; created
+        # lazily because asyncio primitives need a running event loop
+        self._bulkhead: Optional[asyncio.Semaphore] = None
+
+        # Precomputed URL template - the static path fragment is joined to
+        # the base URL once here; the other builders memoize via the
+        # module-level lru_cache helpers
+        self._web_details_url = f"{self.base_url}/web/index.html#!/details?id="
 
     @property
     def session(self) -> aiohttp.ClientSession:
@@ -264,12 +457,32 @@ class JellyfinClient:
         """
         if self._session is None or self._session.closed:
             self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    # Cache DNS lookups so each new connection doesn't pay
+                    # for a threadpool getaddrinfo round trip
+                    use_dns_cache=True,
+                    ttl_dns_cache=300,
+                    limit=100,
+                    limit_per_host=10,
+                    # Hold idle connections for a minute so periodic pollers
+                    # reuse them instead of re-handshaking every tick
+                    keepalive_timeout=60,
+                    # Race IPv6/IPv4 connects (RFC 8305) instead of
+                    # waiting out a broken address family serially
+                    happy_eyeballs_delay=0.25,
+                    enable_cleanup_closed=True,
+                ),
                 headers={
                     # Jellyfin uses X-Emby-Token for API key auth (Emby heritage)
                     "X-Emby-Token": self.api_key,
                     "Accept": "application/json",
-                }
+                    # Large /Items JSON compresses ~5-10x; aiohttp
+                    # decompresses transparently (auto_decompress default)
+                    "Accept-Encoding": "gzip, deflate",
+                },
+                timeout=_REQUEST_TIMEOUT,
             )
+            self._owns_session = True
         return self._session
 
     async def close(self) -> None:
@@ -277,27 +490,37 @@ class JellyfinClient:
         Close the HTTP session and release resources.
 
         This should always be called when done with the client. Safe to call
-        multiple times or if the session was never created.
+        multiple times or if the session was never created. Borrowed
+        sessions (passed into __init__) are left open for their owner.
         """
-        if self._session and not self._session.closed:
+        if self._owns_session and self._session and not self._session.closed:
             await self._session.close()
 
     async def _request(
         self,
         method: str,
         endpoint: str,
+        max_retries: int = 3,
+        retry_base: float = 0.1,
         **kwargs: Any,
     ) -> dict[str, Any]:
         """
-        Make an HTTP request to the Jellyfin API.
+        Make an HTTP request to the Jellyfin API, retrying transient errors.
 
         This is the core request method used by all public API methods.
-        It handles authentication, error responses, and connection failures.
+        Idempotent GETs are retried with exponential backoff and full
+        jitter on connection failures and transient upstream statuses
+        (502/503/504); auth and other client errors surface immediately.
+        The jitter spreads retries out so services restarting together
+        don't hammer a recovering server in lockstep.
 
         Args:
-            method: HTTP method ("GET", "POST", etc.).
+            method: HTTP method ("GET", "POST", etc.). Only GET requests
+                are retried.
             endpoint: API endpoint path (e.g., "/System/Info").
                 Should start with a forward slash.
+            max_retries: Total attempts for idempotent requests.
+            retry_base: Base backoff in seconds, doubled per attempt.
             **kwargs: Additional arguments passed to aiohttp's request method.
                 Common: params (dict), json (dict), timeout (float).
 
@@ -305,6 +528,66 @@ class JellyfinClient:
             Parsed JSON response as a dictionary. Returns empty dict if
             the response is not JSON.
 
+        Raises:
+            JellyfinConnectionError: If unable to connect to the server,
+                or immediately if the circuit breaker is open after
+                repeated failures.
+            JellyfinAuthError: If authentication fails (401/403 response).
+            JellyfinError: For other HTTP errors (4xx/5xx responses).
+        """
+        # Fail fast while the breaker is open instead of waiting out a
+        # TCP connect to a server that is known to be down
+        self._breaker.before()
+
+        attempts = max_retries if method == "GET" else 1
+        last_error: JellyfinError = JellyfinError("No request attempted")
+
+        for attempt in range(attempts):
+            try:
+                return await self._request_once(method, endpoint, **kwargs)
+            except JellyfinAuthError:
+                raise
+            except JellyfinConnectionError as e:
+                last_error = e
+            except JellyfinError as e:
+                if e.status not in _TRANSIENT_STATUSES:
+                    raise
+                last_error = e
+
+            if attempt + 1 < attempts:
+                if last_error.retry_after is not None:
+                    # The server told us when to come back; honor it,
+                    # capped so a hostile header can't stall the caller
+                    delay = min(last_error.retry_after, 5.0)
+                else:
+                    # Full jitter: sleep a random slice of the doubling
+                    # window
+                    delay = random.random() * retry_base * (2**attempt)
+                await asyncio.sleep(delay)
+
+        raise last_error
+
+    async def _request_once(
+        self,
+        method: str,
+        endpoint: str,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """
+        Issue a single HTTP request to the Jellyfin API.
+
+        Called by _request, which layers retry policy on top. Updates the
+        circuit breaker with the outcome of this attempt.
+
+        Args:
+            method: HTTP method ("GET", "POST", etc.).
+            endpoint: API endpoint path (e.g., "/System/Info").
+            **kwargs: Additional arguments passed to aiohttp's request method.
+
+        Returns:
+            Parsed JSON response as a dictionary. Returns empty dict if
+            the response is not JSON.
+
         Raises:
             JellyfinConnectionError: If unable to connect to the server.
             JellyfinAuthError: If authentication fails (401/403 response).
@@ -312,8 +595,16 @@ class JellyfinClient:
         """
         url = f"{self.base_url}{endpoint}"
 
+        if self._bulkhead is None:
+            self._bulkhead = asyncio.Semaphore(8)
+
         try:
-            async with self.session.request(method, url, **kwargs) as response:
+            # The bulkhead queues excess concurrent callers instead of
+            # unleashing unbounded parallel requests at the server
+            async with (
+                self._bulkhead,
+                self.session.request(method, url, **kwargs) as response,
+            ):
                 # Handle authentication errors
                 if response.status == 401:
                     raise JellyfinAuthError("Invalid API key")
@@ -322,22 +613,51 @@ class JellyfinClient:
                         "Access forbidden - check API key permissions"
                     )
 
-                # Handle other HTTP errors
+                # Handle other HTTP errors. Transient statuses carry
+                # the server's Retry-After hint (if any) so the retry
+                # loop can honor it instead of guessing
                 if response.status >= 400:
                     text = await response.text()
-                    raise JellyfinError(f"API error {response.status}: {text}")
+                    retry_after = None
+                    if response.status in _TRANSIENT_STATUSES:
+                        try:
+                            retry_after = float(response.headers.get("Retry-After", ""))
+                        except ValueError:
+                            pass
+                    raise JellyfinError(
+                        f"API error {response.status}: {text}",
+                        status=response.status,
+                        retry_after=retry_after,
+                    )
 
-                # Parse JSON response (if applicable)
+                # Parse JSON response (if applicable) with orjson,
+                # which is several times faster than stdlib json on
+                # the object-heavy /Items payloads
                 if response.content_type == "application/json":
-                    return await response.json()
-                return {}
+                    data = orjson.loads(await response.read())
+                else:
+                    data = {}
 
         except aiohttp.ClientConnectorError as e:
+            self._breaker.on_failure()
             raise JellyfinConnectionError(
                 f"Cannot connect to Jellyfin at {self.base_url}: {e}"
             )
+        except asyncio.TimeoutError:
+            self._breaker.on_failure()
+            raise JellyfinConnectionError(
+                f"Jellyfin timeout at {self.base_url} "
+                f"(no response within {_REQUEST_TIMEOUT.total}s)"
+            )
         except aiohttp.ClientError as e:
+            self._breaker.on_failure()
             raise JellyfinError(f"HTTP error: {e}")
+        except JellyfinError:
+            self._breaker.on_failure()
+            raise
+
+        self._breaker.on_success()
+        return data
 
     # -------------------------------------------------------------------------
     # Public API Methods
@@ -403,14 +723,41 @@ class JellyfinClient:
             >>> for movie in movies:
             ...     print(f"Added: {movie.display_title}")
         """
-        # Calculate cutoff timestamp in UTC for client-side filtering
+        return await self._fetch_recent_items(item_type, hours=hours, limit=limit)
+
+    async def _fetch_recent_items(
+        self,
+        include_types: str,
+        hours: int,
+        limit: int,
+    ) -> list[JellyfinItem]:
+        """
+        Fetch and filter recently added items for one /Items query.
+
+        Shared by get_recent_items (single type) and get_all_recent_items
+        (comma-separated types batched into one request). Applies the
+        client-side cutoff filter on the date-descending response.
+
+        Args:
+            include_types: Value for IncludeItemTypes - a single Jellyfin
+                type or a comma-separated list of types.
+            hours: How many hours back to look for new content.
+            limit: Maximum number of items to request.
+
+        Returns:
+            List of JellyfinItem objects within the lookback window,
+            sorted newest first.
+        """
+        # Calculate cutoff timestamp in UTC once up front - both the API
+        # query and the per-item filter loop below compare against this
+        # single value, so "now" is never re-read inside the loop
         cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
         cutoff_str = cutoff.strftime("%Y-%m-%dT%H:%M:%SZ")
 
         params = {
             "SortBy": "DateCreated",
             "SortOrder": "Descending",
-            "IncludeItemTypes": item_type,
+            "IncludeItemTypes": include_types,
             "Recursive": "true",
             "MinDateCreated": cutoff_str,
             "Limit": str(limit),
@@ -419,25 +766,52 @@ class JellyfinClient:
         }
 
         logger.debug(
-            f"Querying Jellyfin /Items: type={item_type}, "
+            f"Querying Jellyfin /Items: type={include_types}, "
             f"lookback={hours}h, cutoff={cutoff_str}, limit={limit}"
         )
 
         data = await self._request("GET", "/Items", params=params)
+        return self._parse_items_response(data, cutoff, include_types)
+
+    def _parse_items_response(
+        self,
+        data: dict,
+        cutoff: datetime,
+        include_types: str = "",
+    ) -> list[JellyfinItem]:
+        """
+        Parse and filter a raw /Items payload against a cutoff.
+
+        Split out from _fetch_recent_items so parsing behavior (date
+        inheritance, undated-item skipping, early cutoff break) can be
+        exercised without the HTTP layer.
+
+        Args:
+            data: Decoded /Items response body.
+            cutoff: Oldest DateCreated to keep; older items end the scan.
+            include_types: Requested IncludeItemTypes, for debug logging.
+
+        Returns:
+            List of JellyfinItem objects within the lookback window,
+            sorted newest first.
+        """
         items = data.get("Items", [])
 
-        # Log the raw response for debugging
-        logger.debug(
-            f"Jellyfin /Items response for type={item_type}: "
-            f"TotalRecordCount={data.get('TotalRecordCount', 'N/A')}, "
-            f"Items returned={len(items)}"
-        )
-        for i, item in enumerate(items):
+        # Log the raw response for debugging. The per-item lines are gated
+        # so large responses don't pay for f-string formatting when debug
+        # logging is off.
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug(
-                f"  [{i}] {item.get('Name', 'Unknown')} "
-                f"(Id={item.get('Id')}, Type={item.get('Type')}, "
-                f"DateCreated={item.get('DateCreated', 'None')})"
+                f"Jellyfin /Items response for type={include_types}: "
+                f"TotalRecordCount={data.get('TotalRecordCount', 'N/A')}, "
+                f"Items returned={len(items)}"
             )
+            for i, item in enumerate(items):
+                logger.debug(
+                    f"  [{i}] {item.get('Name', 'Unknown')} "
+                    f"(Id={item.get('Id')}, Type={item.get('Type')}, "
+                    f"DateCreated={item.get('DateCreated', 'None')})"
+                )
 
         # Parse items and apply client-side date filtering
         # This ensures we only return items within the lookback window,
@@ -448,9 +822,11 @@ class JellyfinClient:
         # certain items don't have date_created available.
         parsed_items = []
         last_valid_date: datetime | None = None
+        # Bind the bound method once - items can number in the hundreds
+        parse_item = self._parse_item
 
         for item in items:
-            parsed_item = self._parse_item(item)
+            parsed_item = parse_item(item)
 
             # Determine the effective date for this item
             if parsed_item.date_created is not None:
@@ -471,15 +847,18 @@ class JellyfinClient:
                 )
                 continue
 
-            # Apply cutoff filter using the effective date
+            # Apply cutoff filter using the effective date. The response is
+            # sorted by DateCreated descending, so the first item older than
+            # the cutoff means everything after it is older too - stop
+            # parsing instead of scanning the rest of the payload
             if effective_date >= cutoff:
                 parsed_items.append(parsed_item)
             else:
-                # Item is older than cutoff
                 logger.debug(
-                    f"Filtering out '{parsed_item.name}' - effective date "
+                    f"Stopping at '{parsed_item.name}' - effective date "
                     f"{effective_date} is older than cutoff {cutoff}"
                 )
+                break
 
         return parsed_items
 
@@ -512,14 +891,28 @@ class JellyfinClient:
             >>> for content_type, items in results.items():
             ...     print(f"{content_type}: {len(items)} new items")
         """
-        results: dict[str, list[JellyfinItem]] = {}
-
+        # Map user-friendly type names to Jellyfin API types. /Items accepts
+        # a comma-separated IncludeItemTypes, so all types are fetched in a
+        # single round trip and bucketed back by item type afterwards. The
+        # first requested name wins when an alias maps to the same Jellyfin
+        # type (e.g. "Music" → "Audio").
+        requested_by_type: dict[str, str] = {}
         for content_type in content_types:
-            # Map user-friendly type names to Jellyfin API types
-            jellyfin_type = self._map_content_type(content_type)
-            items = await self.get_recent_items(jellyfin_type, hours=hours)
-            if items:
-                results[content_type] = items
+            requested_by_type.setdefault(
+                self._map_content_type(content_type), content_type
+            )
+
+        items = await self._fetch_recent_items(
+            ",".join(requested_by_type),
+            hours=hours,
+            limit=20 * len(requested_by_type),
+        )
+
+        results: dict[str, list[JellyfinItem]] = {}
+        for item in items:
+            content_type = requested_by_type.get(item.item_type)
+            if content_type is not None:
+                results.setdefault(content_type, []).append(item)
 
         return results
 
@@ -593,10 +986,17 @@ class JellyfinClient:
             >>> for content_type, item in suggestions.items():
             ...     print(f"{content_type}: {item.display_title}")
         """
-        results: dict[str, JellyfinItem] = {}
+        # Fetch one random item per type concurrently (see
+        # get_all_recent_items for the rationale)
+        fetched = await asyncio.gather(
+            *(self.get_random_item(ct) for ct in content_types),
+            return_exceptions=True,
+        )
 
-        for content_type in content_types:
-            item = await self.get_random_item(content_type)
+        results: dict[str, JellyfinItem] = {}
+        for content_type, item in zip(content_types, fetched):
+            if isinstance(item, BaseException):
+                raise item
             if item:
                 results[content_type] = item
 
@@ -636,9 +1036,7 @@ class JellyfinClient:
             >>> url = client.get_item_image_url("abc123", max_width=300)
             >>> embed.set_thumbnail(url=url)
         """
-        return (
-            f"{self.base_url}/Items/{item_id}/Images/{image_type}?maxWidth={max_width}"
-        )
+        return _build_image_url(self.base_url, item_id, image_type, max_width)
 
     def get_item_url(self, item_id: str) -> str:
         """
@@ -657,7 +1055,7 @@ class JellyfinClient:
             >>> url = client.get_item_url("abc123")
             >>> embed = discord.Embed(title=movie.name, url=url)
         """
-        return f"{self.base_url}/web/index.html#!/details?id={item_id}"
+        return self._web_details_url + item_id
 
     def get_recently_added_url(self, content_type: str) -> str:
         """
@@ -678,19 +1076,9 @@ class JellyfinClient:
             >>> # Returns: http://localhost:8096/web/index.html#!/list.html?type=Movie&sortBy=DateCreated&sortOrder=Descending
         """
         # Map user-friendly names to Jellyfin API types
-        type_mapping = {
-            "Movie": "Movie",
-            "Series": "Series",
-            "Audio": "Audio",
-            "Music": "Audio",
-            "Episode": "Episode",
-        }
-        jellyfin_type = type_mapping.get(content_type, content_type)
+        jellyfin_type = _CONTENT_TYPE_MAP.get(content_type, content_type)
 
-        return (
-            f"{self.base_url}/web/index.html#!/list.html"
-            f"?type={jellyfin_type}&sortBy=DateCreated&sortOrder=Descending"
-        )
+        return _build_recent_url(self.base_url, jellyfin_type)
 
     # -------------------------------------------------------------------------
     # Private Helpers
@@ -710,22 +1098,21 @@ class JellyfinClient:
             Jellyfin item type string. If no mapping exists, returns
             the input unchanged (pass-through for unknown types).
         """
-        mapping = {
-            "Movie": "Movie",
-            "Series": "Series",
-            "Audio": "Audio",
-            "Music": "Audio",  # Alias for user convenience
-            "MusicAlbum": "MusicAlbum",  # For random album suggestions
-            "Episode": "Episode",
-        }
-        return mapping.get(content_type, content_type)
+        return _CONTENT_TYPE_MAP.get(content_type, content_type)
 
-    def _parse_item(self, data: dict[str, Any]) -> JellyfinItem:
+    def _parse_item(
+        self,
+        data: dict[str, Any],
+        *,
+        _fromisoformat: Callable[[str], datetime] = _parse_iso_datetime,
+    ) -> JellyfinItem:
         """
         Parse a Jellyfin API item response into a JellyfinItem dataclass.
 
         Handles missing fields gracefully with defaults, and parses
-        the ISO 8601 date string into a Python datetime.
+        the ISO 8601 date string into a Python datetime. The parser is
+        bound once as a keyword default so the per-item loop skips the
+        classmethod attribute lookup.
 
         Args:
             data: Raw item dictionary from Jellyfin API response.
@@ -733,19 +1120,36 @@ class JellyfinClient:
         Returns:
             Populated JellyfinItem instance.
         """
-        # Parse the date string (handle Jellyfin's ISO format)
+        # Pull all optional fields in one C-level pass over dict.get
+        # instead of eight separate method-call round trips - measurable
+        # on large /Items responses
+        (
+            name,
+            item_type,
+            overview,
+            year,
+            series_name,
+            album,
+            artists,
+            raw_date,
+        ) = map(data.get, _OPTIONAL_ITEM_KEYS)
+
+        # Parse the date string (handle Jellyfin's ISO format) via
+        # fromisoformat, which takes CPython's C fast path - strptime-style
+        # format reinterpretation would be ~20x slower per item
         date_created = None
-        if data.get("DateCreated"):
+        if raw_date:
             try:
-                date_str = data["DateCreated"]
-                # Jellyfin uses 'Z' suffix; convert to +00:00 for fromisoformat
-                date_str = date_str.replace("Z", "+00:00")
+                date_str = raw_date
+                # Jellyfin uses a 'Z' suffix; convert to +00:00 for
+                # fromisoformat (pre-3.11 compatible)
+                if date_str.endswith("Z"):
+                    date_str = date_str[:-1] + "+00:00"
                 # Jellyfin can have 7 decimal places, but Python only handles 6
                 # Truncate fractional seconds to 6 digits if present
                 if "." in date_str:
-                    # Split at the decimal point
-                    base, frac_and_tz = date_str.split(".", 1)
-                    # Find where the timezone starts (+ or -)
+                    base, _, frac_and_tz = date_str.partition(".")
+                    # Find where the timezone offset starts (+ or -)
                     tz_start = -1
                     for i, char in enumerate(frac_and_tz):
                         if char in "+-":
@@ -755,20 +1159,20 @@ class JellyfinClient:
                         frac = frac_and_tz[:tz_start][:6]  # Truncate to 6 digits
                         tz = frac_and_tz[tz_start:]
                         date_str = f"{base}.{frac}{tz}"
-                date_created = datetime.fromisoformat(date_str)
+                date_created = _fromisoformat(date_str)
             except (ValueError, TypeError) as e:
                 # Log but don't fail if date parsing fails
-                logger.debug(f"Could not parse date: {data.get('DateCreated')} - {e}")
+                logger.debug(f"Could not parse date: {raw_date} - {e}")
 
         return JellyfinItem(
             id=data["Id"],
-            name=data.get("Name", "Unknown"),
-            item_type=data.get("Type", "Unknown"),
-            overview=data.get("Overview"),
-            year=data.get("ProductionYear"),
-            series_name=data.get("SeriesName"),
-            album=data.get("Album"),
-            artists=data.get("Artists"),
+            name=name if name is not None else "Unknown",
+            item_type=item_type if item_type is not None else "Unknown",
+            overview=overview,
+            year=year,
+            series_name=series_name,
+            album=album,
+            artists=artists,
             date_created=date_created,
         )
 
@@ -778,6 +1182,45 @@ class JellyfinClient:
 # =============================================================================
 
 
+# Thresholds for the per-URL health state machine used by resolve_url:
+# a URL is marked dead after this many consecutive failed probes and is
+# then skipped until its cooldown expires; one successful probe marks it
+# healthy again.
+_URL_FAIL_THRESHOLD = 3
+_URL_DEAD_COOLDOWN_SECONDS = 30.0
+
+
+@dataclass(slots=True)
+class _UrlHealth:
+    """
+    Probe history for one configured Jellyfin URL.
+
+    Attributes:
+        state: "healthy" or "dead". Dead URLs are skipped by resolve_url
+            until next_probe_at passes.
+        consecutive_fails: Failed probes since the last success.
+        next_probe_at: Monotonic deadline after which a dead URL may be
+            probed again.
+    """
+
+    state: str = "healthy"
+    consecutive_fails: int = 0
+    next_probe_at: float = 0.0
+
+    def record_pass(self) -> None:
+        """Mark a successful probe, reviving a dead URL immediately."""
+        self.state = "healthy"
+        self.consecutive_fails = 0
+        self.next_probe_at = 0.0
+
+    def record_fail(self) -> None:
+        """Mark a failed probe, declaring the URL dead at the threshold."""
+        self.consecutive_fails += 1
+        if self.consecutive_fails >= _URL_FAIL_THRESHOLD:
+            self.state = "dead"
+            self.next_probe_at = time.monotonic() + _URL_DEAD_COOLDOWN_SECONDS
+
+
 class JellyfinService:
     """
     High-level Jellyfin service with multi-URL failover support.
@@ -832,6 +1275,52 @@ class JellyfinService:
         self.api_key = api_key
         self._active_url: str | None = None
         self._client: JellyfinClient | None = None
+        self._session: aiohttp.ClientSession | None = None
+        # Last successful health check result, for single-flight collapsing
+        # of concurrent pollers and short-window stale serving on failure
+        self._health_cache: tuple[float, ServerInfo] | None = None
+        self._health_inflight: asyncio.Task[ServerInfo] | None = None
+        # ServerInfo from the most recent winning probe, reused by
+        # check_health to avoid a duplicate /System/Info fetch
+        self._last_probe_info: ServerInfo | None = None
+        # Per-URL probe history so resolve_url can skip known-dead URLs
+        # during their cooldown window
+        self._health: dict[str, _UrlHealth] = {url: _UrlHealth() for url in self.urls}
+        # Per-URL circuit breakers shared with the probe clients, so
+        # failure history survives client turnover during failover
+        self._breakers: dict[str, CircuitBreaker] = {
+            url: CircuitBreaker() for url in self.urls
+        }
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """
+        Get or create the service-owned aiohttp session.
+
+        One session (and its connection pool) is shared by every client
+        the service creates during failover, so TCP handshakes and DNS
+        lookups are amortized across URL switches instead of being paid
+        per attempt. DNS results are cached for five minutes.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    use_dns_cache=True,
+                    ttl_dns_cache=300,
+                    limit=100,
+                    limit_per_host=10,
+                    keepalive_timeout=60,
+                    happy_eyeballs_delay=0.25,
+                    enable_cleanup_closed=True,
+                ),
+                headers={
+                    "X-Emby-Token": self.api_key,
+                    "Accept": "application/json",
+                    "Accept-Encoding": "gzip, deflate",
+                },
+                timeout=_REQUEST_TIMEOUT,
+            )
+        return self._session
 
     @property
     def active_url(self) -> str | None:
@@ -886,35 +1375,138 @@ class JellyfinService:
         if not self.urls:
             raise JellyfinError("No Jellyfin URLs configured")
 
-        errors: list[str] = []
-
-        for url in self.urls:
-            logger.debug(f"Trying Jellyfin URL: {url}")
-            client = JellyfinClient(base_url=url, api_key=self.api_key)
+        # Skip URLs the state machine currently considers dead - a URL
+        # that failed _URL_FAIL_THRESHOLD probes in a row is left alone
+        # until its cooldown expires, so a flapping primary doesn't cost
+        # a fresh connect timeout on every health check
+        now = time.monotonic()
+        candidates = [
+            url
+            for url in self.urls
+            if not (
+                (health := self._health[url]).state == "dead"
+                and now < health.next_probe_at
+            )
+        ]
+        if not candidates:
+            # Every URL is in cooldown; probe them all rather than fail
+            # without even trying
+            candidates = list(self.urls)
+
+        # Probe all candidates concurrently, giving each higher-priority
+        # URL a short head start (hedging). A healthy primary still wins
+        # every time, but when it is down the worst case drops from the
+        # sum of per-URL timeouts to roughly the fastest healthy backup's
+        # probe.
+        clients = [
+            JellyfinClient(
+                base_url=url,
+                api_key=self.api_key,
+                session=self.session,
+                # One breaker per URL, persisted across resolves, so an
+                # open circuit fails the probe in microseconds instead of
+                # re-running a full connect/timeout cycle
+                breaker=self._breakers[url],
+            )
+            for url in candidates
+        ]
+        tasks = [
+            asyncio.create_task(
+                self._probe_url(client, delay=i * self._PROBE_HEDGE_SECONDS)
+            )
+            for i, client in enumerate(clients)
+        ]
 
-            try:
-                await client.check_health()
-                # Success! Update cached client and URL
-                if self._client and self._client is not client:
-                    await self._client.close()
-                self._client = client
-                self._active_url = url
-                logger.info(f"Jellyfin URL resolved: {url}")
-                return url
+        # outcomes[i] is None while pending, the probe's ServerInfo on
+        # success, or the error on failure
+        outcomes: list[Any] = [None] * len(tasks)
+        winner: Optional[int] = None
+        pending: set[asyncio.Task] = set(tasks)
 
-            except JellyfinConnectionError as e:
-                logger.warning(f"Failed to connect to {url}: {e}")
-                errors.append(f"{url}: {e}")
+        try:
+            while pending and winner is None:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    index = tasks.index(task)
+                    error = task.exception()
+                    if error is None:
+                        outcomes[index] = task.result()
+                        self._health[candidates[index]].record_pass()
+                    else:
+                        logger.warning(f"Failed to probe {candidates[index]}: {error}")
+                        outcomes[index] = error
+                        self._health[candidates[index]].record_fail()
+
+                # Pick the best-priority success, but only once every URL
+                # ahead of it has already failed - primary preference is
+                # preserved even if a backup answers first
+                for index, outcome in enumerate(outcomes):
+                    if outcome is None:
+                        break
+                    if isinstance(outcome, ServerInfo):
+                        winner = index
+                        break
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        if winner is None:
+            # All URLs failed; clients borrow the shared session, so
+            # closing them here is cheap bookkeeping
+            for client in clients:
                 await client.close()
+            error_summary = "; ".join(
+                f"{url}: {outcome}"
+                for url, outcome in zip(candidates, outcomes)
+                if isinstance(outcome, BaseException)
+            )
+            raise JellyfinConnectionError(f"All Jellyfin URLs failed: {error_summary}")
 
-            except JellyfinError as e:
-                logger.warning(f"Jellyfin error at {url}: {e}")
-                errors.append(f"{url}: {e}")
+        # Success! Update cached client and URL, discarding the losers
+        if self._client and self._client is not clients[winner]:
+            await self._client.close()
+        for index, client in enumerate(clients):
+            if index != winner:
                 await client.close()
+        self._client = clients[winner]
+        if self._active_url != candidates[winner]:
+            # The cached health result described the old server
+            self._health_cache = None
+        self._active_url = candidates[winner]
+        # Keep the winning probe's response so check_health doesn't have
+        # to fetch /System/Info a second time right after resolving
+        self._last_probe_info = outcomes[winner]
+        logger.info(f"Jellyfin URL resolved: {self._active_url}")
+        return self._active_url
 
-        # All URLs failed
-        error_summary = "; ".join(errors)
-        raise JellyfinConnectionError(f"All Jellyfin URLs failed: {error_summary}")
+    # Head start (per priority slot) that higher-priority URLs get over
+    # lower ones during hedged probing in resolve_url
+    _PROBE_HEDGE_SECONDS = 0.15
+
+    async def _probe_url(self, client: JellyfinClient, delay: float) -> ServerInfo:
+        """
+        Probe one candidate URL after an optional hedging delay.
+
+        Args:
+            client: Client pointed at the candidate URL.
+            delay: Seconds to wait before probing, so higher-priority
+                URLs get a chance to answer first.
+
+        Returns:
+            The probed server's info, so callers can reuse the response
+            instead of fetching /System/Info again.
+
+        Raises:
+            JellyfinError: If the probe fails for any reason.
+        """
+        if delay:
+            await asyncio.sleep(delay)
+        logger.debug(f"Trying Jellyfin URL: {client.base_url}")
+        return await client.check_health()
 
     async def check_health(self) -> ServerInfo:
         """
@@ -923,7 +1515,9 @@ class JellyfinService:
         Unlike other API methods that use the cached active URL, health
         checks always start from the top of the URL list. This ensures
         that when the primary server recovers from an outage, subsequent
-        health checks will detect this and switch back to it.
+        health checks will detect this and switch back to it. Results
+        are cached for a couple of seconds so a burst of slash commands
+        is answered with one upstream probe.
 
         Returns:
             ServerInfo from the first responding server.
@@ -937,11 +1531,56 @@ class JellyfinService:
             >>> info = await service.check_health()
             >>> print(f"Server: {info.server_name} via {service.active_url}")
         """
-        # Always try from the top of the URL list for health checks
-        await self.resolve_url()
-
-        # Now get the actual server info from the resolved client
-        return await self._client.check_health()
+        # Serve rapid repeat calls straight from the last result - a
+        # dashboard refresh or multi-user ping storm becomes one probe
+        if (
+            self._health_cache is not None
+            and time.monotonic() - self._health_cache[0] < self._HEALTH_TTL_SECONDS
+        ):
+            return self._health_cache[1]
+
+        # Single-flight: concurrent pollers (scheduler tick + user command)
+        # share one upstream probe instead of each hitting the server
+        if self._health_inflight is None or self._health_inflight.done():
+            self._health_inflight = asyncio.ensure_future(self._check_health_once())
+        return await self._health_inflight
+
+    # How long a fresh result may be served without re-probing at all
+    _HEALTH_TTL_SECONDS = 2.0
+
+    # How long a cached last-good result may be served when a probe fails
+    _HEALTH_STALE_SECONDS = 60.0
+
+    async def _check_health_once(self) -> ServerInfo:
+        """
+        Run a single health probe, with stale-serving on failure.
+
+        If the probe fails with a connection error but the last successful
+        result is younger than _HEALTH_STALE_SECONDS, that result is
+        returned with ``stale=True`` instead of raising - graceful
+        degradation for callers that only display status. The periodic
+        health monitor polls on a longer interval, so real outages are
+        still detected on its next tick.
+        """
+        try:
+            # Always try from the top of the URL list for health checks;
+            # the winning probe's /System/Info response doubles as the
+            # result, so no second fetch is needed
+            await self.resolve_url()
+            info = self._last_probe_info
+            if info is None:
+                info = await self._client.check_health()
+        except JellyfinConnectionError:
+            if (
+                self._health_cache is not None
+                and time.monotonic() - self._health_cache[0]
+                < self._HEALTH_STALE_SECONDS
+            ):
+                return replace(self._health_cache[1], stale=True)
+            raise
+
+        self._health_cache = (time.monotonic(), info)
+        return info
 
     # -------------------------------------------------------------------------
     # Delegated API Methods
@@ -1029,7 +1668,7 @@ class JellyfinService:
         See JellyfinClient.get_item_image_url for full documentation.
         """
         base_url = self._active_url or self.urls[0]
-        return f"{base_url}/Items/{item_id}/Images/{image_type}?maxWidth={max_width}"
+        return _build_image_url(base_url, item_id, image_type, max_width)
 
     def get_item_url(self, item_id: str) -> str:
         """
@@ -1053,33 +1692,44 @@ class JellyfinService:
         See JellyfinClient.get_recently_added_url for full documentation.
         """
         base_url = self._active_url or self.urls[0]
-        type_mapping = {
-            "Movie": "Movie",
-            "Series": "Series",
-            "Audio": "Audio",
-            "Music": "Audio",
-            "Episode": "Episode",
-        }
-        jellyfin_type = type_mapping.get(content_type, content_type)
-        return (
-            f"{base_url}/web/index.html#!/list.html"
-            f"?type={jellyfin_type}&sortBy=DateCreated&sortOrder=Descending"
-        )
+        jellyfin_type = _CONTENT_TYPE_MAP.get(content_type, content_type)
+        return _build_recent_url(base_url, jellyfin_type)
 
     # -------------------------------------------------------------------------
     # Lifecycle
     # -------------------------------------------------------------------------
 
+    async def warmup(self) -> None:
+        """
+        Resolve the active URL ahead of the first real request.
+
+        Intended to run during bot startup so the DNS lookup, TCP
+        handshake and URL failover happen before the first Discord
+        command or scheduler tick needs them - the probe's keep-alive
+        connection stays pooled for the next request. Failures are
+        logged rather than raised; the bot should boot even when
+        Jellyfin is down.
+        """
+        try:
+            await self.resolve_url()
+        except JellyfinError as e:
+            logger.warning(f"Jellyfin warmup failed: {e}")
+            return
+        logger.info(f"Jellyfin warmup complete (active URL: {self._active_url})")
+
     async def close(self) -> None:
         """
         Close the service and release resources.
 
-        Closes the underlying JellyfinClient's HTTP session. Safe to call
-        multiple times or if no client was ever created.
+        Closes the shared HTTP session used by the service's clients.
+        Safe to call multiple times or if no client was ever created.
         """
         if self._client:
             await self._client.close()
             self._client = None
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
         self._active_url = None
 
     async def __aenter__(self) -> "JellyfinService":
@@ -45,6 +45,7 @@ See Also:
 """
 
 import logging
+import re
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Optional
@@ -56,6 +57,13 @@ from bot.config import MinecraftServerConfig
 # Module logger
 logger = logging.getLogger("monolithbot.minecraft")
 
+# Minecraft §X color/formatting codes, compiled once for _clean_motd
+_MOTD_CODE_RE = re.compile(r"§[0-9a-fklmnor]", re.IGNORECASE)
+
+# Shared empty player set - frozensets are immutable, so every status
+# with no visible players can reference the same instance
+_EMPTY_PLAYERS: frozenset[str] = frozenset()
+
 
 # =============================================================================
 # Exceptions
@@ -116,7 +124,8 @@ class MinecraftServerStatus:
         online: Whether the server responded successfully.
         player_count: Number of players currently online.
         max_players: Maximum player capacity.
-        player_names: Set of online player names (may be empty if server hides list).
+        player_names: Frozenset of online player names (may be empty if the
+            server hides its list).
         players_hidden: True if server is configured to hide player list.
         motd: Message of the Day (server description).
         version: Minecraft version string (e.g., "1.20.4").
@@ -137,7 +146,7 @@ class MinecraftServerStatus:
     online: bool
     player_count: int = 0
     max_players: int = 0
-    player_names: set[str] = field(default_factory=set)
+    player_names: frozenset[str] = _EMPTY_PLAYERS
     players_hidden: bool = False
     motd: str = ""
     version: str = ""
@@ -260,11 +269,13 @@ class MinecraftClient:
             response = await server.async_status()
 
             # Extract player names if available
-            player_names: set[str] = set()
+            player_names = _EMPTY_PLAYERS
             players_hidden = False
 
             if response.players.sample:
-                player_names = {p.name for p in response.players.sample if p.name}
+                player_names = frozenset(
+                    p.name for p in response.players.sample if p.name
+                )
             elif response.players.online > 0:
                 # Server has players but didn't provide sample - likely hidden
                 players_hidden = True
@@ -325,10 +336,8 @@ class MinecraftClient:
         Returns:
             Cleaned MOTD string.
         """
-        import re
-
         # Remove §X color codes and common formatting
-        cleaned = re.sub(r"§[0-9a-fklmnor]", "", motd, flags=re.IGNORECASE)
+        cleaned = _MOTD_CODE_RE.sub("", motd)
         # Also handle {"text": ...} style if present
         if cleaned.startswith("{") and "text" in cleaned:
             try:
@@ -5,6 +5,9 @@ This module provides reusable fixtures for testing the bot's components,
 including mock configurations, Discord objects, and Jellyfin responses.
 """
 
+import asyncio
+import sys
+
 import pytest
 from datetime import datetime, timezone
 from pathlib import Path
@@ -19,10 +22,68 @@ from bot.config import (
     MinecraftConfig,
     MinecraftScheduleConfig,
     MinecraftServerConfig,
+    _minecraft_env_overrides,
 )
 from bot.services.jellyfin import JellyfinItem, ServerInfo
 
 
+# =============================================================================
+# Event Loop Factory
+# =============================================================================
+
+
+def pytest_asyncio_loop_factories(
+    config: pytest.Config, item: pytest.Item
+) -> dict[str, Any]:
+    """
+    Run the suite's event loops on uvloop when it is available.
+
+    uvloop is a drop-in libuv-backed loop with lower per-await overhead
+    than the stock selector loop. It is optional (and unavailable on
+    Windows), so the stock loop is the fallback.
+    """
+    if sys.platform != "win32":
+        try:
+            import uvloop
+
+            return {"uvloop": uvloop.new_event_loop}
+        except ImportError:
+            pass
+    return {"asyncio": asyncio.new_event_loop}
+
+
+# =============================================================================
+# Autouse Fixtures
+# =============================================================================
+
+
+@pytest.fixture(autouse=True)
+def _clear_env_override_cache() -> None:
+    """
+    Clear the cached Minecraft env var snapshot before each test.
+
+    The snapshot is cached for the process lifetime in production, but
+    tests patch os.environ per-case, so the cache must be invalidated.
+    """
+    _minecraft_env_overrides.cache_clear()
+
+
+@pytest.fixture
+def clean_env(monkeypatch: pytest.MonkeyPatch) -> pytest.MonkeyPatch:
+    """
+    Provide an empty environment via monkeypatch.
+
+    Deleting keys through monkeypatch records only the touched entries,
+    instead of patch.dict's snapshot-and-restore of the whole environ on
+    every test. Tests set the variables they need with setenv().
+    """
+    import os
+
+    for key in list(os.environ):
+        monkeypatch.delenv(key, raising=False)
+    return monkeypatch
+
+
 # =============================================================================
 # Configuration Fixtures
 # =============================================================================
@@ -303,6 +364,11 @@ def mock_bot(config: Config, mock_discord_channel: MagicMock) -> MagicMock:
 # =============================================================================
 
 
+def _fields_by_name(embed: Any) -> dict[str, Any]:
+    """Index an embed's fields by name for O(1) lookup in assertions."""
+    return {f.name: f for f in embed.fields}
+
+
 def create_jellyfin_item(
     id: str = "test-id",
     name: str = "Test Item",
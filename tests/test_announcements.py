@@ -15,6 +15,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import discord
 
 from bot.services.jellyfin import JellyfinItem
+from tests.conftest import _fields_by_name
 
 
 # =============================================================================
@@ -184,7 +185,7 @@ class TestAddItemFields:
 
         cog._add_item_fields(embed, item)
 
-        year_field = next((f for f in embed.fields if f.name == "Year"), None)
+        year_field = _fields_by_name(embed).get("Year")
         assert year_field is not None
         assert year_field.value == "1999"
 
@@ -199,7 +200,7 @@ class TestAddItemFields:
 
         cog._add_item_fields(embed, item)
 
-        year_field = next((f for f in embed.fields if f.name == "Year"), None)
+        year_field = _fields_by_name(embed).get("Year")
         assert year_field is None
 
     def test_adds_series_field_for_episode(self, cog: Any) -> None:
@@ -214,7 +215,7 @@ class TestAddItemFields:
 
         cog._add_item_fields(embed, item)
 
-        series_field = next((f for f in embed.fields if f.name == "Series"), None)
+        series_field = _fields_by_name(embed).get("Series")
         assert series_field is not None
         assert series_field.value == "Breaking Bad"
 
@@ -230,7 +231,7 @@ class TestAddItemFields:
 
         cog._add_item_fields(embed, item)
 
-        series_field = next((f for f in embed.fields if f.name == "Series"), None)
+        series_field = _fields_by_name(embed).get("Series")
         assert series_field is None
 
     def test_adds_artist_field_for_audio(self, cog: Any) -> None:
@@ -245,7 +246,7 @@ class TestAddItemFields:
 
         cog._add_item_fields(embed, item)
 
-        artist_field = next((f for f in embed.fields if f.name == "Artist"), None)
+        artist_field = _fields_by_name(embed).get("Artist")
         assert artist_field is not None
         assert artist_field.value == "Queen, David Bowie"
 
@@ -261,7 +262,7 @@ class TestAddItemFields:
 
         cog._add_item_fields(embed, item)
 
-        album_field = next((f for f in embed.fields if f.name == "Album"), None)
+        album_field = _fields_by_name(embed).get("Album")
         assert album_field is not None
         assert album_field.value == "A Night at the Opera"
 
@@ -289,9 +290,7 @@ class TestTestModeDateDisplay:
 
         cog._add_item_fields(embed, item)
 
-        date_field = next(
-            (f for f in embed.fields if f.name == "Added to Library"), None
-        )
+        date_field = _fields_by_name(embed).get("Added to Library")
         assert date_field is None
 
     def test_date_field_added_in_test_mode(self, mock_bot: MagicMock) -> None:
@@ -310,9 +309,7 @@ class TestTestModeDateDisplay:
 
         cog._add_item_fields(embed, item)
 
-        date_field = next(
-            (f for f in embed.fields if f.name == "Added to Library"), None
-        )
+        date_field = _fields_by_name(embed).get("Added to Library")
         assert date_field is not None
         # Should use Discord timestamp format
         assert f"<t:{int(dt.timestamp())}:F>" in date_field.value
@@ -332,9 +329,7 @@ class TestTestModeDateDisplay:
 
         cog._add_item_fields(embed, item)
 
-        date_field = next(
-            (f for f in embed.fields if f.name == "Added to Library"), None
-        )
+        date_field = _fields_by_name(embed).get("Added to Library")
         assert date_field is None
 
 
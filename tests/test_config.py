@@ -146,10 +146,11 @@ class TestJellyfinConfig:
             ],
             api_key="test-api-key",
         )
-        assert len(config.urls) == 3
-        assert config.urls[0] == "http://primary.local:8096"
-        assert config.urls[1] == "http://secondary.local:8096"
-        assert config.urls[2] == "http://192.168.1.100:8096"
+        assert config.urls == [
+            "http://primary.local:8096",
+            "http://secondary.local:8096",
+            "http://192.168.1.100:8096",
+        ]
         # .url property returns the first (primary) URL
         assert config.url == "http://primary.local:8096"
 
@@ -201,17 +202,19 @@ class TestEnvHelpers:
             assert _get_env("NONEXISTENT_VAR") is None
             assert _get_env("NONEXISTENT_VAR", "default") == "default"
 
-    def test_get_env_bool_returns_true(self) -> None:
+    @pytest.mark.parametrize("val", ["true", "True", "TRUE", "1", "yes", "YES"])
+    def test_get_env_bool_returns_true(self, val: str) -> None:
         """Test _get_env_bool parses true values."""
-        for val in ["true", "True", "TRUE", "1", "yes", "YES"]:
-            with patch.dict(os.environ, {"TEST_BOOL": val}):
-                assert _get_env_bool("TEST_BOOL") is True
+        with patch.dict(os.environ, {"TEST_BOOL": val}):
+            assert _get_env_bool("TEST_BOOL") is True
 
-    def test_get_env_bool_returns_false(self) -> None:
+    @pytest.mark.parametrize(
+        "val", ["false", "False", "FALSE", "0", "no", "NO", "anything"]
+    )
+    def test_get_env_bool_returns_false(self, val: str) -> None:
         """Test _get_env_bool parses false values."""
-        for val in ["false", "False", "FALSE", "0", "no", "NO", "anything"]:
-            with patch.dict(os.environ, {"TEST_BOOL": val}):
-                assert _get_env_bool("TEST_BOOL") is False
+        with patch.dict(os.environ, {"TEST_BOOL": val}):
+            assert _get_env_bool("TEST_BOOL") is False
 
     def test_get_env_bool_returns_default(self) -> None:
         """Test _get_env_bool returns default when var not set."""
@@ -617,8 +620,11 @@ class TestMinecraftServerConfig:
             name="Survival",
             urls=["mc.example.com:25565", "192.168.1.100:25565", "backup.local:25565"],
         )
-        assert len(config.urls) == 3
-        assert config.urls[0] == "mc.example.com:25565"
+        assert config.urls == [
+            "mc.example.com:25565",
+            "192.168.1.100:25565",
+            "backup.local:25565",
+        ]
 
     def test_empty_name_raises_error(self) -> None:
         """Test that empty server name raises ValueError."""
@@ -680,10 +686,7 @@ class TestMinecraftConfig:
                 MinecraftServerConfig(name="Minigames", urls=["mc3.example.com:25565"]),
             ],
         )
-        assert len(config.servers) == 3
-        assert config.servers[0].name == "Survival"
-        assert config.servers[1].name == "Creative"
-        assert config.servers[2].name == "Minigames"
+        assert [s.name for s in config.servers] == ["Survival", "Creative", "Minigames"]
 
 
 # =============================================================================
@@ -789,6 +792,15 @@ class TestBuildMinecraftServerConfig:
 
         assert "must have 'urls'" in str(exc_info.value)
 
+    def test_invalid_url_raises_error(self) -> None:
+        """Test that a malformed address raises ConfigurationError."""
+        server_json = {"name": "Survival", "urls": ["mc.example.com:notaport"]}
+
+        with pytest.raises(ConfigurationError) as exc_info:
+            _build_minecraft_server_config(server_json)
+
+        assert "invalid address" in str(exc_info.value)
+
 
 # =============================================================================
 # Build Minecraft Config Tests
@@ -798,7 +810,9 @@ class TestBuildMinecraftServerConfig:
 class TestBuildMinecraftConfig:
     """Tests for _build_minecraft_config function."""
 
-    def test_loads_complete_config_from_json(self) -> None:
+    def test_loads_complete_config_from_json(
+        self, clean_env: pytest.MonkeyPatch
+    ) -> None:
         """Test loading complete Minecraft config from JSON."""
         json_config = {
             "minecraft": {
@@ -819,8 +833,7 @@ class TestBuildMinecraftConfig:
             }
         }
 
-        with patch.dict(os.environ, {}, clear=True):
-            config = _build_minecraft_config(json_config)
+        config = _build_minecraft_config(json_config)
 
         assert config.enabled is True
         assert config.announcement_channel_id == 123456789
@@ -829,14 +842,13 @@ class TestBuildMinecraftConfig:
         assert config.servers[0].name == "Survival"
         assert config.schedule.timezone == "UTC"
 
-    def test_disabled_by_default(self) -> None:
+    def test_disabled_by_default(self, clean_env: pytest.MonkeyPatch) -> None:
         """Test that Minecraft is disabled by default."""
-        with patch.dict(os.environ, {}, clear=True):
-            config = _build_minecraft_config({})
+        config = _build_minecraft_config({})
 
         assert config.enabled is False
 
-    def test_env_vars_override_channel_ids(self) -> None:
+    def test_env_vars_override_channel_ids(self, clean_env: pytest.MonkeyPatch) -> None:
         """Test that environment variables override channel IDs."""
         json_config = {
             "minecraft": {
@@ -846,18 +858,17 @@ class TestBuildMinecraftConfig:
                 "servers": [{"name": "Test", "urls": ["localhost:25565"]}],
             }
         }
-        env_vars = {
-            "MINECRAFT_ANNOUNCEMENT_CHANNEL_ID": "999",
-            "MINECRAFT_ALERT_CHANNEL_ID": "888",
-        }
+        clean_env.setenv("MINECRAFT_ANNOUNCEMENT_CHANNEL_ID", "999")
+        clean_env.setenv("MINECRAFT_ALERT_CHANNEL_ID", "888")
 
-        with patch.dict(os.environ, env_vars, clear=True):
-            config = _build_minecraft_config(json_config)
+        config = _build_minecraft_config(json_config)
 
         assert config.announcement_channel_id == 999
         assert config.alert_channel_id == 888
 
-    def test_enabled_without_channel_raises_error(self) -> None:
+    def test_enabled_without_channel_raises_error(
+        self, clean_env: pytest.MonkeyPatch
+    ) -> None:
         """Test that enabling without channel ID raises error."""
         json_config = {
             "minecraft": {
@@ -866,13 +877,14 @@ class TestBuildMinecraftConfig:
             }
         }
 
-        with patch.dict(os.environ, {}, clear=True):
-            with pytest.raises(ConfigurationError) as exc_info:
-                _build_minecraft_config(json_config)
+        with pytest.raises(ConfigurationError) as exc_info:
+            _build_minecraft_config(json_config)
 
         assert "announcement channel ID is required" in str(exc_info.value)
 
-    def test_enabled_without_servers_raises_error(self) -> None:
+    def test_enabled_without_servers_raises_error(
+        self, clean_env: pytest.MonkeyPatch
+    ) -> None:
         """Test that enabling without servers raises error."""
         json_config = {
             "minecraft": {
@@ -881,13 +893,12 @@ class TestBuildMinecraftConfig:
             }
         }
 
-        with patch.dict(os.environ, {}, clear=True):
-            with pytest.raises(ConfigurationError) as exc_info:
-                _build_minecraft_config(json_config)
+        with pytest.raises(ConfigurationError) as exc_info:
+            _build_minecraft_config(json_config)
 
         assert "At least one Minecraft server must be configured" in str(exc_info.value)
 
-    def test_enabled_via_env(self) -> None:
+    def test_enabled_via_env(self, clean_env: pytest.MonkeyPatch) -> None:
         """Test enabling Minecraft via environment variable."""
         json_config = {
             "minecraft": {
@@ -895,14 +906,13 @@ class TestBuildMinecraftConfig:
                 "servers": [{"name": "Test", "urls": ["localhost:25565"]}],
             }
         }
-        env_vars = {"MINECRAFT_ENABLED": "true"}
+        clean_env.setenv("MINECRAFT_ENABLED", "true")
 
-        with patch.dict(os.environ, env_vars, clear=True):
-            config = _build_minecraft_config(json_config)
+        config = _build_minecraft_config(json_config)
 
         assert config.enabled is True
 
-    def test_multiple_servers(self) -> None:
+    def test_multiple_servers(self, clean_env: pytest.MonkeyPatch) -> None:
         """Test loading config with multiple servers."""
         json_config = {
             "minecraft": {
@@ -919,13 +929,9 @@ class TestBuildMinecraftConfig:
             }
         }
 
-        with patch.dict(os.environ, {}, clear=True):
-            config = _build_minecraft_config(json_config)
+        config = _build_minecraft_config(json_config)
 
-        assert len(config.servers) == 3
-        assert config.servers[0].name == "Survival"
-        assert config.servers[1].name == "Creative"
-        assert config.servers[2].name == "Minigames"
+        assert [s.name for s in config.servers] == ["Survival", "Creative", "Minigames"]
         assert len(config.servers[2].urls) == 2
 
 
@@ -938,11 +944,13 @@ class TestLoadConfigWithMinecraft:
     """Tests for load_config function including Minecraft configuration."""
 
     def test_loads_minecraft_from_json(
-        self, temp_config_file: Path, config_json: dict[str, Any]
+        self,
+        clean_env: pytest.MonkeyPatch,
+        temp_config_file: Path,
+        config_json: dict[str, Any],
     ) -> None:
         """Test that Minecraft config is loaded from JSON file."""
-        with patch.dict(os.environ, {}, clear=True):
-            config = load_config(temp_config_file)
+        config = load_config(temp_config_file)
 
         assert config.minecraft.enabled == config_json["minecraft"]["enabled"]
         assert (
@@ -952,7 +960,9 @@ class TestLoadConfigWithMinecraft:
         assert len(config.minecraft.servers) == 2
         assert config.minecraft.servers[0].name == "Survival"
 
-    def test_minecraft_disabled_in_minimal_config(self, tmp_path: Path) -> None:
+    def test_minecraft_disabled_in_minimal_config(
+        self, clean_env: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
         """Test that Minecraft is disabled when not in config."""
         minimal_json = {
             "discord": {
@@ -968,8 +978,7 @@ class TestLoadConfigWithMinecraft:
         with open(config_path, "w") as f:
             json.dump(minimal_json, f)
 
-        with patch.dict(os.environ, {}, clear=True):
-            config = load_config(config_path)
+        config = load_config(config_path)
 
         assert config.minecraft.enabled is False
         assert config.minecraft.servers == []
@@ -17,25 +17,37 @@ from bot.services.jellyfin import (
     JellyfinError,
     ServerInfo,
 )
+from tests.conftest import _fields_by_name
 
 
 # =============================================================================
-# Helper function to create a mock HealthCog
+# Helper fixtures to create a mock HealthCog
 # =============================================================================
 
 
-def create_health_cog(mock_bot: MagicMock) -> Any:
-    """Create a JellyfinHealthCog with mocked dependencies."""
+@pytest.fixture(scope="module")
+def health_cog_cls() -> Any:
+    """
+    Import JellyfinHealthCog once per module with the scheduler patched.
+
+    The patch stays active for the whole module so per-test fixtures can
+    instantiate cogs cheaply, instead of re-entering the patch (and the
+    cog module import machinery) for every test.
+    """
     with patch("bot.cogs.jellyfin.health.create_scheduler"):
         from bot.cogs.jellyfin.health import JellyfinHealthCog
 
-        # Set up the mock jellyfin_service on the bot
-        mock_bot.jellyfin_service = MagicMock()
-        mock_bot.jellyfin_service.check_health = AsyncMock()
-        mock_bot.jellyfin_service.active_url = "http://localhost:8096"
+        yield JellyfinHealthCog
+
+
+def create_health_cog(health_cog_cls: Any, mock_bot: MagicMock) -> Any:
+    """Create a JellyfinHealthCog with mocked dependencies."""
+    # Set up the mock jellyfin_service on the bot
+    mock_bot.jellyfin_service = MagicMock()
+    mock_bot.jellyfin_service.check_health = AsyncMock()
+    mock_bot.jellyfin_service.active_url = "http://localhost:8096"
 
-        cog = JellyfinHealthCog(mock_bot)
-        return cog
+    return health_cog_cls(mock_bot)
 
 
 # =============================================================================
@@ -47,57 +59,30 @@ class TestFormatDuration:
     """Tests for _format_duration method."""
 
     @pytest.fixture
-    def cog(self, mock_bot: MagicMock) -> Any:
+    def cog(self, health_cog_cls: Any, mock_bot: MagicMock) -> Any:
         """Create a test cog."""
-        return create_health_cog(mock_bot)
-
-    def test_format_seconds_singular(self, cog: Any) -> None:
-        """Test formatting 1 second."""
-        assert cog._format_duration(1) == "1 second"
-
-    def test_format_seconds_plural(self, cog: Any) -> None:
-        """Test formatting multiple seconds."""
-        assert cog._format_duration(45) == "45 seconds"
-
-    def test_format_minute_singular(self, cog: Any) -> None:
-        """Test formatting 1 minute."""
-        assert cog._format_duration(60) == "1 minute"
-
-    def test_format_minutes_plural(self, cog: Any) -> None:
-        """Test formatting multiple minutes."""
-        assert cog._format_duration(120) == "2 minutes"
-
-    def test_format_minutes_boundary(self, cog: Any) -> None:
-        """Test formatting 59 minutes."""
-        assert cog._format_duration(59 * 60) == "59 minutes"
-
-    def test_format_hour_singular(self, cog: Any) -> None:
-        """Test formatting 1 hour."""
-        assert cog._format_duration(3600) == "1 hour"
-
-    def test_format_hours_plural(self, cog: Any) -> None:
-        """Test formatting multiple hours."""
-        assert cog._format_duration(7200) == "2 hours"
-
-    def test_format_hours_with_minutes(self, cog: Any) -> None:
-        """Test formatting hours and minutes."""
-        assert cog._format_duration(3660) == "1h 1m"  # 1 hour 1 minute
-
-    def test_format_hours_boundary(self, cog: Any) -> None:
-        """Test formatting 23 hours."""
-        assert cog._format_duration(23 * 3600) == "23 hours"
-
-    def test_format_day_singular(self, cog: Any) -> None:
-        """Test formatting 1 day."""
-        assert cog._format_duration(86400) == "1 day"
-
-    def test_format_days_plural(self, cog: Any) -> None:
-        """Test formatting multiple days."""
-        assert cog._format_duration(172800) == "2 days"
-
-    def test_format_days_with_hours(self, cog: Any) -> None:
-        """Test formatting days and hours."""
-        assert cog._format_duration(90000) == "1d 1h"  # 25 hours
+        return create_health_cog(health_cog_cls, mock_bot)
+
+    @pytest.mark.parametrize(
+        "seconds,expected",
+        [
+            (1, "1 second"),
+            (45, "45 seconds"),
+            (60, "1 minute"),
+            (120, "2 minutes"),
+            (59 * 60, "59 minutes"),
+            (3600, "1 hour"),
+            (7200, "2 hours"),
+            (3660, "1h 1m"),  # 1 hour 1 minute
+            (23 * 3600, "23 hours"),
+            (86400, "1 day"),
+            (172800, "2 days"),
+            (90000, "1d 1h"),  # 25 hours
+        ],
+    )
+    def test_format_duration(self, cog: Any, seconds: int, expected: str) -> None:
+        """Test formatting durations across unit boundaries."""
+        assert cog._format_duration(seconds) == expected
 
 
 # =============================================================================
@@ -109,39 +94,39 @@ class TestHandleServerOnline:
     """Tests for _handle_server_online method."""
 
     @pytest.fixture
-    def cog(self, mock_bot: MagicMock) -> Any:
+    def cog(self, health_cog_cls: Any, mock_bot: MagicMock) -> Any:
         """Create a test cog."""
-        return create_health_cog(mock_bot)
+        return create_health_cog(health_cog_cls, mock_bot)
 
     @pytest.mark.asyncio
     async def test_updates_state_to_online(
         self, cog: Any, server_info: ServerInfo
     ) -> None:
         """Test that server state is updated to online."""
-        cog._server_online = None
+        cog._state.online = None
 
         await cog._handle_server_online(server_info)
 
-        assert cog._server_online is True
+        assert cog._state.online is True
 
     @pytest.mark.asyncio
     async def test_updates_last_online_time(
         self, cog: Any, server_info: ServerInfo
     ) -> None:
         """Test that last_online timestamp is updated."""
-        cog._server_online = None
-        cog._last_online = None
+        cog._state.online = None
+        cog._state.last_online = None
 
         await cog._handle_server_online(server_info)
 
-        assert cog._last_online is not None
+        assert cog._state.last_online is not None
 
     @pytest.mark.asyncio
     async def test_no_notification_when_already_online(
         self, cog: Any, server_info: ServerInfo, mock_bot: MagicMock
     ) -> None:
         """Test no notification when server was already online."""
-        cog._server_online = True
+        cog._state.online = True
 
         with patch.object(cog, "_send_online_notification") as mock_notify:
             await cog._handle_server_online(server_info)
@@ -152,7 +137,7 @@ class TestHandleServerOnline:
         self, cog: Any, server_info: ServerInfo
     ) -> None:
         """Test notification is sent when server recovers."""
-        cog._server_online = False
+        cog._state.online = False
 
         with patch.object(
             cog, "_send_online_notification", new_callable=AsyncMock
@@ -165,7 +150,7 @@ class TestHandleServerOnline:
         self, cog: Any, server_info: ServerInfo
     ) -> None:
         """Test no notification on initial online state (unknown -> online)."""
-        cog._server_online = None
+        cog._state.online = None
 
         with patch.object(cog, "_send_online_notification") as mock_notify:
             await cog._handle_server_online(server_info)
@@ -176,13 +161,13 @@ class TestHandleServerOnline:
         self, cog: Any, server_info: ServerInfo
     ) -> None:
         """Test _went_offline is cleared on recovery."""
-        cog._server_online = False
-        cog._went_offline = datetime.now(timezone.utc)
+        cog._state.online = False
+        cog._state.went_offline = datetime.now(timezone.utc)
 
         with patch.object(cog, "_send_online_notification", new_callable=AsyncMock):
             await cog._handle_server_online(server_info)
 
-        assert cog._went_offline is None
+        assert cog._state.went_offline is None
 
 
 # =============================================================================
@@ -194,35 +179,35 @@ class TestHandleServerOffline:
     """Tests for _handle_server_offline method."""
 
     @pytest.fixture
-    def cog(self, mock_bot: MagicMock) -> Any:
+    def cog(self, health_cog_cls: Any, mock_bot: MagicMock) -> Any:
         """Create a test cog."""
-        return create_health_cog(mock_bot)
+        return create_health_cog(health_cog_cls, mock_bot)
 
     @pytest.mark.asyncio
     async def test_updates_state_to_offline(self, cog: Any) -> None:
         """Test that server state is updated to offline."""
-        cog._server_online = True
+        cog._state.online = True
 
         with patch.object(cog, "_send_offline_notification", new_callable=AsyncMock):
             await cog._handle_server_offline("Connection refused")
 
-        assert cog._server_online is False
+        assert cog._state.online is False
 
     @pytest.mark.asyncio
     async def test_sets_went_offline_time(self, cog: Any) -> None:
         """Test that _went_offline timestamp is set."""
-        cog._server_online = True
-        cog._went_offline = None
+        cog._state.online = True
+        cog._state.went_offline = None
 
         with patch.object(cog, "_send_offline_notification", new_callable=AsyncMock):
             await cog._handle_server_offline("Connection refused")
 
-        assert cog._went_offline is not None
+        assert cog._state.went_offline is not None
 
     @pytest.mark.asyncio
     async def test_notification_when_online_to_offline(self, cog: Any) -> None:
         """Test notification when server goes from online to offline."""
-        cog._server_online = True
+        cog._state.online = True
 
         with patch.object(
             cog, "_send_offline_notification", new_callable=AsyncMock
@@ -233,7 +218,7 @@ class TestHandleServerOffline:
     @pytest.mark.asyncio
     async def test_notification_when_unknown_to_offline(self, cog: Any) -> None:
         """Test notification when server goes from unknown to offline."""
-        cog._server_online = None
+        cog._state.online = None
 
         with patch.object(
             cog, "_send_offline_notification", new_callable=AsyncMock
@@ -244,7 +229,7 @@ class TestHandleServerOffline:
     @pytest.mark.asyncio
     async def test_no_notification_when_already_offline(self, cog: Any) -> None:
         """Test no notification when server is still offline."""
-        cog._server_online = False
+        cog._state.online = False
 
         with patch.object(cog, "_send_offline_notification") as mock_notify:
             await cog._handle_server_offline("Still offline")
@@ -260,9 +245,9 @@ class TestRunHealthCheck:
     """Tests for _run_health_check method."""
 
     @pytest.fixture
-    def cog(self, mock_bot: MagicMock) -> Any:
+    def cog(self, health_cog_cls: Any, mock_bot: MagicMock) -> Any:
         """Create a test cog."""
-        return create_health_cog(mock_bot)
+        return create_health_cog(health_cog_cls, mock_bot)
 
     @pytest.mark.asyncio
     async def test_calls_handle_online_on_success(
@@ -310,12 +295,12 @@ class TestRunHealthCheck:
     ) -> None:
         """Test server info is stored on successful check."""
         cog.bot.jellyfin_service.check_health = AsyncMock(return_value=server_info)
-        cog._last_server_info = None
+        cog._state.last_server_info = None
 
         with patch.object(cog, "_handle_server_online", new_callable=AsyncMock):
             await cog._run_health_check()
 
-        assert cog._last_server_info == server_info
+        assert cog._state.last_server_info == server_info
 
 
 # =============================================================================
@@ -327,9 +312,9 @@ class TestSendOnlineNotification:
     """Tests for _send_online_notification method."""
 
     @pytest.fixture
-    def cog(self, mock_bot: MagicMock) -> Any:
+    def cog(self, health_cog_cls: Any, mock_bot: MagicMock) -> Any:
         """Create a test cog."""
-        return create_health_cog(mock_bot)
+        return create_health_cog(health_cog_cls, mock_bot)
 
     @pytest.mark.asyncio
     async def test_returns_early_if_no_channel(
@@ -374,7 +359,7 @@ class TestSendOnlineNotification:
         await cog._send_online_notification(server_info, downtime)
 
         embed = mock_discord_channel.send.call_args.kwargs["embed"]
-        downtime_field = next((f for f in embed.fields if f.name == "Downtime"), None)
+        downtime_field = _fields_by_name(embed).get("Downtime")
         assert downtime_field is not None
 
 
@@ -382,9 +367,9 @@ class TestSendOfflineNotification:
     """Tests for _send_offline_notification method."""
 
     @pytest.fixture
-    def cog(self, mock_bot: MagicMock) -> Any:
+    def cog(self, health_cog_cls: Any, mock_bot: MagicMock) -> Any:
         """Create a test cog."""
-        return create_health_cog(mock_bot)
+        return create_health_cog(health_cog_cls, mock_bot)
 
     @pytest.mark.asyncio
     async def test_returns_early_if_no_channel(
@@ -420,7 +405,7 @@ class TestSendOfflineNotification:
         await cog._send_offline_notification("Connection refused")
 
         embed = mock_discord_channel.send.call_args.kwargs["embed"]
-        error_field = next((f for f in embed.fields if f.name == "Error"), None)
+        error_field = _fields_by_name(embed).get("Error")
         assert error_field is not None
         assert "Connection refused" in error_field.value
 
@@ -430,12 +415,10 @@ class TestSendOfflineNotification:
     ) -> None:
         """Test includes last online time if available."""
         mock_bot.get_channel.return_value = mock_discord_channel
-        cog._last_online = datetime.now(timezone.utc)
+        cog._state.last_online = datetime.now(timezone.utc)
 
         await cog._send_offline_notification("Connection refused")
 
         embed = mock_discord_channel.send.call_args.kwargs["embed"]
-        last_online_field = next(
-            (f for f in embed.fields if f.name == "Last Online"), None
-        )
+        last_online_field = _fields_by_name(embed).get("Last Online")
         assert last_online_field is not None
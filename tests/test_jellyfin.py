@@ -9,16 +9,24 @@ Tests cover:
     - URL building methods
 """
 
-import re
+import asyncio
+import time
 
+import orjson
 import pytest
+import pytest_asyncio
+from collections.abc import Callable
 from datetime import datetime, timezone, timedelta
+from typing import Any, ClassVar
 from unittest.mock import MagicMock
 
 import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 from aioresponses import aioresponses
 
 from bot.services.jellyfin import (
+    CircuitBreaker,
     JellyfinClient,
     JellyfinItem,
     JellyfinService,
@@ -28,6 +36,13 @@ from bot.services.jellyfin import (
     JellyfinAuthError,
 )
 
+# Jellyfin-style timestamps computed once at import; the recency window in
+# the tests is 24 hours, so these stay on the right side of the cutoff for
+# any realistic suite runtime.
+_DATE_FMT = "%Y-%m-%dT%H:%M:%S.0000000Z"
+_RECENT_ISO = datetime.now(timezone.utc).strftime(_DATE_FMT)
+_OLD_ISO = (datetime.now(timezone.utc) - timedelta(hours=48)).strftime(_DATE_FMT)
+
 
 # =============================================================================
 # JellyfinItem Tests
@@ -211,17 +226,18 @@ class TestJellyfinClientInit:
 # =============================================================================
 
 
+@pytest.fixture(scope="module")
+def client() -> JellyfinClient:
+    """Shared client for URL-building and parsing tests (never opens a session)."""
+    return JellyfinClient(
+        base_url="http://localhost:8096",
+        api_key="test-key",
+    )
+
+
 class TestJellyfinClientUrls:
     """Tests for JellyfinClient URL building methods."""
 
-    @pytest.fixture
-    def client(self) -> JellyfinClient:
-        """Create a test client."""
-        return JellyfinClient(
-            base_url="http://localhost:8096",
-            api_key="test-key",
-        )
-
     def test_get_item_image_url_default(self, client: JellyfinClient) -> None:
         """Test building image URL with defaults."""
         url = client.get_item_image_url("item-123")
@@ -291,481 +307,534 @@ class TestJellyfinClientUrls:
 # =============================================================================
 
 
-class TestJellyfinClientHttp:
-    """Tests for JellyfinClient HTTP operations."""
+def _json_body(payload: dict) -> dict:
+    """
+    Pre-serialize a JSON payload for aioresponses mocks.
 
-    @pytest.fixture
-    def client(self) -> JellyfinClient:
-        """Create a test client."""
-        return JellyfinClient(
-            base_url="http://localhost:8096",
-            api_key="test-key",
+    Returns kwargs to spread into mock_aioresponse.get(...) so constant payloads are
+    serialized once with orjson instead of json.dumps on every replay.
+    """
+    return {"body": orjson.dumps(payload), "content_type": "application/json"}
+
+
+def _json_handler(payload: dict) -> Callable:
+    """Create a stub route handler returning a fixed JSON payload."""
+    body = orjson.dumps(payload)
+
+    async def handler(request: web.Request) -> web.Response:
+        return web.Response(body=body, content_type="application/json")
+
+    return handler
+
+
+def _json_by_type_handler(payloads: dict[str, dict]) -> Callable:
+    """
+    Create a stub /Items handler keyed on the IncludeItemTypes query param.
+
+    The multi-type client methods fan out concurrently, so responses must
+    be matched by requested type rather than call order. Payloads are
+    serialized once when the handler is built.
+    """
+    bodies = {key: orjson.dumps(value) for key, value in payloads.items()}
+
+    async def handler(request: web.Request) -> web.Response:
+        return web.Response(
+            body=bodies[request.query["IncludeItemTypes"]],
+            content_type="application/json",
         )
 
-    @pytest.mark.asyncio
-    async def test_check_health_success(self, client: JellyfinClient) -> None:
-        """Test successful health check."""
-        with aioresponses() as mocked:
-            mocked.get(
-                "http://localhost:8096/System/Info",
-                payload={
-                    "ServerName": "Test Server",
-                    "Version": "10.8.13",
-                    "OperatingSystem": "Linux",
-                },
-            )
+    return handler
 
-            info = await client.check_health()
 
-            assert info.server_name == "Test Server"
-            assert info.version == "10.8.13"
-            assert info.operating_system == "Linux"
+@pytest.fixture
+def mock_aioresponse() -> Any:
+    """Yield an aioresponses mock, patching aiohttp once per test."""
+    with aioresponses() as mock:
+        yield mock
 
-        await client.close()
 
-    @pytest.mark.asyncio
-    async def test_check_health_default_values(self, client: JellyfinClient) -> None:
-        """Test health check with missing response fields."""
-        with aioresponses() as mocked:
-            mocked.get(
-                "http://localhost:8096/System/Info",
-                payload={},
-            )
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def _jellyfin_stub_env() -> Any:
+    """
+    Module-scoped stub server + client shared by the HTTP tests.
 
-            info = await client.check_health()
+    One aiohttp TestServer and one JellyfinClient are created per module
+    and reused across tests, amortizing session/connector setup. Routes
+    dispatch through a mutable table that each test fills via the
+    jellyfin_stub fixture below.
+    """
+    routes: dict[str, Callable] = {}
 
-            assert info.server_name == "Jellyfin"
-            assert info.version == "Unknown"
-            assert info.operating_system is None
+    async def dispatch(request: web.Request) -> web.Response:
+        handler = routes.get(request.path)
+        if handler is None:
+            return web.Response(status=404)
+        return await handler(request)
 
-        await client.close()
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", dispatch)
+    server = TestServer(app)
+    await server.start_server()
+    client = JellyfinClient(
+        base_url=str(server.make_url("/")),
+        api_key="test-key",
+    )
 
-    @pytest.mark.asyncio
-    async def test_check_health_auth_error_401(self, client: JellyfinClient) -> None:
+    yield routes, client
+
+    await client.close()
+    await server.close()
+
+
+@pytest.fixture
+def jellyfin_stub(_jellyfin_stub_env: Any) -> Any:
+    """
+    Factory mapping endpoint paths to handlers on the shared stub server.
+
+    Resets the route table and the client's per-instance breaker state
+    before each test, then returns a factory that installs the test's
+    routes and hands back the connected client.
+    """
+    routes, client = _jellyfin_stub_env
+    routes.clear()
+    client._breaker = CircuitBreaker()
+    client._bulkhead = None
+
+    async def make(new_routes: dict[str, Callable]) -> JellyfinClient:
+        routes.update(new_routes)
+        return client
+
+    return make
+
+
+class TestJellyfinClientHttp:
+    """Tests for JellyfinClient HTTP operations."""
+
+    async def test_check_health_success(self, jellyfin_stub: Any) -> None:
+        """Test successful health check."""
+        client = await jellyfin_stub(
+            {
+                "/System/Info": _json_handler(
+                    {
+                        "ServerName": "Test Server",
+                        "Version": "10.8.13",
+                        "OperatingSystem": "Linux",
+                    }
+                )
+            }
+        )
+
+        info = await client.check_health()
+
+        assert info.server_name == "Test Server"
+        assert info.version == "10.8.13"
+        assert info.operating_system == "Linux"
+
+    async def test_check_health_default_values(self, jellyfin_stub: Any) -> None:
+        """Test health check with missing response fields."""
+        client = await jellyfin_stub({"/System/Info": _json_handler({})})
+
+        info = await client.check_health()
+
+        assert info.server_name == "Jellyfin"
+        assert info.version == "Unknown"
+        assert info.operating_system is None
+
+    async def test_check_health_auth_error_401(self, jellyfin_stub: Any) -> None:
         """Test health check returns auth error on 401."""
-        with aioresponses() as mocked:
-            mocked.get(
-                "http://localhost:8096/System/Info",
-                status=401,
-            )
 
-            with pytest.raises(JellyfinAuthError) as exc_info:
-                await client.check_health()
+        async def unauthorized(request: web.Request) -> web.Response:
+            return web.Response(status=401)
 
-            assert "Invalid API key" in str(exc_info.value)
+        client = await jellyfin_stub({"/System/Info": unauthorized})
 
-        await client.close()
+        with pytest.raises(JellyfinAuthError) as exc_info:
+            await client.check_health()
 
-    @pytest.mark.asyncio
-    async def test_check_health_auth_error_403(self, client: JellyfinClient) -> None:
+        assert "Invalid API key" in str(exc_info.value)
+
+    async def test_check_health_auth_error_403(self, jellyfin_stub: Any) -> None:
         """Test health check returns auth error on 403."""
-        with aioresponses() as mocked:
-            mocked.get(
-                "http://localhost:8096/System/Info",
-                status=403,
-            )
 
-            with pytest.raises(JellyfinAuthError) as exc_info:
-                await client.check_health()
+        async def forbidden(request: web.Request) -> web.Response:
+            return web.Response(status=403)
 
-            assert "Access forbidden" in str(exc_info.value)
+        client = await jellyfin_stub({"/System/Info": forbidden})
 
-        await client.close()
+        with pytest.raises(JellyfinAuthError) as exc_info:
+            await client.check_health()
 
-    @pytest.mark.asyncio
-    async def test_check_health_api_error(self, client: JellyfinClient) -> None:
+        assert "Access forbidden" in str(exc_info.value)
+
+    async def test_check_health_api_error(self, jellyfin_stub: Any) -> None:
         """Test health check returns error on 500."""
-        with aioresponses() as mocked:
-            mocked.get(
-                "http://localhost:8096/System/Info",
-                status=500,
-                body="Internal Server Error",
-            )
 
-            with pytest.raises(JellyfinError) as exc_info:
-                await client.check_health()
+        async def server_error(request: web.Request) -> web.Response:
+            return web.Response(status=500, text="Internal Server Error")
 
-            assert "API error 500" in str(exc_info.value)
+        client = await jellyfin_stub({"/System/Info": server_error})
 
-        await client.close()
+        with pytest.raises(JellyfinError) as exc_info:
+            await client.check_health()
 
-    @pytest.mark.asyncio
-    async def test_check_health_connection_error(self, client: JellyfinClient) -> None:
+        assert "API error 500" in str(exc_info.value)
+
+    async def test_check_health_connection_error(self) -> None:
         """Test health check returns connection error when unreachable."""
-        with aioresponses() as mocked:
-            mocked.get(
-                "http://localhost:8096/System/Info",
-                exception=aiohttp.ClientConnectorError(
-                    MagicMock(), OSError("Connection refused")
-                ),
-            )
+        # Nothing listens on port 1, so the connect is refused immediately
+        client = JellyfinClient(
+            base_url="http://127.0.0.1:1",
+            api_key="test-key",
+        )
 
-            with pytest.raises(JellyfinConnectionError) as exc_info:
-                await client.check_health()
+        with pytest.raises(JellyfinConnectionError) as exc_info:
+            await client.check_health()
 
-            assert "Cannot connect to Jellyfin" in str(exc_info.value)
+        assert "Cannot connect to Jellyfin" in str(exc_info.value)
 
         await client.close()
 
-    @pytest.mark.asyncio
-    async def test_get_recent_items_success(self, client: JellyfinClient) -> None:
-        """Test getting recent items successfully."""
-        with aioresponses() as mocked:
-            mocked.get(
-                re.compile(r"^http://localhost:8096/Items\?.*"),
-                payload={
-                    "Items": [
-                        {
-                            "Id": "movie-1",
-                            "Name": "Test Movie",
-                            "Type": "Movie",
-                            "ProductionYear": 2024,
-                            "Overview": "A test movie.",
-                            # Set date_created to "now" so it passes the filter
-                            "DateCreated": datetime.now(timezone.utc).strftime(
-                                "%Y-%m-%dT%H:%M:%S.0000000Z"
-                            ),
-                        }
-                    ],
-                    "TotalRecordCount": 1,
-                },
-            )
+    async def test_check_health_timeout(self, mock_aioresponse: aioresponses) -> None:
+        """Test that request timeouts map to JellyfinConnectionError."""
+        client = JellyfinClient(
+            base_url="http://localhost:8096",
+            api_key="test-key",
+        )
 
-            items = await client.get_recent_items("Movie", hours=24)
+        mock_aioresponse.get(
+            "http://localhost:8096/System/Info",
+            exception=asyncio.TimeoutError(),
+            repeat=True,
+        )
+
+        with pytest.raises(JellyfinConnectionError) as exc_info:
+            await client.check_health()
 
-            assert len(items) == 1
-            assert items[0].id == "movie-1"
-            assert items[0].name == "Test Movie"
-            assert items[0].item_type == "Movie"
-            assert items[0].year == 2024
-            assert items[0].overview == "A test movie."
-            assert items[0].date_created is not None
+        assert "Jellyfin timeout" in str(exc_info.value)
 
         await client.close()
 
-    @pytest.mark.asyncio
-    async def test_get_recent_items_filters_old_items(
-        self, client: JellyfinClient
-    ) -> None:
-        """Test that old items are filtered out client-side."""
-        with aioresponses() as mocked:
-            mocked.get(
-                re.compile(r"^http://localhost:8096/Items\?.*"),
-                payload={
+    async def test_get_recent_items_success(self, jellyfin_stub: Any) -> None:
+        """Test getting recent items successfully."""
+        client = await jellyfin_stub(
+            {
+                "/Items": _json_handler(
+                    {
+                        "Items": [
+                            {
+                                "Id": "movie-1",
+                                "Name": "Test Movie",
+                                "Type": "Movie",
+                                "ProductionYear": 2024,
+                                "Overview": "A test movie.",
+                                # Dated "now" so it passes the filter
+                                "DateCreated": _RECENT_ISO,
+                            }
+                        ],
+                        "TotalRecordCount": 1,
+                    }
+                )
+            }
+        )
+
+        items = await client.get_recent_items("Movie", hours=24)
+
+        assert len(items) == 1
+        assert items[0].id == "movie-1"
+        assert items[0].name == "Test Movie"
+        assert items[0].item_type == "Movie"
+        assert items[0].year == 2024
+        assert items[0].overview == "A test movie."
+        assert items[0].date_created is not None
+
+    async def test_get_recent_items_empty(self, jellyfin_stub: Any) -> None:
+        """Test getting recent items when none exist."""
+        client = await jellyfin_stub(
+            {"/Items": _json_handler({"Items": [], "TotalRecordCount": 0})}
+        )
+
+        items = await client.get_recent_items("Movie", hours=24)
+
+        assert len(items) == 0
+
+    async def test_get_all_recent_items(self, jellyfin_stub: Any) -> None:
+        """Test getting recent items for multiple content types."""
+
+        # One batched /Items response covering all requested types; the
+        # client splits it back into per-type buckets
+        async def mixed_items(request: web.Request) -> web.Response:
+            assert request.query["IncludeItemTypes"] == "Movie,Series,Audio"
+            return web.json_response(
+                {
                     "Items": [
                         {
-                            "Id": "movie-1",
-                            "Name": "Recent Movie",
+                            "Id": "m1",
+                            "Name": "Movie 1",
                             "Type": "Movie",
-                            # Recent: within 24 hours
-                            "DateCreated": datetime.now(timezone.utc).strftime(
-                                "%Y-%m-%dT%H:%M:%S.0000000Z"
-                            ),
+                            "DateCreated": _RECENT_ISO,
                         },
                         {
-                            "Id": "movie-2",
-                            "Name": "Old Movie",
-                            "Type": "Movie",
-                            # Old: 48 hours ago (outside 24-hour window)
-                            "DateCreated": (
-                                datetime.now(timezone.utc) - timedelta(hours=48)
-                            ).strftime("%Y-%m-%dT%H:%M:%S.0000000Z"),
+                            "Id": "s1",
+                            "Name": "Series 1",
+                            "Type": "Series",
+                            "DateCreated": _RECENT_ISO,
                         },
                     ],
-                    "TotalRecordCount": 2,
-                },
+                }
             )
 
-            items = await client.get_recent_items("Movie", hours=24)
+        client = await jellyfin_stub({"/Items": mixed_items})
 
-            # Only the recent movie should be included
-            assert len(items) == 1
-            assert items[0].name == "Recent Movie"
+        results = await client.get_all_recent_items(
+            content_types=["Movie", "Series", "Audio"],
+            hours=24,
+        )
 
-        await client.close()
+        assert "Movie" in results
+        assert "Series" in results
+        # Audio should not be in results since it's empty
+        assert "Audio" not in results
+        assert len(results["Movie"]) == 1
+        assert len(results["Series"]) == 1
 
-    @pytest.mark.asyncio
-    async def test_get_recent_items_inherits_date_from_previous(
-        self, client: JellyfinClient
-    ) -> None:
-        """Test that items without date_created inherit from previous item."""
-        recent_date = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.0000000Z")
+    async def test_get_random_item_success(self, jellyfin_stub: Any) -> None:
+        """Test getting a random item."""
+        client = await jellyfin_stub(
+            {
+                "/Items": _json_handler(
+                    {
+                        "Items": [
+                            {
+                                "Id": "random-movie",
+                                "Name": "Random Movie",
+                                "Type": "Movie",
+                                "ProductionYear": 2024,
+                            }
+                        ],
+                        "TotalRecordCount": 1,
+                    }
+                )
+            }
+        )
 
-        with aioresponses() as mocked:
-            mocked.get(
-                re.compile(r"^http://localhost:8096/Items\?.*"),
-                payload={
-                    "Items": [
-                        {
-                            "Id": "movie-1",
-                            "Name": "Movie With Date",
-                            "Type": "Movie",
-                            "DateCreated": recent_date,
+        item = await client.get_random_item("Movie")
+
+        assert item is not None
+        assert item.id == "random-movie"
+        assert item.name == "Random Movie"
+        assert item.item_type == "Movie"
+        assert item.year == 2024
+
+    async def test_get_random_item_empty(self, jellyfin_stub: Any) -> None:
+        """Test getting a random item when library is empty."""
+        client = await jellyfin_stub(
+            {"/Items": _json_handler({"Items": [], "TotalRecordCount": 0})}
+        )
+
+        item = await client.get_random_item("Movie")
+
+        assert item is None
+
+    async def test_get_random_items_by_type(self, jellyfin_stub: Any) -> None:
+        """Test getting random items for multiple content types."""
+        client = await jellyfin_stub(
+            {
+                "/Items": _json_by_type_handler(
+                    {
+                        "Movie": {
+                            "Items": [
+                                {
+                                    "Id": "movie-1",
+                                    "Name": "Random Movie",
+                                    "Type": "Movie",
+                                }
+                            ],
                         },
-                        {
-                            "Id": "movie-2",
-                            "Name": "Movie Without Date",
-                            "Type": "Movie",
-                            # No DateCreated - should inherit from movie-1
+                        "Series": {
+                            "Items": [
+                                {
+                                    "Id": "series-1",
+                                    "Name": "Random Series",
+                                    "Type": "Series",
+                                }
+                            ],
                         },
-                    ],
-                    "TotalRecordCount": 2,
-                },
-            )
+                        "MusicAlbum": {"Items": []},  # No albums
+                    }
+                )
+            }
+        )
 
-            items = await client.get_recent_items("Movie", hours=24)
+        results = await client.get_random_items_by_type(
+            ["Movie", "Series", "MusicAlbum"]
+        )
 
-            # Both movies should be included (second inherits date from first)
-            assert len(items) == 2
-            assert items[0].name == "Movie With Date"
-            assert items[1].name == "Movie Without Date"
+        assert "Movie" in results
+        assert "Series" in results
+        assert "MusicAlbum" not in results  # Empty
+        assert results["Movie"].name == "Random Movie"
+        assert results["Series"].name == "Random Series"
 
-        await client.close()
 
-    @pytest.mark.asyncio
-    async def test_get_recent_items_skips_undated_at_start(
-        self, client: JellyfinClient
+class TestJellyfinClientCircuitBreaker:
+    """Tests for the circuit breaker on the client HTTP path."""
+
+    async def test_opens_after_threshold_failures(self, jellyfin_stub: Any) -> None:
+        """Test that the breaker fails fast once the threshold is hit."""
+        calls = 0
+
+        async def failing(request: web.Request) -> web.Response:
+            nonlocal calls
+            calls += 1
+            return web.Response(status=500, text="boom")
+
+        client = await jellyfin_stub({"/System/Info": failing})
+        client._breaker = CircuitBreaker(threshold=2, recovery_seconds=30.0)
+
+        for _ in range(2):
+            with pytest.raises(JellyfinError):
+                await client.check_health()
+
+        # Breaker is now open - the next call short-circuits without HTTP
+        with pytest.raises(JellyfinConnectionError) as exc_info:
+            await client.check_health()
+
+        assert "circuit breaker is open" in str(exc_info.value)
+        assert calls == 2
+
+    async def test_probe_closes_breaker_after_recovery(
+        self, jellyfin_stub: Any
     ) -> None:
-        """Test that items without date_created at start are skipped."""
-        recent_date = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.0000000Z")
+        """Test that a successful probe after the window closes the breaker."""
+        client = await jellyfin_stub(
+            {"/System/Info": _json_handler({"ServerName": "Back", "Version": "10.8.0"})}
+        )
+        client._breaker = CircuitBreaker(threshold=1, recovery_seconds=30.0)
 
-        with aioresponses() as mocked:
-            mocked.get(
-                re.compile(r"^http://localhost:8096/Items\?.*"),
-                payload={
-                    "Items": [
-                        {
-                            "Id": "movie-1",
-                            "Name": "First Movie Without Date",
-                            "Type": "Movie",
-                            # No DateCreated and no previous item - should be skipped
-                        },
-                        {
-                            "Id": "movie-2",
-                            "Name": "Movie With Date",
-                            "Type": "Movie",
-                            "DateCreated": recent_date,
-                        },
-                        {
-                            "Id": "movie-3",
-                            "Name": "Third Movie Without Date",
-                            "Type": "Movie",
-                            # No DateCreated but previous item has date - should inherit
-                        },
-                    ],
-                    "TotalRecordCount": 3,
-                },
-            )
+        # Simulate an open breaker whose recovery window has elapsed
+        client._breaker.on_failure()
+        client._breaker._opened_at = time.monotonic() - 60.0
 
-            items = await client.get_recent_items("Movie", hours=24)
+        info = await client.check_health()
 
-            # First item skipped (no date, nothing to inherit)
-            # Second and third included (third inherits from second)
-            assert len(items) == 2
-            assert items[0].name == "Movie With Date"
-            assert items[1].name == "Third Movie Without Date"
+        assert info.server_name == "Back"
+        assert client._breaker._opened_at is None
 
-        await client.close()
 
-    @pytest.mark.asyncio
-    async def test_get_recent_items_empty(self, client: JellyfinClient) -> None:
-        """Test getting recent items when none exist."""
-        with aioresponses() as mocked:
-            mocked.get(
-                re.compile(r"^http://localhost:8096/Items\?.*"),
-                payload={
-                    "Items": [],
-                    "TotalRecordCount": 0,
-                },
-            )
+class TestJellyfinClientBulkhead:
+    """Tests for the in-flight request bulkhead."""
 
-            items = await client.get_recent_items("Movie", hours=24)
+    async def test_concurrency_is_bounded(self, jellyfin_stub: Any) -> None:
+        """Test that concurrent requests never exceed the bulkhead limit."""
+        in_flight = 0
+        peak = 0
 
-            assert len(items) == 0
+        async def tracking(request: web.Request) -> web.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return web.json_response({"ServerName": "Test", "Version": "10.8.0"})
 
-        await client.close()
+        client = await jellyfin_stub({"/System/Info": tracking})
 
-    @pytest.mark.asyncio
-    async def test_get_all_recent_items(self, client: JellyfinClient) -> None:
-        """Test getting recent items for multiple content types."""
-        recent_date = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.0000000Z")
-
-        with aioresponses() as mocked:
-            # Mock all three requests (Movie, Series, Audio)
-            # aioresponses will handle them in order
-            mocked.get(
-                re.compile(r"^http://localhost:8096/Items\?.*"),
-                payload={
-                    "Items": [
-                        {
-                            "Id": "m1",
-                            "Name": "Movie 1",
-                            "Type": "Movie",
-                            "DateCreated": recent_date,
-                        }
-                    ],
-                },
-            )
-            mocked.get(
-                re.compile(r"^http://localhost:8096/Items\?.*"),
-                payload={
-                    "Items": [
-                        {
-                            "Id": "s1",
-                            "Name": "Series 1",
-                            "Type": "Series",
-                            "DateCreated": recent_date,
-                        }
-                    ],
-                },
-            )
-            mocked.get(
-                re.compile(r"^http://localhost:8096/Items\?.*"),
-                payload={"Items": []},
-            )
+        await asyncio.gather(*(client.check_health() for _ in range(16)))
 
-            results = await client.get_all_recent_items(
-                content_types=["Movie", "Series", "Audio"],
-                hours=24,
-            )
+        assert peak <= 8
 
-            assert "Movie" in results
-            assert "Series" in results
-            # Audio should not be in results since it's empty
-            assert "Audio" not in results
-            assert len(results["Movie"]) == 1
-            assert len(results["Series"]) == 1
 
-        await client.close()
+class TestJellyfinClientRetry:
+    """Tests for transient-error retry on the client HTTP path."""
 
-    @pytest.mark.asyncio
-    async def test_get_random_item_success(self, client: JellyfinClient) -> None:
-        """Test getting a random item."""
-        with aioresponses() as mocked:
-            mocked.get(
-                re.compile(r"^http://localhost:8096/Items\?.*"),
-                payload={
-                    "Items": [
-                        {
-                            "Id": "random-movie",
-                            "Name": "Random Movie",
-                            "Type": "Movie",
-                            "ProductionYear": 2024,
-                        }
-                    ],
-                    "TotalRecordCount": 1,
-                },
-            )
+    async def test_retries_transient_503(self, jellyfin_stub: Any) -> None:
+        """Test that a 503 is retried and the next attempt can succeed."""
+        calls = 0
 
-            item = await client.get_random_item("Movie")
+        async def flaky(request: web.Request) -> web.Response:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                return web.Response(status=503, text="warming up")
+            return web.json_response({"ServerName": "Recovered", "Version": "10.8.0"})
 
-            assert item is not None
-            assert item.id == "random-movie"
-            assert item.name == "Random Movie"
-            assert item.item_type == "Movie"
-            assert item.year == 2024
+        client = await jellyfin_stub({"/System/Info": flaky})
 
-        await client.close()
+        info = await client.check_health()
 
-    @pytest.mark.asyncio
-    async def test_get_random_item_empty(self, client: JellyfinClient) -> None:
-        """Test getting a random item when library is empty."""
-        with aioresponses() as mocked:
-            mocked.get(
-                re.compile(r"^http://localhost:8096/Items\?.*"),
-                payload={
-                    "Items": [],
-                    "TotalRecordCount": 0,
-                },
+        assert info.server_name == "Recovered"
+        assert calls == 2
+
+    async def test_honors_retry_after_header(self, jellyfin_stub: Any) -> None:
+        """Test that a 503 Retry-After hint is parsed onto the error."""
+
+        async def unavailable(request: web.Request) -> web.Response:
+            return web.Response(
+                status=503,
+                text="maintenance",
+                headers={"Retry-After": "0"},
             )
 
-            item = await client.get_random_item("Movie")
+        client = await jellyfin_stub({"/System/Info": unavailable})
 
-            assert item is None
+        with pytest.raises(JellyfinError) as exc_info:
+            await client.check_health()
 
-        await client.close()
+        assert exc_info.value.status == 503
+        assert exc_info.value.retry_after == 0.0
 
-    @pytest.mark.asyncio
-    async def test_get_random_items_by_type(self, client: JellyfinClient) -> None:
-        """Test getting random items for multiple content types."""
-        with aioresponses() as mocked:
-            # Mock responses for each type
-            mocked.get(
-                re.compile(r"^http://localhost:8096/Items\?.*"),
-                payload={
-                    "Items": [
-                        {
-                            "Id": "movie-1",
-                            "Name": "Random Movie",
-                            "Type": "Movie",
-                        }
-                    ],
-                },
-            )
-            mocked.get(
-                re.compile(r"^http://localhost:8096/Items\?.*"),
-                payload={
-                    "Items": [
-                        {
-                            "Id": "series-1",
-                            "Name": "Random Series",
-                            "Type": "Series",
-                        }
-                    ],
-                },
-            )
-            mocked.get(
-                re.compile(r"^http://localhost:8096/Items\?.*"),
-                payload={"Items": []},  # No albums
-            )
+    async def test_does_not_retry_500(self, jellyfin_stub: Any) -> None:
+        """Test that a plain 500 surfaces immediately without retries."""
+        calls = 0
 
-            results = await client.get_random_items_by_type(
-                ["Movie", "Series", "MusicAlbum"]
-            )
+        async def server_error(request: web.Request) -> web.Response:
+            nonlocal calls
+            calls += 1
+            return web.Response(status=500, text="Internal Server Error")
 
-            assert "Movie" in results
-            assert "Series" in results
-            assert "MusicAlbum" not in results  # Empty
-            assert results["Movie"].name == "Random Movie"
-            assert results["Series"].name == "Random Series"
+        client = await jellyfin_stub({"/System/Info": server_error})
 
-        await client.close()
+        with pytest.raises(JellyfinError):
+            await client.check_health()
 
+        assert calls == 1
 
-class TestJellyfinClientContentTypeMapping:
-    """Tests for content type mapping."""
+    async def test_does_not_retry_auth_errors(self, jellyfin_stub: Any) -> None:
+        """Test that 401 responses are never retried."""
+        calls = 0
 
-    @pytest.fixture
-    def client(self) -> JellyfinClient:
-        """Create a test client."""
-        return JellyfinClient(
-            base_url="http://localhost:8096",
-            api_key="test-key",
-        )
+        async def unauthorized(request: web.Request) -> web.Response:
+            nonlocal calls
+            calls += 1
+            return web.Response(status=401)
 
-    def test_map_movie(self, client: JellyfinClient) -> None:
-        """Test mapping Movie type."""
-        assert client._map_content_type("Movie") == "Movie"
+        client = await jellyfin_stub({"/System/Info": unauthorized})
 
-    def test_map_series(self, client: JellyfinClient) -> None:
-        """Test mapping Series type."""
-        assert client._map_content_type("Series") == "Series"
+        with pytest.raises(JellyfinAuthError):
+            await client.check_health()
 
-    def test_map_audio(self, client: JellyfinClient) -> None:
-        """Test mapping Audio type."""
-        assert client._map_content_type("Audio") == "Audio"
+        assert calls == 1
 
-    def test_map_music_alias(self, client: JellyfinClient) -> None:
-        """Test Music maps to Audio."""
-        assert client._map_content_type("Music") == "Audio"
 
-    def test_map_music_album(self, client: JellyfinClient) -> None:
-        """Test MusicAlbum type mapping."""
-        assert client._map_content_type("MusicAlbum") == "MusicAlbum"
+class TestJellyfinClientContentTypeMapping:
+    """Tests for content type mapping."""
 
-    def test_map_unknown_passthrough(self, client: JellyfinClient) -> None:
-        """Test unknown types pass through unchanged."""
-        assert client._map_content_type("Unknown") == "Unknown"
+    @pytest.mark.parametrize(
+        "content_type, expected",
+        [
+            ("Movie", "Movie"),
+            ("Series", "Series"),
+            ("Audio", "Audio"),
+            ("Music", "Audio"),  # alias
+            ("MusicAlbum", "MusicAlbum"),
+            ("Unknown", "Unknown"),  # unknown types pass through
+        ],
+    )
+    def test_map_content_type(
+        self, client: JellyfinClient, content_type: str, expected: str
+    ) -> None:
+        """Test mapping of each supported content type and alias."""
+        assert client._map_content_type(content_type) == expected
 
 
 # =============================================================================
@@ -776,62 +845,133 @@ class TestJellyfinClientContentTypeMapping:
 class TestJellyfinClientDateParsing:
     """Tests for date parsing in item responses."""
 
-    @pytest.fixture
-    def client(self) -> JellyfinClient:
-        """Create a test client."""
-        return JellyfinClient(
-            base_url="http://localhost:8096",
-            api_key="test-key",
-        )
+    @pytest.mark.parametrize(
+        "date_str, expect_parsed",
+        [
+            ("2024-01-15T10:30:00.0000000Z", True),  # standard Jellyfin format
+            ("2024-01-15T10:30:00.1234567Z", True),  # 7 fractional digits
+            (None, False),  # missing date
+            ("invalid-date", False),  # invalid date must not raise
+        ],
+    )
+    def test_parse_date(
+        self, client: JellyfinClient, date_str: str | None, expect_parsed: bool
+    ) -> None:
+        """Test parsing of present, missing and malformed DateCreated values."""
+        data = {"Id": "test", "Name": "Test", "Type": "Movie"}
+        if date_str is not None:
+            data["DateCreated"] = date_str
 
-    def test_parse_standard_date(self, client: JellyfinClient) -> None:
-        """Test parsing standard Jellyfin date format."""
-        data = {
-            "Id": "test",
-            "Name": "Test",
-            "Type": "Movie",
-            "DateCreated": "2024-01-15T10:30:00.0000000Z",
-        }
         item = client._parse_item(data)
-        assert item.date_created is not None
-        assert item.date_created.year == 2024
-        assert item.date_created.month == 1
-        assert item.date_created.day == 15
-        assert item.date_created.hour == 10
-        assert item.date_created.minute == 30
-
-    def test_parse_date_with_7_decimal_places(self, client: JellyfinClient) -> None:
-        """Test parsing date with 7 decimal places (Jellyfin format)."""
-        data = {
-            "Id": "test",
-            "Name": "Test",
-            "Type": "Movie",
-            "DateCreated": "2024-01-15T10:30:00.1234567Z",
+
+        if expect_parsed:
+            assert item.date_created is not None
+            assert item.date_created.year == 2024
+            assert item.date_created.month == 1
+            assert item.date_created.day == 15
+            assert item.date_created.hour == 10
+            assert item.date_created.minute == 30
+        else:
+            assert item.date_created is None
+
+
+class TestJellyfinClientItemFiltering:
+    """Tests for /Items payload filtering, fed pre-parsed dicts.
+
+    These exercise _parse_items_response directly - the date inheritance
+    and cutoff logic need no HTTP layer.
+    """
+
+    _CUTOFF = datetime.now(timezone.utc) - timedelta(hours=24)
+
+    def test_filters_old_items(self, client: JellyfinClient) -> None:
+        """Test that old items are filtered out client-side."""
+        payload = {
+            "Items": [
+                {
+                    "Id": "movie-1",
+                    "Name": "Recent Movie",
+                    "Type": "Movie",
+                    # Recent: within 24 hours
+                    "DateCreated": _RECENT_ISO,
+                },
+                {
+                    "Id": "movie-2",
+                    "Name": "Old Movie",
+                    "Type": "Movie",
+                    # Old: 48 hours ago (outside 24-hour window)
+                    "DateCreated": _OLD_ISO,
+                },
+            ],
+            "TotalRecordCount": 2,
         }
-        item = client._parse_item(data)
-        assert item.date_created is not None
-
-    def test_parse_date_missing(self, client: JellyfinClient) -> None:
-        """Test parsing item without date."""
-        data = {
-            "Id": "test",
-            "Name": "Test",
-            "Type": "Movie",
+
+        items = client._parse_items_response(payload, self._CUTOFF)
+
+        # Only the recent movie should be included
+        assert len(items) == 1
+        assert items[0].name == "Recent Movie"
+
+    def test_inherits_date_from_previous(self, client: JellyfinClient) -> None:
+        """Test that items without date_created inherit from previous item."""
+        payload = {
+            "Items": [
+                {
+                    "Id": "movie-1",
+                    "Name": "Movie With Date",
+                    "Type": "Movie",
+                    "DateCreated": _RECENT_ISO,
+                },
+                {
+                    "Id": "movie-2",
+                    "Name": "Movie Without Date",
+                    "Type": "Movie",
+                    # No DateCreated - should inherit from movie-1
+                },
+            ],
+            "TotalRecordCount": 2,
         }
-        item = client._parse_item(data)
-        assert item.date_created is None
 
-    def test_parse_date_invalid(self, client: JellyfinClient) -> None:
-        """Test parsing item with invalid date (should not raise)."""
-        data = {
-            "Id": "test",
-            "Name": "Test",
-            "Type": "Movie",
-            "DateCreated": "invalid-date",
+        items = client._parse_items_response(payload, self._CUTOFF)
+
+        # Both movies should be included (second inherits date from first)
+        assert len(items) == 2
+        assert items[0].name == "Movie With Date"
+        assert items[1].name == "Movie Without Date"
+
+    def test_skips_undated_at_start(self, client: JellyfinClient) -> None:
+        """Test that items without date_created at start are skipped."""
+        payload = {
+            "Items": [
+                {
+                    "Id": "movie-1",
+                    "Name": "First Movie Without Date",
+                    "Type": "Movie",
+                    # No DateCreated and no previous item - skipped
+                },
+                {
+                    "Id": "movie-2",
+                    "Name": "Movie With Date",
+                    "Type": "Movie",
+                    "DateCreated": _RECENT_ISO,
+                },
+                {
+                    "Id": "movie-3",
+                    "Name": "Third Movie Without Date",
+                    "Type": "Movie",
+                    # No DateCreated but previous has date - inherits
+                },
+            ],
+            "TotalRecordCount": 3,
         }
-        # Should not raise, just set date_created to None
-        item = client._parse_item(data)
-        assert item.date_created is None
+
+        items = client._parse_items_response(payload, self._CUTOFF)
+
+        # First item skipped (no date, nothing to inherit)
+        # Second and third included (third inherits from second)
+        assert len(items) == 2
+        assert items[0].name == "Movie With Date"
+        assert items[1].name == "Third Movie Without Date"
 
 
 # =============================================================================
@@ -939,276 +1079,421 @@ class TestJellyfinServiceInit:
         assert service.active_url == "http://localhost:8096"
 
 
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def jellyfin_service_factory() -> Any:
+    """
+    Module-scoped factory for JellyfinService instances.
+
+    Services created through the factory are closed together at module
+    teardown, so individual tests skip the close boilerplate and the
+    event loop is shared across the module instead of being rebuilt per
+    test. The per-request mock setup stays per-test via aioresponses.
+    """
+    services: list[JellyfinService] = []
+
+    def make(urls: list[str]) -> JellyfinService:
+        service = JellyfinService(urls=urls, api_key="test-key")
+        services.append(service)
+        return service
+
+    yield make
+
+    for service in services:
+        await service.close()
+
+
 class TestJellyfinServiceResolveUrl:
     """Tests for JellyfinService.resolve_url() failover logic."""
 
-    @pytest.mark.asyncio
-    async def test_resolve_single_url_success(self) -> None:
+    async def test_resolve_single_url_success(
+        self, mock_aioresponse: aioresponses, jellyfin_service_factory: Any
+    ) -> None:
         """Test resolving with a single working URL."""
-        with aioresponses() as mocked:
-            mocked.get(
-                "http://localhost:8096/System/Info",
-                payload={"ServerName": "Test", "Version": "10.8.0"},
-            )
-
-            service = JellyfinService(
-                urls=["http://localhost:8096"],
-                api_key="test-key",
-            )
-            url = await service.resolve_url()
+        mock_aioresponse.get(
+            "http://localhost:8096/System/Info",
+            **_json_body({"ServerName": "Test", "Version": "10.8.0"}),
+        )
 
-            assert url == "http://localhost:8096"
-            assert service.active_url == "http://localhost:8096"
-            assert service._client is not None
+        service = jellyfin_service_factory(["http://localhost:8096"])
+        url = await service.resolve_url()
 
-            await service.close()
+        assert url == "http://localhost:8096"
+        assert service.active_url == "http://localhost:8096"
+        assert service._client is not None
 
-    @pytest.mark.asyncio
-    async def test_resolve_first_url_preferred(self) -> None:
+    async def test_resolve_first_url_preferred(
+        self, mock_aioresponse: aioresponses, jellyfin_service_factory: Any
+    ) -> None:
         """Test that the first URL is used when all URLs work."""
-        with aioresponses() as mocked:
-            mocked.get(
-                "http://primary:8096/System/Info",
-                payload={"ServerName": "Primary", "Version": "10.8.0"},
-            )
-            # Backup should not be called
-
-            service = JellyfinService(
-                urls=["http://primary:8096", "http://backup:8096"],
-                api_key="test-key",
-            )
-            url = await service.resolve_url()
+        mock_aioresponse.get(
+            "http://primary:8096/System/Info",
+            **_json_body({"ServerName": "Primary", "Version": "10.8.0"}),
+        )
+        # Backup should not be called
 
-            assert url == "http://primary:8096"
-            assert service.active_url == "http://primary:8096"
+        service = jellyfin_service_factory(
+            ["http://primary:8096", "http://backup:8096"]
+        )
+        url = await service.resolve_url()
 
-            await service.close()
+        assert url == "http://primary:8096"
+        assert service.active_url == "http://primary:8096"
 
-    @pytest.mark.asyncio
-    async def test_failover_to_second_url(self) -> None:
+    async def test_failover_to_second_url(
+        self, mock_aioresponse: aioresponses, jellyfin_service_factory: Any
+    ) -> None:
         """Test failover to second URL when first fails."""
-        with aioresponses() as mocked:
-            mocked.get(
-                "http://primary:8096/System/Info",
-                exception=aiohttp.ClientError("Connection refused"),
-            )
-            mocked.get(
-                "http://backup:8096/System/Info",
-                payload={"ServerName": "Backup", "Version": "10.8.0"},
-            )
+        mock_aioresponse.get(
+            "http://primary:8096/System/Info",
+            exception=aiohttp.ClientError("Connection refused"),
+        )
+        mock_aioresponse.get(
+            "http://backup:8096/System/Info",
+            **_json_body({"ServerName": "Backup", "Version": "10.8.0"}),
+        )
 
-            service = JellyfinService(
-                urls=["http://primary:8096", "http://backup:8096"],
-                api_key="test-key",
-            )
-            url = await service.resolve_url()
+        service = jellyfin_service_factory(
+            ["http://primary:8096", "http://backup:8096"]
+        )
+        url = await service.resolve_url()
 
-            assert url == "http://backup:8096"
-            assert service.active_url == "http://backup:8096"
+        assert url == "http://backup:8096"
+        assert service.active_url == "http://backup:8096"
 
-            await service.close()
+    async def test_probe_breaker_persists_across_resolves(
+        self, mock_aioresponse: aioresponses, jellyfin_service_factory: Any
+    ) -> None:
+        """Test that per-URL breakers survive probe client turnover."""
+        service = jellyfin_service_factory(["http://localhost:8096"])
 
-    @pytest.mark.asyncio
-    async def test_failover_to_third_url(self) -> None:
-        """Test failover to third URL when first two fail."""
-        with aioresponses() as mocked:
-            mocked.get(
-                "http://primary:8096/System/Info",
-                exception=aiohttp.ClientError("Connection refused"),
-            )
-            mocked.get(
-                "http://backup1:8096/System/Info",
-                status=500,
-            )
-            mocked.get(
-                "http://backup2:8096/System/Info",
-                payload={"ServerName": "Backup2", "Version": "10.8.0"},
+        for _ in range(2):
+            mock_aioresponse.get(
+                "http://localhost:8096/System/Info",
+                **_json_body({"ServerName": "Test", "Version": "10.8.0"}),
             )
-
-            service = JellyfinService(
-                urls=[
-                    "http://primary:8096",
-                    "http://backup1:8096",
-                    "http://backup2:8096",
-                ],
-                api_key="test-key",
+            await service.resolve_url()
+            # The fresh probe client must carry the service's breaker
+            # for its URL, not a blank per-client one
+            assert (
+                service._client._breaker is service._breakers["http://localhost:8096"]
             )
-            url = await service.resolve_url()
-
-            assert url == "http://backup2:8096"
-            assert service.active_url == "http://backup2:8096"
 
-            await service.close()
+    async def test_dead_url_skipped_during_cooldown(
+        self, mock_aioresponse: aioresponses, jellyfin_service_factory: Any
+    ) -> None:
+        """Test that a URL is skipped after enough consecutive failures."""
+        service = jellyfin_service_factory(
+            ["http://primary:8096", "http://backup:8096"]
+        )
 
-    @pytest.mark.asyncio
-    async def test_all_urls_fail_raises_error(self) -> None:
-        """Test that JellyfinConnectionError is raised when all URLs fail."""
-        with aioresponses() as mocked:
-            mocked.get(
+        # Fail the primary three times in a row, failing over to the
+        # backup each time
+        for _ in range(3):
+            mock_aioresponse.get(
                 "http://primary:8096/System/Info",
                 exception=aiohttp.ClientError("Connection refused"),
             )
-            mocked.get(
+            mock_aioresponse.get(
                 "http://backup:8096/System/Info",
-                exception=aiohttp.ClientError("Connection refused"),
+                **_json_body({"ServerName": "Backup", "Version": "10.8.0"}),
             )
+            assert await service.resolve_url() == "http://backup:8096"
 
-            service = JellyfinService(
-                urls=["http://primary:8096", "http://backup:8096"],
-                api_key="test-key",
-            )
+        assert service._health["http://primary:8096"].state == "dead"
 
-            with pytest.raises(JellyfinConnectionError) as exc_info:
-                await service.resolve_url()
+        # The next resolve must not probe the dead primary - only the
+        # backup is registered on mock_aioresponse, so a primary request
+        # would fail the test
+        mock_aioresponse.get(
+            "http://backup:8096/System/Info",
+            **_json_body({"ServerName": "Backup", "Version": "10.8.0"}),
+        )
+        assert await service.resolve_url() == "http://backup:8096"
 
-            assert "All Jellyfin URLs failed" in str(exc_info.value)
+        primary_calls = sum(
+            len(calls)
+            for key, calls in mock_aioresponse.requests.items()
+            if "primary" in str(key[1])
+        )
+        assert primary_calls == 3
 
-            await service.close()
+    async def test_failover_to_third_url(
+        self, mock_aioresponse: aioresponses, jellyfin_service_factory: Any
+    ) -> None:
+        """Test failover to third URL when first two fail."""
+        mock_aioresponse.get(
+            "http://primary:8096/System/Info",
+            exception=aiohttp.ClientError("Connection refused"),
+        )
+        mock_aioresponse.get(
+            "http://backup1:8096/System/Info",
+            status=500,
+        )
+        mock_aioresponse.get(
+            "http://backup2:8096/System/Info",
+            **_json_body({"ServerName": "Backup2", "Version": "10.8.0"}),
+        )
 
-    @pytest.mark.asyncio
-    async def test_empty_urls_raises_error(self) -> None:
-        """Test that JellyfinError is raised when no URLs configured."""
-        service = JellyfinService(
-            urls=[],
-            api_key="test-key",
+        service = jellyfin_service_factory(
+            [
+                "http://primary:8096",
+                "http://backup1:8096",
+                "http://backup2:8096",
+            ]
         )
+        url = await service.resolve_url()
+
+        assert url == "http://backup2:8096"
+        assert service.active_url == "http://backup2:8096"
+
+    async def test_all_urls_fail_raises_error(
+        self, mock_aioresponse: aioresponses, jellyfin_service_factory: Any
+    ) -> None:
+        """Test that JellyfinConnectionError is raised when all URLs fail."""
+        mock_aioresponse.get(
+            "http://primary:8096/System/Info",
+            exception=aiohttp.ClientError("Connection refused"),
+        )
+        mock_aioresponse.get(
+            "http://backup:8096/System/Info",
+            exception=aiohttp.ClientError("Connection refused"),
+        )
+
+        service = jellyfin_service_factory(
+            ["http://primary:8096", "http://backup:8096"]
+        )
+
+        with pytest.raises(JellyfinConnectionError) as exc_info:
+            await service.resolve_url()
+
+        assert "All Jellyfin URLs failed" in str(exc_info.value)
+
+    async def test_empty_urls_raises_error(self, jellyfin_service_factory: Any) -> None:
+        """Test that JellyfinError is raised when no URLs configured."""
+        service = jellyfin_service_factory([])
 
         with pytest.raises(JellyfinError) as exc_info:
             await service.resolve_url()
 
         assert "No Jellyfin URLs configured" in str(exc_info.value)
 
-    @pytest.mark.asyncio
-    async def test_resolve_caches_client(self) -> None:
+    async def test_resolve_caches_client(
+        self, mock_aioresponse: aioresponses, jellyfin_service_factory: Any
+    ) -> None:
         """Test that resolve_url caches the client for reuse."""
-        with aioresponses() as mocked:
-            mocked.get(
-                "http://localhost:8096/System/Info",
-                payload={"ServerName": "Test", "Version": "10.8.0"},
-            )
-
-            service = JellyfinService(
-                urls=["http://localhost:8096"],
-                api_key="test-key",
-            )
+        mock_aioresponse.get(
+            "http://localhost:8096/System/Info",
+            **_json_body({"ServerName": "Test", "Version": "10.8.0"}),
+        )
 
-            await service.resolve_url()
-            first_client = service._client
+        service = jellyfin_service_factory(["http://localhost:8096"])
 
-            # Manually call _ensure_client to verify caching
-            client = await service._ensure_client()
-            assert client is first_client
+        await service.resolve_url()
+        first_client = service._client
 
-            await service.close()
+        # Manually call _ensure_client to verify caching
+        client = await service._ensure_client()
+        assert client is first_client
 
-    @pytest.mark.asyncio
-    async def test_resolve_closes_old_client_on_switch(self) -> None:
-        """Test that old client is closed when switching URLs."""
-        with aioresponses() as mocked:
-            # First call - primary works
-            mocked.get(
-                "http://primary:8096/System/Info",
-                payload={"ServerName": "Primary", "Version": "10.8.0"},
-            )
+    async def test_resolve_switches_client_and_reuses_session(
+        self, jellyfin_service_factory: Any, mock_aioresponse: aioresponses
+    ) -> None:
+        """Test that the shared session is reused when switching URLs."""
+        # First call - primary works
+        mock_aioresponse.get(
+            "http://primary:8096/System/Info",
+            **_json_body({"ServerName": "Primary", "Version": "10.8.0"}),
+        )
 
-            service = JellyfinService(
-                urls=["http://primary:8096", "http://backup:8096"],
-                api_key="test-key",
-            )
+        service = jellyfin_service_factory(
+            ["http://primary:8096", "http://backup:8096"]
+        )
 
-            await service.resolve_url()
-            first_client = service._client
+        await service.resolve_url()
+        first_client = service._client
 
-            # Second call - primary fails, backup works
-            mocked.get(
-                "http://primary:8096/System/Info",
-                exception=aiohttp.ClientError("Connection refused"),
-            )
-            mocked.get(
-                "http://backup:8096/System/Info",
-                payload={"ServerName": "Backup", "Version": "10.8.0"},
-            )
+        # Second call - primary fails, backup works
+        mock_aioresponse.get(
+            "http://primary:8096/System/Info",
+            exception=aiohttp.ClientError("Connection refused"),
+        )
+        mock_aioresponse.get(
+            "http://backup:8096/System/Info",
+            **_json_body({"ServerName": "Backup", "Version": "10.8.0"}),
+        )
 
-            await service.resolve_url()
-            second_client = service._client
+        await service.resolve_url()
+        second_client = service._client
 
-            assert first_client is not second_client
-            assert first_client._session.closed
+        assert first_client is not second_client
+        # Both clients borrow the service-owned session, which stays
+        # open across the switch so the connection pool is reused
+        assert first_client._session is second_client._session
+        assert not second_client._session.closed
 
-            await service.close()
+        await service.close()
+        assert second_client._session.closed
 
 
 class TestJellyfinServiceCheckHealth:
     """Tests for JellyfinService.check_health() behavior."""
 
-    @pytest.mark.asyncio
-    async def test_check_health_returns_server_info(self) -> None:
+    async def test_check_health_returns_server_info(
+        self, mock_aioresponse: aioresponses, jellyfin_service_factory: Any
+    ) -> None:
         """Test that check_health returns ServerInfo."""
-        with aioresponses() as mocked:
-            # resolve_url call
-            mocked.get(
-                "http://localhost:8096/System/Info",
-                payload={"ServerName": "Test", "Version": "10.8.0", "Id": "server-123"},
-            )
-            # Actual health check call
-            mocked.get(
-                "http://localhost:8096/System/Info",
-                payload={"ServerName": "Test", "Version": "10.8.0", "Id": "server-123"},
-            )
-
-            service = JellyfinService(
-                urls=["http://localhost:8096"],
-                api_key="test-key",
-            )
-            info = await service.check_health()
+        # resolve_url call
+        mock_aioresponse.get(
+            "http://localhost:8096/System/Info",
+            **_json_body(
+                {"ServerName": "Test", "Version": "10.8.0", "Id": "server-123"}
+            ),
+        )
+        # Actual health check call
+        mock_aioresponse.get(
+            "http://localhost:8096/System/Info",
+            **_json_body(
+                {"ServerName": "Test", "Version": "10.8.0", "Id": "server-123"}
+            ),
+        )
 
-            assert info.server_name == "Test"
-            assert info.version == "10.8.0"
+        service = jellyfin_service_factory(["http://localhost:8096"])
+        info = await service.check_health()
 
-            await service.close()
+        assert info.server_name == "Test"
+        assert info.version == "10.8.0"
 
-    @pytest.mark.asyncio
-    async def test_check_health_always_starts_from_top(self) -> None:
+    async def test_check_health_always_starts_from_top(
+        self, mock_aioresponse: aioresponses, jellyfin_service_factory: Any
+    ) -> None:
         """Test that health check always re-checks from primary URL."""
-        with aioresponses() as mocked:
-            # First resolve - primary fails, backup works
-            mocked.get(
-                "http://primary:8096/System/Info",
-                exception=aiohttp.ClientError("Connection refused"),
-            )
-            mocked.get(
-                "http://backup:8096/System/Info",
-                payload={"ServerName": "Backup", "Version": "10.8.0"},
-            )
-            mocked.get(
-                "http://backup:8096/System/Info",
-                payload={"ServerName": "Backup", "Version": "10.8.0"},
-            )
+        # First resolve - primary fails, backup works
+        mock_aioresponse.get(
+            "http://primary:8096/System/Info",
+            exception=aiohttp.ClientError("Connection refused"),
+        )
+        mock_aioresponse.get(
+            "http://backup:8096/System/Info",
+            **_json_body({"ServerName": "Backup", "Version": "10.8.0"}),
+        )
+        mock_aioresponse.get(
+            "http://backup:8096/System/Info",
+            **_json_body({"ServerName": "Backup", "Version": "10.8.0"}),
+        )
 
-            service = JellyfinService(
-                urls=["http://primary:8096", "http://backup:8096"],
-                api_key="test-key",
-            )
+        service = jellyfin_service_factory(
+            ["http://primary:8096", "http://backup:8096"]
+        )
 
-            # First health check - ends up on backup
-            await service.check_health()
-            assert service.active_url == "http://backup:8096"
+        # First health check - ends up on backup
+        await service.check_health()
+        assert service.active_url == "http://backup:8096"
 
-            # Second resolve - primary recovered
-            mocked.get(
-                "http://primary:8096/System/Info",
-                payload={"ServerName": "Primary", "Version": "10.8.0"},
-            )
-            mocked.get(
-                "http://primary:8096/System/Info",
-                payload={"ServerName": "Primary", "Version": "10.8.0"},
-            )
+        # Age the fresh-result cache so the next call re-probes
+        ts, info = service._health_cache
+        service._health_cache = (ts - 5.0, info)
+
+        # Second resolve - primary recovered
+        mock_aioresponse.get(
+            "http://primary:8096/System/Info",
+            **_json_body({"ServerName": "Primary", "Version": "10.8.0"}),
+        )
+        mock_aioresponse.get(
+            "http://primary:8096/System/Info",
+            **_json_body({"ServerName": "Primary", "Version": "10.8.0"}),
+        )
 
-            # Second health check - should switch back to primary
-            await service.check_health()
-            assert service.active_url == "http://primary:8096"
+        # Second health check - should switch back to primary
+        await service.check_health()
+        assert service.active_url == "http://primary:8096"
+
+    async def test_check_health_served_from_fresh_cache(
+        self, jellyfin_service_factory: Any, mock_aioresponse: aioresponses
+    ) -> None:
+        """Test rapid repeat health checks are served from the TTL cache."""
+        # Only enough mocks for one resolve + info round trip
+        mock_aioresponse.get(
+            "http://localhost:8096/System/Info",
+            **_json_body({"ServerName": "Test", "Version": "10.8.0"}),
+        )
+        mock_aioresponse.get(
+            "http://localhost:8096/System/Info",
+            **_json_body({"ServerName": "Test", "Version": "10.8.0"}),
+        )
 
-            await service.close()
+        service = jellyfin_service_factory(["http://localhost:8096"])
+
+        first = await service.check_health()
+        # A second immediate call must not hit the network - no
+        # further mocks are registered, so a request would error
+        second = await service.check_health()
+
+        assert second == first
+
+    async def test_check_health_serves_stale_on_fresh_failure(
+        self, mock_aioresponse: aioresponses, jellyfin_service_factory: Any
+    ) -> None:
+        """Test last-good info is served (marked stale) right after a failure."""
+        # First check succeeds (the resolve probe doubles as the info
+        # fetch)
+        mock_aioresponse.get(
+            "http://localhost:8096/System/Info",
+            **_json_body({"ServerName": "Test", "Version": "10.8.0"}),
+        )
+        # Second check - server went away
+        mock_aioresponse.get(
+            "http://localhost:8096/System/Info",
+            exception=aiohttp.ClientConnectorError(
+                MagicMock(), OSError("Connection refused")
+            ),
+        )
+
+        service = jellyfin_service_factory(["http://localhost:8096"])
+
+        first = await service.check_health()
+        assert first.stale is False
+
+        # Age past the fresh TTL (but not the stale window) so the
+        # next call actually probes and sees the failure
+        ts, info = service._health_cache
+        service._health_cache = (ts - 5.0, info)
+
+        second = await service.check_health()
+        assert second.stale is True
+        assert second.server_name == "Test"
+
+
+class TestJellyfinServiceWarmup:
+    """Tests for JellyfinService.warmup() startup pre-warming."""
+
+    async def test_warmup_resolves_url(
+        self, mock_aioresponse: aioresponses, jellyfin_service_factory: Any
+    ) -> None:
+        """Test that warmup resolves and caches the active URL."""
+        mock_aioresponse.get(
+            "http://localhost:8096/System/Info",
+            **_json_body({"ServerName": "Test", "Version": "10.8.0"}),
+        )
+
+        service = jellyfin_service_factory(["http://localhost:8096"])
+        await service.warmup()
+
+        assert service.active_url == "http://localhost:8096"
+        assert service._client is not None
+
+    async def test_warmup_swallows_connection_errors(
+        self, jellyfin_service_factory: Any, mock_aioresponse: aioresponses
+    ) -> None:
+        """Test that warmup does not raise when the server is down."""
+        mock_aioresponse.get(
+            "http://localhost:8096/System/Info",
+            exception=aiohttp.ClientError("Connection refused"),
+        )
+
+        service = jellyfin_service_factory(["http://localhost:8096"])
+        await service.warmup()  # Must not raise
+
+        assert service.active_url is None
 
 
 class TestJellyfinServiceUrlBuilders:
@@ -1262,123 +1547,120 @@ class TestJellyfinServiceUrlBuilders:
         assert "Movie" in url
 
 
+class _FakeClient:
+    """
+    Hand-rolled stand-in for JellyfinClient in delegation tests.
+
+    Records each call as (method, args, kwargs) in ``calls`` and returns
+    a canned value - far cheaper than building a MagicMock/AsyncMock per
+    test, and the call log keeps assertions explicit.
+    """
+
+    _RETURNS: ClassVar[dict[str, Any]] = {
+        "get_recent_items": [],
+        "get_random_item": None,
+        "get_all_recent_items": {"Movie": []},
+        "get_random_items_by_type": {},
+    }
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, tuple, dict]] = []
+
+    def __getattr__(self, name: str) -> Callable:
+        async def method(*args: Any, **kwargs: Any) -> Any:
+            self.calls.append((name, args, kwargs))
+            return self._RETURNS[name]
+
+        return method
+
+
+@pytest.fixture
+def delegating_service() -> Any:
+    """JellyfinService wired to a _FakeClient, plus the fake itself."""
+    service = JellyfinService(
+        urls=["http://localhost:8096"],
+        api_key="test-key",
+    )
+    fake = _FakeClient()
+    service._client = fake
+    service._active_url = "http://localhost:8096"
+    return service, fake
+
+
 class TestJellyfinServiceDelegatedMethods:
     """Tests for JellyfinService delegated API methods."""
 
-    @pytest.mark.asyncio
-    async def test_get_recent_items_delegates_to_client(self) -> None:
+    async def test_get_recent_items_delegates_to_client(
+        self, delegating_service: Any
+    ) -> None:
         """Test that get_recent_items delegates to the underlying client."""
-        from unittest.mock import AsyncMock
-
-        service = JellyfinService(
-            urls=["http://localhost:8096"],
-            api_key="test-key",
-        )
-
-        # Set up a mock client
-        mock_client = MagicMock()
-        mock_client.get_recent_items = AsyncMock(return_value=[])
-        service._client = mock_client
-        service._active_url = "http://localhost:8096"
+        service, fake = delegating_service
 
         items = await service.get_recent_items("Movie", hours=24)
 
         assert items == []
-        mock_client.get_recent_items.assert_called_once_with(
-            "Movie", hours=24, limit=20
-        )
+        assert fake.calls == [
+            ("get_recent_items", ("Movie",), {"hours": 24, "limit": 20})
+        ]
 
-    @pytest.mark.asyncio
-    async def test_get_random_item_delegates_to_client(self) -> None:
+    async def test_get_random_item_delegates_to_client(
+        self, delegating_service: Any
+    ) -> None:
         """Test that get_random_item delegates to the underlying client."""
-        from unittest.mock import AsyncMock
-
-        service = JellyfinService(
-            urls=["http://localhost:8096"],
-            api_key="test-key",
-        )
-
-        # Set up a mock client
-        mock_client = MagicMock()
-        mock_client.get_random_item = AsyncMock(return_value=None)
-        service._client = mock_client
-        service._active_url = "http://localhost:8096"
+        service, fake = delegating_service
 
         item = await service.get_random_item("Movie")
 
         assert item is None
-        mock_client.get_random_item.assert_called_once_with("Movie")
+        assert fake.calls == [("get_random_item", ("Movie",), {})]
 
-    @pytest.mark.asyncio
-    async def test_get_all_recent_items_delegates_to_client(self) -> None:
+    async def test_get_all_recent_items_delegates_to_client(
+        self, delegating_service: Any
+    ) -> None:
         """Test that get_all_recent_items delegates to the underlying client."""
-        from unittest.mock import AsyncMock
-
-        service = JellyfinService(
-            urls=["http://localhost:8096"],
-            api_key="test-key",
-        )
-
-        # Set up a mock client
-        mock_client = MagicMock()
-        mock_client.get_all_recent_items = AsyncMock(return_value={"Movie": []})
-        service._client = mock_client
-        service._active_url = "http://localhost:8096"
+        service, fake = delegating_service
 
         result = await service.get_all_recent_items(["Movie"], hours=24)
 
         assert result == {"Movie": []}
-        mock_client.get_all_recent_items.assert_called_once_with(["Movie"], hours=24)
+        assert fake.calls == [("get_all_recent_items", (["Movie"],), {"hours": 24})]
 
-    @pytest.mark.asyncio
-    async def test_get_random_items_by_type_delegates_to_client(self) -> None:
+    async def test_get_random_items_by_type_delegates_to_client(
+        self, delegating_service: Any
+    ) -> None:
         """Test that get_random_items_by_type delegates to the underlying client."""
-        from unittest.mock import AsyncMock
-
-        service = JellyfinService(
-            urls=["http://localhost:8096"],
-            api_key="test-key",
-        )
-
-        # Set up a mock client
-        mock_client = MagicMock()
-        mock_client.get_random_items_by_type = AsyncMock(return_value={})
-        service._client = mock_client
-        service._active_url = "http://localhost:8096"
+        service, fake = delegating_service
 
         result = await service.get_random_items_by_type(["Movie", "Series"])
 
         assert result == {}
-        mock_client.get_random_items_by_type.assert_called_once_with(
-            ["Movie", "Series"]
-        )
+        assert fake.calls == [("get_random_items_by_type", (["Movie", "Series"],), {})]
 
 
 class TestJellyfinServiceLifecycle:
     """Tests for JellyfinService lifecycle management."""
 
     @pytest.mark.asyncio
-    async def test_close_clears_state(self) -> None:
+    async def test_close_clears_state(self, mock_aioresponse: aioresponses) -> None:
         """Test that close clears active URL and client."""
-        with aioresponses() as mocked:
-            mocked.get(
-                "http://localhost:8096/System/Info",
-                payload={"ServerName": "Test", "Version": "10.8.0"},
-            )
+        mock_aioresponse.get(
+            "http://localhost:8096/System/Info",
+            **_json_body({"ServerName": "Test", "Version": "10.8.0"}),
+        )
 
-            service = JellyfinService(
-                urls=["http://localhost:8096"],
-                api_key="test-key",
-            )
+        service = JellyfinService(
+            urls=["http://localhost:8096"],
+            api_key="test-key",
+        )
 
-            await service.resolve_url()
-            assert service._active_url is not None
-            assert service._client is not None
+        await service.resolve_url()
+        assert service._active_url is not None
+        assert service._client is not None
 
-            await service.close()
+        await service.close()
 
-            assert service._active_url is None
-            assert service._client is None
+        assert service._active_url is None
+        assert service._client is None
 
     @pytest.mark.asyncio
     async def test_close_without_client(self) -> None:
@@ -1392,21 +1674,20 @@ class TestJellyfinServiceLifecycle:
         await service.close()
 
     @pytest.mark.asyncio
-    async def test_context_manager(self) -> None:
+    async def test_context_manager(self, mock_aioresponse: aioresponses) -> None:
         """Test async context manager support."""
-        with aioresponses() as mocked:
-            mocked.get(
-                "http://localhost:8096/System/Info",
-                payload={"ServerName": "Test", "Version": "10.8.0"},
-            )
+        mock_aioresponse.get(
+            "http://localhost:8096/System/Info",
+            **_json_body({"ServerName": "Test", "Version": "10.8.0"}),
+        )
 
-            async with JellyfinService(
-                urls=["http://localhost:8096"],
-                api_key="test-key",
-            ) as service:
-                await service.resolve_url()
-                assert service._client is not None
+        async with JellyfinService(
+            urls=["http://localhost:8096"],
+            api_key="test-key",
+        ) as service:
+            await service.resolve_url()
+            assert service._client is not None
 
-            # After context exit, should be closed
-            assert service._client is None
-            assert service._active_url is None
+        # After context exit, should be closed
+        assert service._client is None
+        assert service._active_url is None
@@ -9,12 +9,29 @@ Tests cover:
 
 import argparse
 import logging
+import sys
 from pathlib import Path
-from unittest.mock import patch
+from typing import ClassVar
+
+import pytest
 
 from bot.main import TestModes, build_test_modes, parse_args, setup_logging
 
 
+# Expected TestModes values shared across the dataclass and
+# build_test_modes tests; compared with dataclass __eq__ instead of
+# per-attribute asserts.
+_ALL_TRUE = TestModes(
+    jf_health=True,
+    jf_announcement=True,
+    jf_suggestion=True,
+    mc_health=True,
+    mc_announce=True,
+)
+_JELLYFIN_ONLY = TestModes(jf_health=True, jf_announcement=True, jf_suggestion=True)
+_MINECRAFT_ONLY = TestModes(mc_health=True, mc_announce=True)
+
+
 # =============================================================================
 # TestModes Tests
 # =============================================================================
@@ -44,11 +61,7 @@ class TestTestModes:
     def test_all_enabled_classmethod(self) -> None:
         """Test all_enabled classmethod sets all modes to True."""
         modes = TestModes.all_enabled()
-        assert modes.jf_health is True
-        assert modes.jf_announcement is True
-        assert modes.jf_suggestion is True
-        assert modes.mc_health is True
-        assert modes.mc_announce is True
+        assert modes == _ALL_TRUE
         assert modes.any_enabled is True
 
 
@@ -60,57 +73,45 @@ class TestTestModes:
 class TestParseArgs:
     """Tests for parse_args function."""
 
-    def test_default_config_path(self) -> None:
-        """Test that default config path is config.json."""
-        with patch("sys.argv", ["bot.main"]):
-            args = parse_args()
-            assert args.config == Path("config.json")
-
-    def test_custom_config_path(self) -> None:
-        """Test that custom config path is parsed."""
-        with patch("sys.argv", ["bot.main", "--config", "custom.json"]):
-            args = parse_args()
-            assert args.config == Path("custom.json")
-
-    def test_verbose_flag(self) -> None:
-        """Test that verbose flag is parsed."""
-        with patch("sys.argv", ["bot.main", "--verbose"]):
-            args = parse_args()
-            assert args.verbose is True
-
-    def test_test_flag(self) -> None:
-        """Test that test flag is parsed."""
-        with patch("sys.argv", ["bot.main", "--test"]):
-            args = parse_args()
-            assert args.test is True
-
-    def test_test_jellyfin_flag(self) -> None:
-        """Test that test-jellyfin flag is parsed."""
-        with patch("sys.argv", ["bot.main", "--test-jellyfin"]):
-            args = parse_args()
-            assert args.test_jellyfin is True
-
-    def test_test_minecraft_flag(self) -> None:
-        """Test that test-minecraft flag is parsed."""
-        with patch("sys.argv", ["bot.main", "--test-minecraft"]):
-            args = parse_args()
-            assert args.test_minecraft is True
-
-    def test_specific_test_flags(self) -> None:
+    @pytest.mark.parametrize(
+        "argv, attr, expected",
+        [
+            (["bot.main"], "config", Path("config.json")),
+            (["bot.main", "--config", "custom.json"], "config", Path("custom.json")),
+            (["bot.main", "--verbose"], "verbose", True),
+            (["bot.main", "--test"], "test", True),
+            (["bot.main", "--test-jellyfin"], "test_jellyfin", True),
+            (["bot.main", "--test-minecraft"], "test_minecraft", True),
+        ],
+    )
+    def test_flag(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        argv: list[str],
+        attr: str,
+        expected: object,
+    ) -> None:
+        """Test that each flag parses into the expected attribute value."""
+        monkeypatch.setattr(sys, "argv", argv)
+        args = parse_args()
+        assert getattr(args, attr) == expected
+
+    def test_specific_test_flags(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test that specific test flags are parsed."""
-        with patch(
-            "sys.argv",
+        monkeypatch.setattr(
+            sys,
+            "argv",
             [
                 "bot.main",
                 "--test-jf-health",
                 "--test-jf-announcement",
                 "--test-mc-health",
             ],
-        ):
-            args = parse_args()
-            assert args.test_jf_health is True
-            assert args.test_jf_announcement is True
-            assert args.test_mc_health is True
+        )
+        args = parse_args()
+        assert args.test_jf_health is True
+        assert args.test_jf_announcement is True
+        assert args.test_mc_health is True
 
 
 # =============================================================================
@@ -121,81 +122,39 @@ class TestParseArgs:
 class TestBuildTestModes:
     """Tests for build_test_modes function."""
 
-    def test_all_enabled_with_test_flag(self) -> None:
-        """Test that --test enables all modes."""
-        args = argparse.Namespace(
-            test=True,
-            test_jellyfin=False,
-            test_jf_health=False,
-            test_jf_announcement=False,
-            test_jf_suggestion=False,
-            test_minecraft=False,
-            test_mc_health=False,
-            test_mc_announce=False,
-        )
-        modes = build_test_modes(args)
-        assert modes.jf_health is True
-        assert modes.jf_announcement is True
-        assert modes.jf_suggestion is True
-        assert modes.mc_health is True
-        assert modes.mc_announce is True
-
-    def test_jellyfin_all_enabled(self) -> None:
-        """Test that --test-jellyfin enables all Jellyfin modes."""
-        args = argparse.Namespace(
-            test=False,
-            test_jellyfin=True,
-            test_jf_health=False,
-            test_jf_announcement=False,
-            test_jf_suggestion=False,
-            test_minecraft=False,
-            test_mc_health=False,
-            test_mc_announce=False,
-        )
-        modes = build_test_modes(args)
-        assert modes.jf_health is True
-        assert modes.jf_announcement is True
-        assert modes.jf_suggestion is True
-        assert modes.mc_health is False
-        assert modes.mc_announce is False
-
-    def test_minecraft_all_enabled(self) -> None:
-        """Test that --test-minecraft enables all Minecraft modes."""
-        args = argparse.Namespace(
-            test=False,
-            test_jellyfin=False,
-            test_jf_health=False,
-            test_jf_announcement=False,
-            test_jf_suggestion=False,
-            test_minecraft=True,
-            test_mc_health=False,
-            test_mc_announce=False,
-        )
-        modes = build_test_modes(args)
-        assert modes.jf_health is False
-        assert modes.jf_announcement is False
-        assert modes.jf_suggestion is False
-        assert modes.mc_health is True
-        assert modes.mc_announce is True
-
-    def test_specific_flags(self) -> None:
-        """Test that specific flags work independently."""
-        args = argparse.Namespace(
-            test=False,
-            test_jellyfin=False,
-            test_jf_health=True,
-            test_jf_announcement=False,
-            test_jf_suggestion=False,
-            test_minecraft=False,
-            test_mc_health=True,
-            test_mc_announce=False,
-        )
-        modes = build_test_modes(args)
-        assert modes.jf_health is True
-        assert modes.jf_announcement is False
-        assert modes.jf_suggestion is False
-        assert modes.mc_health is True
-        assert modes.mc_announce is False
+    _DEFAULT_ARGS: ClassVar[dict[str, bool]] = {
+        "test": False,
+        "test_jellyfin": False,
+        "test_jf_health": False,
+        "test_jf_announcement": False,
+        "test_jf_suggestion": False,
+        "test_minecraft": False,
+        "test_mc_health": False,
+        "test_mc_announce": False,
+    }
+
+    @pytest.mark.parametrize(
+        "overrides, expected",
+        [
+            # --test enables all modes
+            ({"test": True}, _ALL_TRUE),
+            # --test-jellyfin enables all Jellyfin modes
+            ({"test_jellyfin": True}, _JELLYFIN_ONLY),
+            # --test-minecraft enables all Minecraft modes
+            ({"test_minecraft": True}, _MINECRAFT_ONLY),
+            # specific flags work independently
+            (
+                {"test_jf_health": True, "test_mc_health": True},
+                TestModes(jf_health=True, mc_health=True),
+            ),
+        ],
+    )
+    def test_build_test_modes(
+        self, overrides: dict[str, bool], expected: TestModes
+    ) -> None:
+        """Test that each flag combination yields the expected modes."""
+        args = argparse.Namespace(**{**self._DEFAULT_ARGS, **overrides})
+        assert build_test_modes(args) == expected
 
 
 # =============================================================================
@@ -206,6 +165,37 @@ class TestBuildTestModes:
 class TestSetupLogging:
     """Tests for setup_logging function."""
 
+    _LOGGER_NAMES = (
+        "",
+        "monolithbot",
+        "discord",
+        "discord.http",
+        "aiohttp",
+        "apscheduler",
+    )
+
+    @pytest.fixture(autouse=True)
+    def _restore_logger_state(self):
+        """
+        Snapshot and restore logger levels/handlers around each test.
+
+        setup_logging mutates the root logger and third-party levels;
+        without a restore those changes leak into the rest of the suite
+        and repeated runs could stack root handlers.
+        """
+        snapshot = {
+            name: (
+                logging.getLogger(name).level,
+                list(logging.getLogger(name).handlers),
+            )
+            for name in self._LOGGER_NAMES
+        }
+        yield
+        for name, (level, handlers) in snapshot.items():
+            logger = logging.getLogger(name)
+            logger.setLevel(level)
+            logger.handlers[:] = handlers
+
     def test_third_party_loggers_reduced(self) -> None:
         """Test that third-party loggers have reduced verbosity."""
         setup_logging(verbose=False)
@@ -16,7 +16,6 @@ from bot.services.minecraft import (
     MinecraftConnectionError,
     MinecraftServerState,
     MinecraftServerStatus,
-    MinecraftService,
 )
 
 
@@ -25,38 +24,76 @@ from bot.services.minecraft import (
 # =============================================================================
 
 
-@pytest.fixture
-def mock_bot(minecraft_config):
-    """Create a mock MonolithBot instance with Minecraft service."""
+class _StubMinecraftService:
+    """
+    Hand-rolled stand-in for MinecraftService.
+
+    Exposes only the methods the cogs call, as plain mocks, so fixture
+    setup skips the class introspection MagicMock(spec=...) performs on
+    every instantiation.
+    """
+
+    def __init__(self):
+        self.get_server_state = MagicMock()
+        self.get_all_servers = MagicMock()
+        self.get_server_names = MagicMock()
+        self.get_status = AsyncMock()
+        self.detect_player_joins = MagicMock()
+        self.mark_online = MagicMock()
+        self.mark_offline = MagicMock()
+
+
+@pytest.fixture(scope="module")
+def _shared_bot():
+    """Build the bot mock skeleton once; mock_bot reseeds it per test."""
     bot = MagicMock()
+    bot.minecraft_service = _StubMinecraftService()
+    return bot
+
+
+@pytest.fixture
+def mock_bot(_shared_bot, minecraft_config):
+    """Provide the shared bot mock, reset and reseeded between tests."""
+    bot = _shared_bot
+    bot.reset_mock(return_value=True, side_effect=True)
+    service = bot.minecraft_service
+    for method in vars(service).values():
+        method.reset_mock(return_value=True, side_effect=True)
+
     bot.config.minecraft = minecraft_config
     bot.config.jellyfin.schedule.timezone = "America/Los_Angeles"
-    bot.minecraft_service = MagicMock(spec=MinecraftService)
 
-    # Set up server state mocks
+    # Tests mutate the server state directly, so it is rebuilt per test
     server_state = MinecraftServerState(
         name="Survival",
         urls=["mc.example.com:25565", "backup.example.com:25565"],
         online=None,
     )
-    bot.minecraft_service.get_server_state.return_value = server_state
-    bot.minecraft_service.get_server_names.return_value = ["Survival"]
-    bot.minecraft_service.get_all_servers.return_value = [server_state]
+    service.get_server_state.return_value = server_state
+    service.get_server_names.return_value = ["Survival"]
+    service.get_all_servers.return_value = [server_state]
 
     return bot
 
 
-@pytest.fixture
-def mock_channel():
-    """Create a mock Discord channel."""
+@pytest.fixture(scope="module")
+def _shared_channel():
+    """Build the mock Discord channel once; AsyncMock setup is heavy."""
     channel = MagicMock()
     channel.send = AsyncMock()
     return channel
 
 
 @pytest.fixture
+def mock_channel(_shared_channel):
+    """Provide the shared mock channel, reset between tests."""
+    _shared_channel.reset_mock()
+    return _shared_channel
+
+
+@pytest.fixture(scope="module")
 def sample_status():
-    """Create a sample MinecraftServerStatus."""
+    """Create a sample MinecraftServerStatus (shared; tests only read it)."""
     return MinecraftServerStatus(
         online=True,
         player_count=3,
@@ -68,6 +105,21 @@ def sample_status():
     )
 
 
+@pytest.fixture(autouse=True, scope="module")
+def mock_create_scheduler():
+    """
+    Patch create_scheduler in both cog modules once for this file.
+
+    Every cog construction would otherwise open its own patch context;
+    one module-scoped patcher removes that per-test start/stop cost.
+    """
+    with (
+        patch("bot.cogs.minecraft.health.create_scheduler") as health_create,
+        patch("bot.cogs.minecraft.players.create_scheduler"),
+    ):
+        yield health_create
+
+
 # =============================================================================
 # MinecraftHealthCog Tests
 # =============================================================================
@@ -78,16 +130,13 @@ class TestMinecraftHealthCogInit:
 
     def test_cog_creates_scheduler(self, mock_bot):
         """Test that cog creates a scheduler on init."""
-        with patch("bot.cogs.minecraft.health.create_scheduler") as mock_create:
-            mock_create.return_value = MagicMock()
-            cog = MinecraftHealthCog(mock_bot)
-            assert cog.scheduler is not None
+        cog = MinecraftHealthCog(mock_bot)
+        assert cog.scheduler is not None
 
     def test_cog_stores_bot_reference(self, mock_bot):
         """Test that cog stores bot reference."""
-        with patch("bot.cogs.minecraft.health.create_scheduler"):
-            cog = MinecraftHealthCog(mock_bot)
-            assert cog.bot is mock_bot
+        cog = MinecraftHealthCog(mock_bot)
+        assert cog.bot is mock_bot
 
 
 class TestMinecraftHealthCogFormatDuration:
@@ -96,32 +145,28 @@ class TestMinecraftHealthCogFormatDuration:
     @pytest.fixture
     def cog(self, mock_bot):
         """Create cog for testing."""
-        with patch("bot.cogs.minecraft.health.create_scheduler"):
-            return MinecraftHealthCog(mock_bot)
-
-    def test_format_seconds(self, cog):
-        """Test formatting of seconds."""
-        assert cog._format_duration(1) == "1 second"
-        assert cog._format_duration(30) == "30 seconds"
-
-    def test_format_minutes(self, cog):
-        """Test formatting of minutes."""
-        assert cog._format_duration(60) == "1 minute"
-        assert cog._format_duration(90) == "1 minute"
-        assert cog._format_duration(120) == "2 minutes"
-        assert cog._format_duration(3599) == "59 minutes"
-
-    def test_format_hours(self, cog):
-        """Test formatting of hours."""
-        assert cog._format_duration(3600) == "1 hour"
-        assert cog._format_duration(3660) == "1h 1m"
-        assert cog._format_duration(7200) == "2 hours"
-
-    def test_format_days(self, cog):
-        """Test formatting of days."""
-        assert cog._format_duration(86400) == "1 day"
-        assert cog._format_duration(90000) == "1d 1h"
-        assert cog._format_duration(172800) == "2 days"
+        return MinecraftHealthCog(mock_bot)
+
+    @pytest.mark.parametrize(
+        "seconds, expected",
+        [
+            (1, "1 second"),
+            (30, "30 seconds"),
+            (60, "1 minute"),
+            (90, "1 minute"),
+            (120, "2 minutes"),
+            (3599, "59 minutes"),
+            (3600, "1 hour"),
+            (3660, "1h 1m"),
+            (7200, "2 hours"),
+            (86400, "1 day"),
+            (90000, "1d 1h"),
+            (172800, "2 days"),
+        ],
+    )
+    def test_format_duration(self, cog, seconds, expected):
+        """Test formatting across second/minute/hour/day ranges."""
+        assert cog._format_duration(seconds) == expected
 
 
 class TestMinecraftHealthCogNotifications:
@@ -131,8 +176,7 @@ class TestMinecraftHealthCogNotifications:
     def cog(self, mock_bot, mock_channel):
         """Create cog with mocked channel."""
         mock_bot.get_channel.return_value = mock_channel
-        with patch("bot.cogs.minecraft.health.create_scheduler"):
-            return MinecraftHealthCog(mock_bot)
+        return MinecraftHealthCog(mock_bot)
 
     @pytest.mark.asyncio
     async def test_send_online_notification(self, cog, mock_channel, sample_status):
@@ -188,8 +232,7 @@ class TestMinecraftHealthCogStateHandling:
     def cog(self, mock_bot, mock_channel):
         """Create cog for testing."""
         mock_bot.get_channel.return_value = mock_channel
-        with patch("bot.cogs.minecraft.health.create_scheduler"):
-            return MinecraftHealthCog(mock_bot)
+        return MinecraftHealthCog(mock_bot)
 
     @pytest.mark.asyncio
     async def test_handle_server_online_from_unknown(
@@ -257,16 +300,13 @@ class TestMinecraftPlayersCogInit:
 
     def test_cog_creates_scheduler(self, mock_bot):
         """Test that cog creates a scheduler on init."""
-        with patch("bot.cogs.minecraft.players.create_scheduler") as mock_create:
-            mock_create.return_value = MagicMock()
-            cog = MinecraftPlayersCog(mock_bot)
-            assert cog.scheduler is not None
+        cog = MinecraftPlayersCog(mock_bot)
+        assert cog.scheduler is not None
 
     def test_cog_not_initialized_at_start(self, mock_bot):
         """Test that cog starts as not initialized."""
-        with patch("bot.cogs.minecraft.players.create_scheduler"):
-            cog = MinecraftPlayersCog(mock_bot)
-            assert cog._initialized is False
+        cog = MinecraftPlayersCog(mock_bot)
+        assert cog._initialized is False
 
 
 class TestMinecraftPlayersCogNotifications:
@@ -276,10 +316,9 @@ class TestMinecraftPlayersCogNotifications:
     def cog(self, mock_bot, mock_channel):
         """Create cog with mocked channel."""
         mock_bot.get_channel.return_value = mock_channel
-        with patch("bot.cogs.minecraft.players.create_scheduler"):
-            cog = MinecraftPlayersCog(mock_bot)
-            cog._initialized = True
-            return cog
+        cog = MinecraftPlayersCog(mock_bot)
+        cog._initialized = True
+        return cog
 
     @pytest.mark.asyncio
     async def test_send_single_player_join(self, cog, mock_channel, sample_status):
@@ -334,10 +373,9 @@ class TestMinecraftPlayersCogPlayerTracking:
     def cog(self, mock_bot, mock_channel):
         """Create cog for testing."""
         mock_bot.get_channel.return_value = mock_channel
-        with patch("bot.cogs.minecraft.players.create_scheduler"):
-            cog = MinecraftPlayersCog(mock_bot)
-            cog._initialized = True
-            return cog
+        cog = MinecraftPlayersCog(mock_bot)
+        cog._initialized = True
+        return cog
 
     @pytest.mark.asyncio
     async def test_process_player_changes_with_new_players(
@@ -426,8 +464,7 @@ class TestMinecraftCogSetup:
         from bot.cogs.minecraft.health import setup
 
         mock_bot.add_cog = AsyncMock()
-        with patch("bot.cogs.minecraft.health.create_scheduler"):
-            await setup(mock_bot)
+        await setup(mock_bot)
         mock_bot.add_cog.assert_called_once()
 
     @pytest.mark.asyncio
@@ -436,6 +473,5 @@ class TestMinecraftCogSetup:
         from bot.cogs.minecraft.players import setup
 
         mock_bot.add_cog = AsyncMock()
-        with patch("bot.cogs.minecraft.players.create_scheduler"):
-            await setup(mock_bot)
+        await setup(mock_bot)
         mock_bot.add_cog.assert_called_once()
@@ -26,6 +26,13 @@ from bot.services.minecraft import (
 from bot.config import MinecraftServerConfig
 
 
+# Exception singletons reused as side_effects; mocks re-raise the same
+# instance on every call, so per-test construction buys nothing.
+_TIMEOUT_EXC = TimeoutError()
+_CONN_EXC = OSError("Connection refused")
+_MC_CONN_EXC = MinecraftConnectionError("Connection refused")
+
+
 # =============================================================================
 # MinecraftServerStatus Tests
 # =============================================================================
@@ -170,32 +177,47 @@ class TestMinecraftClientInit:
 class TestMinecraftClientCleanMotd:
     """Tests for MinecraftClient._clean_motd static method."""
 
-    def test_clean_simple_motd(self) -> None:
-        """Test cleaning a simple MOTD."""
-        result = MinecraftClient._clean_motd("Welcome to the server!")
-        assert result == "Welcome to the server!"
+    @pytest.mark.parametrize(
+        "raw, expected",
+        [
+            ("Welcome to the server!", "Welcome to the server!"),  # plain
+            ("§aWelcome §bto §cthe §dserver!", "Welcome to the server!"),  # colors
+            (
+                "§l§nBold and Underline§r Normal",
+                "Bold and Underline Normal",
+            ),  # formatting
+            ("  Server MOTD  ", "Server MOTD"),  # whitespace
+        ],
+    )
+    def test_clean_motd(self, raw: str, expected: str) -> None:
+        """Test stripping of color/formatting codes and whitespace."""
+        assert MinecraftClient._clean_motd(raw) == expected
 
-    def test_clean_motd_with_color_codes(self) -> None:
-        """Test removing Minecraft color codes."""
-        result = MinecraftClient._clean_motd("§aWelcome §bto §cthe §dserver!")
-        assert result == "Welcome to the server!"
 
-    def test_clean_motd_with_formatting_codes(self) -> None:
-        """Test removing formatting codes."""
-        result = MinecraftClient._clean_motd("§l§nBold and Underline§r Normal")
-        assert result == "Bold and Underline Normal"
+class TestMinecraftClientCheckStatus:
+    """Tests for MinecraftClient.check_status method."""
 
-    def test_clean_motd_with_whitespace(self) -> None:
-        """Test stripping whitespace."""
-        result = MinecraftClient._clean_motd("  Server MOTD  ")
-        assert result == "Server MOTD"
+    @pytest.fixture
+    def java_server(self):
+        """
+        Patch JavaServer and yield a setter for the status result.
 
+        The setter wires async_status to return a response or raise an
+        exception, replacing the five-line mock setup each test repeated.
+        """
+        with patch("bot.services.minecraft.JavaServer") as mock_java_server:
+            mock_server = MagicMock()
+            mock_java_server.lookup.return_value = mock_server
 
-class TestMinecraftClientCheckStatus:
-    """Tests for MinecraftClient.check_status method."""
+            def set_status(response=None, exc=None):
+                mock_server.async_status = AsyncMock(
+                    return_value=response, side_effect=exc
+                )
+
+            yield set_status
 
     @pytest.mark.asyncio
-    async def test_check_status_success(self) -> None:
+    async def test_check_status_success(self, java_server) -> None:
         """Test successful status check."""
         mock_response = MagicMock()
         mock_response.players.online = 5
@@ -207,55 +229,43 @@ class TestMinecraftClientCheckStatus:
         mock_response.motd = "Welcome!"
         mock_response.version.name = "1.20.4"
         mock_response.latency = 45.5
+        java_server(response=mock_response)
 
-        with patch("bot.services.minecraft.JavaServer") as mock_java_server:
-            mock_server = MagicMock()
-            mock_server.async_status = AsyncMock(return_value=mock_response)
-            mock_java_server.lookup.return_value = mock_server
-
-            client = MinecraftClient("localhost:25565")
-            status = await client.check_status()
+        client = MinecraftClient("localhost:25565")
+        status = await client.check_status()
 
-            assert status.online is True
-            assert status.player_count == 5
-            assert status.max_players == 20
-            assert status.version == "1.20.4"
-            assert status.latency_ms == 45.5
+        assert status.online is True
+        assert status.player_count == 5
+        assert status.max_players == 20
+        assert status.version == "1.20.4"
+        assert status.latency_ms == 45.5
 
     @pytest.mark.asyncio
-    async def test_check_status_connection_error(self) -> None:
+    async def test_check_status_connection_error(self, java_server) -> None:
         """Test handling connection errors."""
-        with patch("bot.services.minecraft.JavaServer") as mock_java_server:
-            mock_server = MagicMock()
-            mock_server.async_status = AsyncMock(
-                side_effect=OSError("Connection refused")
-            )
-            mock_java_server.lookup.return_value = mock_server
+        java_server(exc=_CONN_EXC)
 
-            client = MinecraftClient("localhost:25565")
+        client = MinecraftClient("localhost:25565")
 
-            with pytest.raises(MinecraftConnectionError) as exc_info:
-                await client.check_status()
+        with pytest.raises(MinecraftConnectionError) as exc_info:
+            await client.check_status()
 
-            assert "Cannot connect" in str(exc_info.value)
+        assert "Cannot connect" in str(exc_info.value)
 
     @pytest.mark.asyncio
-    async def test_check_status_timeout(self) -> None:
+    async def test_check_status_timeout(self, java_server) -> None:
         """Test handling timeout errors."""
-        with patch("bot.services.minecraft.JavaServer") as mock_java_server:
-            mock_server = MagicMock()
-            mock_server.async_status = AsyncMock(side_effect=TimeoutError())
-            mock_java_server.lookup.return_value = mock_server
+        java_server(exc=_TIMEOUT_EXC)
 
-            client = MinecraftClient("localhost:25565")
+        client = MinecraftClient("localhost:25565")
 
-            with pytest.raises(MinecraftTimeoutError) as exc_info:
-                await client.check_status()
+        with pytest.raises(MinecraftTimeoutError) as exc_info:
+            await client.check_status()
 
-            assert "timed out" in str(exc_info.value)
+        assert "timed out" in str(exc_info.value)
 
     @pytest.mark.asyncio
-    async def test_check_status_hidden_players(self) -> None:
+    async def test_check_status_hidden_players(self, java_server) -> None:
         """Test handling servers with hidden player lists."""
         mock_response = MagicMock()
         mock_response.players.online = 10
@@ -264,19 +274,15 @@ class TestMinecraftClientCheckStatus:
         mock_response.motd = "Server"
         mock_response.version.name = "1.20.4"
         mock_response.latency = 30.0
+        java_server(response=mock_response)
 
-        with patch("bot.services.minecraft.JavaServer") as mock_java_server:
-            mock_server = MagicMock()
-            mock_server.async_status = AsyncMock(return_value=mock_response)
-            mock_java_server.lookup.return_value = mock_server
-
-            client = MinecraftClient("localhost:25565")
-            status = await client.check_status()
+        client = MinecraftClient("localhost:25565")
+        status = await client.check_status()
 
-            assert status.online is True
-            assert status.player_count == 10
-            assert status.players_hidden is True
-            assert len(status.player_names) == 0
+        assert status.online is True
+        assert status.player_count == 10
+        assert status.players_hidden is True
+        assert len(status.player_names) == 0
 
 
 # =============================================================================
@@ -436,7 +442,7 @@ class TestMinecraftServiceCheckHealth:
             MinecraftClient,
             "check_status",
             new_callable=AsyncMock,
-            side_effect=MinecraftConnectionError("Connection refused"),
+            side_effect=_MC_CONN_EXC,
         ):
             with pytest.raises(MinecraftConnectionError) as exc_info:
                 await service_with_failover.check_health("Survival")
@@ -8,6 +8,7 @@ Tests cover:
 """
 
 import pytest
+from dataclasses import replace
 from datetime import datetime, timezone
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -15,6 +16,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import discord
 
 from bot.services.jellyfin import JellyfinError, JellyfinItem
+from tests.conftest import _fields_by_name
 
 
 # =============================================================================
@@ -76,7 +78,7 @@ class TestCreateSuggestionEmbed:
         assert embed.url == "http://jellyfin/item/movie123"
         assert embed.thumbnail.url == "http://jellyfin/image/movie123"
         # Check that title field exists
-        title_field = next((f for f in embed.fields if f.name == "Title"), None)
+        title_field = _fields_by_name(embed).get("Title")
         assert title_field is not None
         assert title_field.value == "The Matrix (1999)"
 
@@ -99,7 +101,7 @@ class TestCreateSuggestionEmbed:
         assert embed.title == "📺 TV Show Suggestion"
         assert embed.color == discord.Color.green()
         # Check that title field exists
-        title_field = next((f for f in embed.fields if f.name == "Title"), None)
+        title_field = _fields_by_name(embed).get("Title")
         assert title_field is not None
         assert title_field.value == "Breaking Bad (2008)"
 
@@ -126,14 +128,15 @@ class TestCreateSuggestionEmbed:
         self, cog: Any, movie_item: JellyfinItem
     ) -> None:
         """Test that long descriptions are truncated."""
-        # Create item with very long overview
+        # Create item with very long overview (items are frozen, so
+        # build a copy instead of mutating the fixture)
         long_overview = "A" * 500
-        movie_item.overview = long_overview
+        movie_item = replace(movie_item, overview=long_overview)
 
         embed = cog._create_suggestion_embed("Movie", movie_item)
 
         # Overview field should be truncated to MAX_DESCRIPTION_LENGTH
-        overview_field = next((f for f in embed.fields if f.name == "Overview"), None)
+        overview_field = _fields_by_name(embed).get("Overview")
         assert overview_field is not None
         assert len(overview_field.value) <= 303  # 300 + "..."
 
@@ -269,7 +272,7 @@ class TestAddItemFields:
 
         cog._add_item_fields(embed, audio_item)
 
-        artist_field = next((f for f in embed.fields if f.name == "Artist"), None)
+        artist_field = _fields_by_name(embed).get("Artist")
         assert artist_field is not None
         assert artist_field.value == "Artist1, Artist2"
 
@@ -286,7 +289,7 @@ class TestAddItemFields:
 
         cog._add_item_fields(embed, movie_item)
 
-        year_field = next((f for f in embed.fields if f.name == "Year"), None)
+        year_field = _fields_by_name(embed).get("Year")
         assert year_field is not None
         assert year_field.value == "2020"
 